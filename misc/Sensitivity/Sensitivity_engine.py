@@ -9,11 +9,8 @@ import matplotlib.pyplot as plt
 from matplotlib import *
 from math import *
 import numpy as np
-from nrlmsise_00_header import *
-from nrlmsise_00_data import *
-from nrlmsise_00_start import *
-from nlrmsise_00_dens import *
-from nlrmsise_00_dens_max import *
+from misc.Sensitivity.nlrmsise_00_dens import *
+from misc.Sensitivity.nlrmsise_00_dens_max import *
 
 set_parameter = 1 + 3 # 1=collection_eff, 2=isp, 3=CD
 
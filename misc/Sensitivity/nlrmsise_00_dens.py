@@ -9,10 +9,7 @@ import matplotlib.pyplot as plt
 from matplotlib import *
 from math import *
 import numpy as np
-from nrlmsise_00_header import *
-from nrlmsise_00_data import *
-from nrlmsise_00_start import *
-from nlrmsise_00_dens import *
+from src.atmos.nrlmsise00.model.nrlmsise_00 import *
 
 def nlrmsise00_dens(alt):
 
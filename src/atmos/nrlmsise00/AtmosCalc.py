@@ -1,12 +1,91 @@
 '''Importing Atmospheric Model from Folder'''
-from src.atmos.nrlmsise00.model.nrlmsise_00 import nrlmsise_flags,nrlmsise_input,nrlmsise_output,ap_array,gtd7
+from src.atmos.nrlmsise00.model.nrlmsise_00 import nrlmsise_output
+from src.atmos.nrlmsise00.AtmosCalcFloat import nrl00_float,nrl00_batch_float,nrl00_profile_float
 from src.atmos.nrlmsise00.IndexFindr.IndexReturn import Indexer
 
 '''Importing Required Modules'''
 import time
 import datetime as dt
+from collections import OrderedDict
+import numpy as np
 from astropy import units as u
 
+'''Class Nrl00Cache'''
+'''Bounded LRU Memory of nrl00 Results, keyed on Quantized Inputs'''
+'''
+* INPUT 1: Maximum Number of stored Results, the least recently used Result is evicted beyond it
+* INPUT 2: Altitude Quantization Step, use *u.km or *u.meter
+* INPUT 3: Latitude & Longitude Quantization Step, use *u.deg or *u.rad
+* INPUT 4: Time Quantization Step, use *u.s
+* INPUT 5: Solar Flux & AP Indices Quantization Step
+A Step of 0 means the Input is matched exactly. With a Step > 0 the Input is rounded to the nearest multiple of the
+Step and the Model is evaluated at that rounded value, so every Input in a Cell gets the same Result.
+
+* To use it pass the Cache to nrl00, e.g. nrl00(date,h,lat,lon,indices,cache=Nrl00Cache(h_step=100*u.meter))
+* or pass cache=True to use the shared module Cache nrl00_cache
+* The Cache stores single Points only, nrl00 raises a ValueError for Array Quantities with a Cache
+* Counters: return_stats gives the hits, misses and evictions since creation or the last clear
+'''
+
+class Nrl00Cache(object):
+    def __init__(self, maxsize: int = 4096, h_step: float = 0*u.km, angle_step: float = 0*u.deg,
+                 time_step: float = 0*u.s, index_step: float = 0):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        self.__maxsize = maxsize
+        self.__h_step = h_step.to(u.km).value
+        self.__angle_step = angle_step.to(u.deg).value
+        self.__time_step = time_step.to(u.s).value
+        self.__index_step = index_step
+        self.__data = OrderedDict()
+        self.clear()
+
+    def return_stats(self):
+        return {'hits': self.__hits, 'misses': self.__misses, 'evictions': self.__evictions,
+                'size': len(self.__data), 'maxsize': self.__maxsize}
+
+    def clear(self):
+        self.__data.clear()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def quantize(self, date: dt.datetime, h: float, lat: float, lon: float, indices: list):
+        '''Returns the Key of the Inputs and the Inputs rounded to the Cell the Key stands for'''
+        if self.__time_step > 0:
+            date = dt.datetime(1970, 1, 1) + dt.timedelta(seconds=round(
+                (date - dt.datetime(1970, 1, 1)).total_seconds()/self.__time_step)*self.__time_step)
+        h = self.__round(h.to(u.km).value, self.__h_step)
+        lat = self.__round(lat.to(u.deg).value, self.__angle_step)
+        lon = self.__round(lon.to(u.deg).value, self.__angle_step)
+        indices = tuple(self.__round(float(i), self.__index_step) for i in indices)
+        return (date, h, lat, lon, indices), (date, h*u.km, lat*u.deg, lon*u.deg, list(indices))
+
+    def get(self, key):
+        '''Returns the stored Result of a Key or None, and counts the Hit or Miss'''
+        if key in self.__data:
+            self.__data.move_to_end(key)
+            self.__hits += 1
+            return self.__data[key]
+        self.__misses += 1
+        return None
+
+    def put(self, key, output):
+        self.__data[key] = output
+        self.__data.move_to_end(key)
+        while len(self.__data) > self.__maxsize:
+            self.__data.popitem(last=False)
+            self.__evictions += 1
+
+    def __round(self, x: float, step: float):
+        if step > 0:
+            return round(x/step)*step
+        return x
+
+'''Shared Cache used by nrl00 when called with cache=True'''
+nrl00_cache = Nrl00Cache()
+
 '''Calculate Atmsopheric conditions for given Inputs using NRLMSISE00 Atmospheric Model'''
 
 '''
@@ -18,6 +97,8 @@ from astropy import units as u
 * INPUT 4: Longitude use *u.deg to indicate degrees or u.rad to indicate radians
 * INPUT 5: NP Array Containing Solar Flux and AP Inidices
 [F107,F107A,AP_DAILY,AP1,AP2,AP3,AP4,APAVG1,APAVG2]
+Note: INPUT 2-4 may also be Array Quantities, their Units are converted once per Array and the Output is then the
+(d, t) NP Array Tuple of nrl00_raw (without cache). For plain Floats use nrl00_float or nrl00_raw of AtmosCalcFloat
 '''
 
 '''
@@ -26,6 +107,13 @@ aph=
 True - AP array given in Input 5 is used
 False - indicates that the AP Daily is used instead of AP Array to determine atmospheric Conditions, input 5 must
 now be in the form [F107,F107A,AP_DAILY]
+cache=
+None - the Model is evaluated on every call
+Nrl00Cache - Results are looked up in and stored to the given Cache, see Nrl00Cache (scalar Inputs only)
+True - the shared module Cache nrl00_cache is used
+backend=
+'python' - the Model written in Python is evaluated
+'numba' - the compiled Model of nrlmsise_00_numba is evaluated (falls back to 'python' if numba is not installed)
 '''
 
 '''
@@ -44,56 +132,79 @@ now be in the form [F107,F107A,AP_DAILY]
  '''
 
 def nrl00(date: dt.datetime=dt.datetime(2010,10,10,12,30,0), h: float = 190000*u.meter, lat: float=-70*u.deg,
-               lon: float=100*u.deg, indices: list=[60,60,1,0,0,0,0,0,0], aph = True):
-    '''Defining Outputs, Flag & Inputs of NLRMSISE00 Class'''
-    output = [nrlmsise_output() for _ in range(2)]
-    Input = [nrlmsise_input() for _ in range(2)]
-    flags = nrlmsise_flags()
-
-    '''Defining Flags'''
-    '''If you want answers in g/cm^3 set flags.switches[0]=0'''
-    for i in range(24):
-        flags.switches[i]=1
-    #flags.switches[0] = 0
-
-    '''Creating AP Array'''
-    '''
-     * Array containing the following magnetic values:
-     *   0 : daily AP
-     *   1 : 3 hr AP index for current time
-     *   2 : 3 hr AP index for 3 hrs before current time
-     *   3 : 3 hr AP index for 6 hrs before current time
-     *   4 : 3 hr AP index for 9 hrs before current time
-     *   5 : Average of eight 3 hr AP indicies from 12 to 33 hrs 
-     *           prior to current time
-     *   6 : Average of eight 3 hr AP indicies from 36 to 57 hrs 
-     *           prior to current time
-    '''
-    if aph == True:
-         flags.switches[9] = -1
-         aph = ap_array()
-         for i in range(7):
-             aph.a[i] = indices[i+2]
-
-
-    '''Defining Inputs of Atmospheric Model and Converting Units if Necessary'''
-
-    Input[1].doy = (date - dt.datetime(date.year, 1, 1, date.hour, date.minute, date.second)).days + 1
-    Input[1].year = date.year  # /* without effect */
-    Input[1].sec = date.hour * 60 * 60 + date.minute * 60 + date.second
-    Input[1].alt = h.to(u.km).value
-    Input[1].g_lat = lat.to(u.deg).value
-    Input[1].g_long = lon.to(u.deg).value
-
-    Input[1].f107 = indices[0]
-    Input[1].f107A = indices[1]
-    Input[1].ap = indices[2]
-    Input[1].ap_a = aph
-
-    '''Runs NLRMSISE00 Class'''
-    gtd7(Input[1], flags, output[1])
-
-    return output[1]
+               lon: float=100*u.deg, indices: list=[60,60,1,0,0,0,0,0,0], aph = True, cache = None, backend = 'python'):
+    '''Looking up the Result in the Cache, on a Miss the Model is evaluated at the Quantized Inputs'''
+    if cache is not None:
+        if any(np.ndim(x) for x in (h, lat, lon)):
+            raise ValueError('the nrl00 cache holds single points only, evaluate array quantities without cache')
+        if cache is True:
+            cache = nrl00_cache
+        key, inputs = cache.quantize(date, h, lat, lon, indices if aph == True else indices[:3])
+        key = key + (aph == True,)
+        output = cache.get(key)
+        if output is None:
+            output = nrl00(*inputs, aph=aph, backend=backend)
+            cache.put(key, output)
+        return copy_output(output)
+
+    '''Converting Units once, the Model is evaluated by the units-free nrl00_float'''
+    return nrl00_float(date, h.to(u.km).value, lat.to(u.deg).value, lon.to(u.deg).value, indices, aph=aph,
+                       backend=backend)
+
+def copy_output(output):
+    '''Returns a copy of an nrlmsise_output so Results stored in a Cache can not be changed by the Caller'''
+    new = nrlmsise_output()
+    new.d[:] = output.d
+    new.t[:] = output.t
+    return new
+
+'''Calculate Atmsopheric conditions for many Dates & Positions in one call using the vectorised NRLMSISE00 Model'''
+
+'''
+* INPUT 1: List of N dates (datetime class) at which required output will be calculated
+* INPUT 2: Height use *u.meters to indicate meters or u.km to indicate kilometers, scalar or N values
+* INPUT 3: Latitude use *u.deg to indicate degrees or u.rad to indicate radians, scalar or N values
+* INPUT 4: Longitude use *u.deg to indicate degrees or u.rad to indicate radians, scalar or N values
+* INPUT 5: NP Array Containing Solar Flux and AP Inidices, shared by all points
+[F107,F107A,AP_DAILY,AP1,AP2,AP3,AP4,APAVG1,APAVG2]
+* FLAGS: aph, backend, see nrl00
+'''
+
+'''
+ *   OUTPUT VARIABLES{Tuple}:
+ * [0] (N,9) NP Array with d[0] - d[8] of nrl00 for every point
+ * [1] (N,2) NP Array with t[0] - t[1] of nrl00 for every point
+ '''
+
+def nrl00_batch(dates: list, h: float = 190000*u.meter, lat: float=-70*u.deg, lon: float=100*u.deg,
+                indices: list=[60,60,1,0,0,0,0,0,0], aph = True, backend = 'python'):
+    '''Runs Vectorised NLRMSISE00 Model, Units are Converted once per Array'''
+    return nrl00_batch_float(dates, h.to(u.km).value, lat.to(u.deg).value, lon.to(u.deg).value, indices, aph=aph,
+                             backend=backend)
+
+'''Calculate a Vertical Profile of Atmsopheric conditions for one Date & Position using NRLMSISE00 Atmospheric Model'''
+
+'''
+* INPUT 1: Date at which required output will be calculated (datetime class)
+* INPUT 2: Latitude use *u.deg to indicate degrees or u.rad to indicate radians
+* INPUT 3: Longitude use *u.deg to indicate degrees or u.rad to indicate radians
+* INPUT 4: Array of N Heights use *u.meters to indicate meters or u.km to indicate kilometers
+* INPUT 5: NP Array Containing Solar Flux and AP Inidices
+[F107,F107A,AP_DAILY,AP1,AP2,AP3,AP4,APAVG1,APAVG2]
+* FLAGS: aph, see nrl00
+Note: the altitude independent part of the model is evaluated once for the whole profile
+'''
+
+'''
+ *   OUTPUT VARIABLES{Tuple}:
+ * [0] (N,9) NP Array with d[0] - d[8] of nrl00 for every height
+ * [1] (N,2) NP Array with t[0] - t[1] of nrl00 for every height
+ '''
+
+def nrl00_profile(date: dt.datetime=dt.datetime(2010,10,10,12,30,0), lat: float=-70*u.deg, lon: float=100*u.deg,
+                  alts: np.ndarray = np.arange(150,301)*u.km, indices: list=[60,60,1,0,0,0,0,0,0], aph = True):
+    return nrl00_profile_float(date, lat.to(u.deg).value, lon.to(u.deg).value, alts.to(u.km).value, indices,
+                               aph=aph)
 
 '''Calculate Atmsopheric conditions for given Date & Position using NRLMSISE00 Atmospheric Model'''
 
@@ -172,5 +283,6 @@ if __name__ == '__main__':
     a = nrl00(aph=True)
     b = nrl00_2()
     c = nrl00_cond(atmos='high')
+    d = nrl00_profile()
     #print(time.clock() - start)
 
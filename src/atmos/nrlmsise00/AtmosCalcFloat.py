@@ -0,0 +1,258 @@
+'''Importing Atmospheric Model from Folder'''
+from src.atmos.nrlmsise00.model.nrlmsise_00 import nrlmsise_flags,nrlmsise_input,nrlmsise_output,ap_array,gtd7,\
+    select_backend,tselec,nrlmsise_state
+from src.atmos.nrlmsise00.model.nrlmsise_00_vec import gtd7_vec,gtd7_profile
+
+'''Importing Required Modules'''
+import datetime as dt
+import numpy as np
+from array import array
+
+'''Units-free Versions of nrl00, nrl00_batch and nrl00_profile of AtmosCalc, and nrl00_raw that takes the Model Inputs
+directly'''
+'''
+* Heights are Floats in km, Latitudes and Longitudes Floats in deg, all other Inputs and the Outputs are as in AtmosCalc
+* This Module only needs numpy, importing it does not import astropy, pandas or matplotlib so short lived Worker
+Processes start quickly
+'''
+
+def doy_sec(date: dt.datetime):
+    '''Function doy_sec'''
+    '''Day of Year and Seconds of Day of a Date as used by the Model'''
+    doy = (date - dt.datetime(date.year, 1, 1, date.hour, date.minute, date.second)).days + 1
+    sec = date.hour * 60 * 60 + date.minute * 60 + date.second
+    return doy, sec
+
+def model_flags(aph = True):
+    '''Function model_flags'''
+    '''Flags with all switches on, the AP Array switch is set if aph is True'''
+    '''If you want answers in g/cm^3 set flags.switches[0]=0'''
+    flags = nrlmsise_flags()
+    for i in range(24):
+        flags.switches[i]=1
+    if aph == True:
+        flags.switches[9] = -1
+    return flags
+
+'''Calculate Atmsopheric conditions for Model Inputs given as plain Floats or NP Arrays'''
+
+'''
+* INPUT 1: Day of Year
+* INPUT 2: Seconds of Day
+* INPUT 3: Height in km
+* INPUT 4: Latitude in deg
+* INPUT 5: Longitude in deg
+INPUT 1-5 are all Floats, or Floats and NP Arrays of N values that broadcast together
+* INPUT 6: NP Array Containing Solar Flux and AP Inidices, shared by all points
+[F107,F107A,AP_DAILY,AP1,AP2,AP3,AP4,APAVG1,APAVG2]
+for Array Inputs also a (N,9) NP Array with the Indices of every point, e.g. from Indexer.for_slots
+* FLAGS: aph, backend, see nrl00
+* OUTPUT 1: for Float Inputs an nrlmsise_output with d[0] - d[8] and t[0] - t[1], see nrl00
+for Array Inputs a (N,9) NP Array with d[0] - d[8] and a (N,2) NP Array with t[0] - t[1] for every point
+'''
+
+def nrl00_raw(doy: float, sec: float, alt_km: float, lat_deg: float, lon_deg: float,
+              indices: list=[60,60,1,0,0,0,0,0,0], aph = True, backend = 'python'):
+    flags = model_flags(aph)
+
+    if any(np.ndim(x) for x in (doy, sec, alt_km, lat_deg, lon_deg)):
+        '''Array Inputs, Runs Vectorised NLRMSISE00 Model, the Columns of (N,9) Indices are Arrays over the points'''
+        indices = np.asarray(indices, dtype=float).T
+        ap_a = indices[2:9].T if aph == True else None
+        model = gtd7_vec
+        if select_backend(backend) == 'numba':
+            from src.atmos.nrlmsise00.model.nrlmsise_00_numba import gtd7_vec_numba as model
+        return model(doy, sec, alt_km, lat_deg, lon_deg, indices[0], indices[1], indices[2], ap_a=ap_a, flags=flags)
+
+    output = nrlmsise_output()
+    Input = nrlmsise_input()
+
+    '''Creating AP Array'''
+    '''
+     * Array containing the following magnetic values:
+     *   0 : daily AP
+     *   1 : 3 hr AP index for current time
+     *   2 : 3 hr AP index for 3 hrs before current time
+     *   3 : 3 hr AP index for 6 hrs before current time
+     *   4 : 3 hr AP index for 9 hrs before current time
+     *   5 : Average of eight 3 hr AP indicies from 12 to 33 hrs
+     *           prior to current time
+     *   6 : Average of eight 3 hr AP indicies from 36 to 57 hrs
+     *           prior to current time
+    '''
+    if aph == True:
+         aph = ap_array()
+         for i in range(7):
+             aph.a[i] = indices[i+2]
+
+    Input.doy = doy
+    Input.sec = sec
+    Input.alt = alt_km
+    Input.g_lat = lat_deg
+    Input.g_long = lon_deg
+
+    Input.f107 = indices[0]
+    Input.f107A = indices[1]
+    Input.ap = indices[2]
+    Input.ap_a = aph
+
+    '''Runs NLRMSISE00 Class'''
+    gtd7(Input, flags, output, backend=backend)
+
+    return output
+
+'''Calculate Atmsopheric conditions for given Inputs, see nrl00 of AtmosCalc'''
+
+'''
+* INPUT 1: Date at which required output will be calculated (datetime class)
+* INPUT 2: Height in km
+* INPUT 3: Latitude in deg
+* INPUT 4: Longitude in deg
+* INPUT 5: NP Array Containing Solar Flux and AP Inidices
+[F107,F107A,AP_DAILY,AP1,AP2,AP3,AP4,APAVG1,APAVG2]
+* FLAGS: aph, backend, see nrl00
+* OUTPUT 1: see nrl00_raw
+'''
+
+def nrl00_float(date: dt.datetime=dt.datetime(2010,10,10,12,30,0), h: float = 190.0, lat: float = -70.0,
+                lon: float = 100.0, indices: list=[60,60,1,0,0,0,0,0,0], aph = True, backend = 'python'):
+    doy, sec = doy_sec(date)
+    return nrl00_raw(doy, sec, h, lat, lon, indices, aph=aph, backend=backend)
+
+'''Calculate Atmsopheric conditions for many Dates & Positions in one call, see nrl00_batch of AtmosCalc'''
+
+'''
+* INPUT 1: List of N dates (datetime class)
+* INPUT 2-4: Height in km, Latitude and Longitude in deg, scalar or N values
+* INPUT 5: NP Array Containing Solar Flux and AP Inidices, shared by all points, or a (N,9) NP Array, see nrl00_raw
+* FLAGS: aph, backend, see nrl00
+* OUTPUT 1: (N,9) NP Array with d[0] - d[8] and (N,2) NP Array with t[0] - t[1] for every point
+'''
+
+def nrl00_batch_float(dates: list, h: float = 190.0, lat: float = -70.0, lon: float = 100.0,
+                      indices: list=[60,60,1,0,0,0,0,0,0], aph = True, backend = 'python'):
+    doy, sec = np.array([doy_sec(date) for date in dates]).reshape(-1, 2).T
+    return nrl00_raw(doy, sec, h, lat, lon, indices, aph=aph, backend=backend)
+
+'''Class AtmosphereEvaluator'''
+'''Evaluates the Model at one Point per call, reusing the same Flags, Input, Output and Model State every time'''
+'''
+* INPUT 1: NP Array Containing Solar Flux and AP Inidices
+[F107,F107A,AP_DAILY,AP1,AP2,AP3,AP4,APAVG1,APAVG2]
+* FLAGS: aph, backend, see nrl00
+
+* evaluate(doy, sec, alt_km, lat_deg, lon_deg) returns the nrlmsise_output of the Evaluator, it is overwritten by the
+next call so copy d and t if they must be kept
+* evaluate_into(out, doy, sec, alt_km, lat_deg, lon_deg) writes d[0] - d[8] and t[0] - t[1] to out[0:11], out can be
+a row of a larger NP Array, e.g. evaluate_into(vals[i, 9:20], ...)
+* set_indices(indices) changes the Solar Flux and AP Indices used by the following calls
+Note: the Python Model still builds the Spline Coefficients of gts7 and densm and some small Lists on every call,
+the Coefficients depend on the Temperatures at the Nodes of that call; backend='numba' runs gtd7_work on the Work
+Array of the Evaluator, the compiled Model allocates no Arrays per call
+Note: an Evaluator holds one Model State, use one Evaluator per Thread
+'''
+
+class AtmosphereEvaluator(object):
+    __slots__ = ('__flags', '__input', '__output', '__aph', '__state', '__numba', '__inp', '__ap_a', '__sw', '__swc',
+                 '__d', '__t', '__work')
+
+    def __init__(self, indices: list=[60,60,1,0,0,0,0,0,0], aph = True, backend = 'python'):
+        self.__flags = model_flags(aph)
+        tselec(self.__flags)
+        self.__input = nrlmsise_input()
+        self.__output = nrlmsise_output()
+        self.__aph = ap_array()
+        self.__input.ap_a = self.__aph
+        self.__state = nrlmsise_state()
+        self.__state.flags = self.__flags
+
+        self.__numba = None
+        if select_backend(backend) == 'numba':
+            from src.atmos.nrlmsise00.model import nrlmsise_00_numba
+            self.__numba = nrlmsise_00_numba
+            self.__inp = np.zeros(10)
+            self.__ap_a = np.zeros(7)
+            self.__sw = np.array(self.__flags.sw, dtype=np.float64)
+            self.__swc = np.array(self.__flags.swc, dtype=np.float64)
+            self.__d = np.zeros(9)
+            self.__t = np.zeros(2)
+            self.__work = nrlmsise_00_numba.work_array()
+        self.set_indices(indices)
+
+    def return_flags(self):
+        return self.__flags
+
+    def set_indices(self, indices: list):
+        Input = self.__input
+        Input.f107 = indices[0]
+        Input.f107A = indices[1]
+        Input.ap = indices[2]
+        if self.__flags.switches[9] == -1:
+            for i in range(7):
+                self.__aph.a[i] = indices[i+2]
+        if self.__numba is not None:
+            self.__inp[self.__numba.F107] = Input.f107
+            self.__inp[self.__numba.F107A] = Input.f107A
+            self.__inp[self.__numba.AP] = Input.ap
+            self.__ap_a[:] = self.__aph.a
+
+    def evaluate(self, doy: float, sec: float, alt_km: float, lat_deg: float, lon_deg: float):
+        output = self.__output
+        if self.__numba is not None:
+            self.__compiled(doy, sec, alt_km, lat_deg, lon_deg, self.__d, self.__t)
+            output.d[:] = array('d', self.__d)
+            output.t[:] = array('d', self.__t)
+            return output
+
+        Input = self.__input
+        Input.doy = doy
+        Input.sec = sec
+        Input.alt = alt_km
+        Input.g_lat = lat_deg
+        Input.g_long = lon_deg
+        gtd7(Input, self.__flags, output, self.__state)
+        return output
+
+    def evaluate_into(self, out: np.ndarray, doy: float, sec: float, alt_km: float, lat_deg: float, lon_deg: float):
+        if self.__numba is not None:
+            self.__compiled(doy, sec, alt_km, lat_deg, lon_deg, out[0:9], out[9:11])
+            return out
+        output = self.evaluate(doy, sec, alt_km, lat_deg, lon_deg)
+        out[0:9] = output.d
+        out[9:11] = output.t
+        return out
+
+    def __compiled(self, doy, sec, alt_km, lat_deg, lon_deg, d, t):
+        '''Runs the compiled Model of nrlmsise_00_numba'''
+        model = self.__numba
+        inp = self.__inp
+        inp[model.DOY] = doy
+        inp[model.SEC] = sec
+        inp[model.ALT] = alt_km
+        inp[model.G_LAT] = lat_deg
+        inp[model.G_LONG] = lon_deg
+        model.gtd7_work(inp, self.__ap_a, self.__sw, self.__swc, d, t, self.__work)
+
+'''Calculate a Vertical Profile of Atmsopheric conditions, see nrl00_profile of AtmosCalc'''
+
+'''
+* INPUT 1: Date (datetime class)
+* INPUT 2-3: Latitude and Longitude in deg
+* INPUT 4: Array of N Heights in km
+* INPUT 5: NP Array Containing Solar Flux and AP Inidices
+* FLAGS: aph, see nrl00
+* OUTPUT 1: (N,9) NP Array with d[0] - d[8] and (N,2) NP Array with t[0] - t[1] for every height
+'''
+
+def nrl00_profile_float(date: dt.datetime=dt.datetime(2010,10,10,12,30,0), lat: float = -70.0, lon: float = 100.0,
+                        alts: np.ndarray = np.arange(150.,301.), indices: list=[60,60,1,0,0,0,0,0,0], aph = True):
+    doy, sec = doy_sec(date)
+    flags = model_flags(aph)
+    ap_a = indices[2:9] if aph == True else None
+    return gtd7_profile(doy, sec, alts, lat, lon, indices[0], indices[1], indices[2], ap_a=ap_a, flags=flags)
+
+if __name__ == '__main__':
+    a = nrl00_float()
+    b = nrl00_batch_float([dt.datetime(2010,10,10,12,30,0)]*3, h=np.array([150.,200.,250.]))
+    c = nrl00_profile_float()
+    print(a.d[5], b[0][:, 5], c[0][:3, 5])
@@ -0,0 +1,144 @@
+"""
+Import time budget of the units-free compute path and agreement of the float
+API with the astropy API of AtmosCalc.
+"""
+
+import os
+import sys
+import subprocess
+import datetime as dt
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+'''Modules of the compute path and the cumulative import time [s] they may take together'''
+COMPUTE_PATH = ['src.atmos.nrlmsise00.AtmosCalcFloat', 'src.atmos.nrlmsise00.IndexFindr.IndexReturn']
+IMPORT_BUDGET = 1.0
+HEAVY = ['astropy', 'pandas', 'matplotlib', 'cartopy', 'numba']
+
+'''The orbit compute path takes astropy Quantities and builds pandas DataFrames, plotting, numba and the units API of
+AtmosCalc stay unloaded'''
+ORBIT_PATH = ['src.orbit.OrbitDragCalc', 'src.orbit.SatGroundTrack.GroundTrack']
+ORBIT_BUDGET = 2.0
+ORBIT_HEAVY = ['matplotlib', 'cartopy', 'numba', 'src.atmos.nrlmsise00.AtmosCalc']
+
+
+def import_compute_path(modules=COMPUTE_PATH, heavy=HEAVY):
+    '''Imports the modules in a fresh interpreter, returns their import time [s] and the heavy modules loaded'''
+    code = 'import sys\nimport ' + '\nimport '.join(modules) + \
+           '\nprint(",".join(m for m in %r if m in sys.modules))' % heavy
+    run = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, capture_output=True,
+                         text=True, env=dict(os.environ, PYTHONPATH=ROOT))
+    assert run.returncode == 0, run.stderr
+
+    '''importtime lines read "import time: self [us] | cumulative [us] | name", top level modules are not indented'''
+    total = 0
+    for line in run.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            cumulative, name = line.split('|')[1:]
+            if not name.startswith('  ') and cumulative.strip().isdigit():
+                total += int(cumulative)
+    return total/1e6, [m for m in run.stdout.strip().split(',') if m]
+
+
+def test_import_budget():
+    times = []
+    for _ in range(3):
+        time, heavy = import_compute_path()
+        assert heavy == []
+        times.append(time)
+    assert min(times) < IMPORT_BUDGET
+
+
+def test_orbit_import_budget():
+    times = []
+    for _ in range(3):
+        time, heavy = import_compute_path(ORBIT_PATH, ORBIT_HEAVY)
+        assert heavy == []
+        times.append(time)
+    assert min(times) < ORBIT_BUDGET
+
+
+def test_float_api():
+    from astropy import units as u
+    from src.atmos.nrlmsise00.AtmosCalc import nrl00, nrl00_batch
+    from src.atmos.nrlmsise00.AtmosCalcFloat import nrl00_float, nrl00_batch_float
+
+    date = dt.datetime(2010, 10, 10, 12, 30, 0)
+    indices = [150, 140, 15, 12, 20, 10, 15, 14, 16]
+    for aph in (True, False):
+        a = nrl00(date, 250*u.km, 30*u.deg, -40*u.deg, indices, aph=aph)
+        b = nrl00_float(date, 250.0, 30.0, -40.0, indices, aph=aph)
+        assert a.d == b.d and a.t == b.t
+
+    dates = [date + dt.timedelta(minutes=i) for i in range(5)]
+    d, t = nrl00_batch(dates, 200*u.km, 10*u.deg, 20*u.deg, indices)
+    df, tf = nrl00_batch_float(dates, 200.0, 10.0, 20.0, indices)
+    assert (d == df).all() and (t == tf).all()
+
+
+def test_nrl00_raw():
+    import numpy as np
+    from astropy import units as u
+    from src.atmos.nrlmsise00.AtmosCalc import nrl00
+    from src.atmos.nrlmsise00.AtmosCalcFloat import nrl00_raw
+
+    indices = [150, 140, 15, 12, 20, 10, 15, 14, 16]
+    alts = np.array([120.0, 250.0, 400.0])
+    lats = np.array([-60.0, 0.0, 45.0])
+    d, t = nrl00_raw(283, 45000, alts, lats, 100.0, indices)
+    for i in range(3):
+        output = nrl00_raw(283, 45000, alts[i], lats[i], 100.0, indices)
+        assert np.allclose(d[i], output.d, rtol=1e-10) and np.allclose(t[i], output.t, rtol=1e-10)
+
+    '''Array Quantities are converted once and evaluated by nrl00_raw'''
+    dq, tq = nrl00(dt.datetime(2010, 10, 10, 12, 30, 0), alts*u.km, lats*u.deg, 100*u.deg, indices)
+    assert (dq == d).all() and (tq == t).all()
+
+
+def test_atmosphere_evaluator():
+    import numpy as np
+    from src.atmos.nrlmsise00.AtmosCalcFloat import nrl00_raw, AtmosphereEvaluator
+
+    rng = np.random.RandomState(3)
+    points = np.column_stack((rng.randint(1, 366, 20), rng.uniform(0, 86400, 20), rng.uniform(0, 600, 20),
+                              rng.uniform(-90, 90, 20), rng.uniform(-180, 180, 20)))
+    indices = [150, 140, 15, 12, 20, 10, 15, 14, 16]
+    for aph in (True, False):
+        evaluator = AtmosphereEvaluator(indices, aph=aph)
+        vals = np.zeros((len(points), 11))
+        for i, point in enumerate(points):
+            ref = nrl00_raw(*point, indices, aph=aph)
+            assert evaluator.evaluate(*point).d == ref.d
+            evaluator.evaluate_into(vals[i], *point)
+            assert vals[i].tolist() == list(ref.d) + list(ref.t)
+
+    '''New Indices take effect on the next call'''
+    evaluator.set_indices([70, 70, 4])
+    assert evaluator.evaluate(*points[0]).d == nrl00_raw(*points[0], [70, 70, 4], aph=False).d
+
+
+def test_evaluator_flags_once(monkeypatch):
+    '''The Evaluator sets up its Switches once, gtd7 without a State still runs tselec on every call'''
+    from src.atmos.nrlmsise00.AtmosCalcFloat import nrl00_raw, AtmosphereEvaluator
+    from src.atmos.nrlmsise00.model import nrlmsise_00
+
+    indices = [150, 140, 15, 12, 20, 10, 15, 14, 16]
+    evaluator = AtmosphereEvaluator(indices)
+    calls = []
+    tselec = nrlmsise_00.tselec
+    monkeypatch.setattr(nrlmsise_00, 'tselec', lambda flags: calls.append(flags) or tselec(flags))
+    for alt in (50.0, 150.0, 400.0):
+        assert evaluator.evaluate(100, 3600, alt, 20.0, 30.0).d == nrl00_raw(100, 3600, alt, 20.0, 30.0, indices).d
+    assert len(calls) == 3
+
+
+def test_nrl00_raw_indices_per_point():
+    import numpy as np
+    from src.atmos.nrlmsise00.AtmosCalcFloat import nrl00_raw
+
+    indices = np.array([[150, 140, 15, 12, 20, 10, 15, 14, 16], [70, 72, 4, 3, 5, 4, 2, 3, 4]])
+    for aph in (True, False):
+        d, t = nrl00_raw(283, np.array([45000, 46000]), 250.0, 30.0, 100.0, indices, aph=aph)
+        for i in range(2):
+            di, ti = nrl00_raw(283, np.array([45000, 46000])[i:i+1], 250.0, 30.0, 100.0, indices[i], aph=aph)
+            assert (d[i] == di[0]).all() and (t[i] == ti[0]).all()
@@ -0,0 +1,72 @@
+"""
+Checks the quantized LRU cache of nrl00: its counters, the cells of the
+quantization and that cached results are copies; and the altitude profile
+nrl00_profile against nrl00.
+"""
+
+import datetime as dt
+import numpy as np
+import pytest
+from astropy import units as u
+
+from src.atmos.nrlmsise00.AtmosCalc import nrl00, nrl00_profile, Nrl00Cache
+
+DATE = dt.datetime(2010, 10, 10, 12, 30, 0)
+INDICES = [150, 140, 15, 12, 20, 10, 15, 14, 16]
+
+
+def test_cache_stats():
+    cache = Nrl00Cache(maxsize=2)
+    for h in (200, 250, 200, 300, 200, 250):
+        nrl00(DATE, h*u.km, 10*u.deg, 20*u.deg, INDICES, cache=cache)
+    '''200 km is used again before the third Altitude evicts 250 km, which is then missed again'''
+    assert cache.return_stats() == {'hits': 2, 'misses': 4, 'evictions': 2, 'size': 2, 'maxsize': 2}
+
+    cache.clear()
+    assert cache.return_stats() == {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'maxsize': 2}
+
+
+def test_cache_quantization():
+    '''Inputs in the same Cell share one Result, evaluated at the Center of the Cell'''
+    cache = Nrl00Cache(h_step=1*u.km, angle_step=0.5*u.deg, time_step=60*u.s)
+    a = nrl00(DATE, 250.2*u.km, 10.1*u.deg, 20.2*u.deg, INDICES, cache=cache)
+    b = nrl00(DATE + dt.timedelta(seconds=20), 249.8*u.km, 9.9*u.deg, 19.8*u.deg, INDICES, cache=cache)
+    assert cache.return_stats()['hits'] == 1 and a.d == b.d
+    assert a.d == nrl00(DATE, 250*u.km, 10*u.deg, 20*u.deg, INDICES).d
+
+    '''Neighbouring Cells and other aph Settings are separate Entries'''
+    nrl00(DATE, 250.6*u.km, 10.1*u.deg, 20.2*u.deg, INDICES, cache=cache)
+    nrl00(DATE, 250.2*u.km, 10.1*u.deg, 20.2*u.deg, INDICES, aph=False, cache=cache)
+    assert cache.return_stats()['misses'] == 3
+
+    '''Without Steps only equal Inputs match'''
+    exact = Nrl00Cache()
+    nrl00(DATE, 250.2*u.km, 10*u.deg, 20*u.deg, INDICES, cache=exact)
+    nrl00(DATE, 250.2001*u.km, 10*u.deg, 20*u.deg, INDICES, cache=exact)
+    assert exact.return_stats()['hits'] == 0
+
+
+def test_cache_copy():
+    '''Changing a returned Output does not change the stored Result'''
+    cache = Nrl00Cache()
+    a = nrl00(DATE, 250*u.km, 10*u.deg, 20*u.deg, INDICES, cache=cache)
+    d = list(a.d)
+    a.d[5] = -1.0
+    b = nrl00(DATE, 250*u.km, 10*u.deg, 20*u.deg, INDICES, cache=cache)
+    assert b is not a and list(b.d) == d
+
+
+def test_cache_arrays():
+    with pytest.raises(ValueError, match='single points'):
+        nrl00(DATE, np.array([200, 250])*u.km, 10*u.deg, 20*u.deg, INDICES, cache=Nrl00Cache())
+
+
+def test_nrl00_profile():
+    '''The Profile equals nrl00 at the same Altitudes bit for bit, in km or m'''
+    alts = np.arange(80, 801, 10.)
+    for aph in (True, False):
+        d, t = nrl00_profile(DATE, 10*u.deg, 20*u.deg, alts*u.km, INDICES, aph=aph)
+        dv, tv = nrl00(DATE, alts*u.km, 10*u.deg, 20*u.deg, INDICES, aph=aph)
+        assert np.array_equal(d, dv) and np.array_equal(t, tv)
+        dm, tm = nrl00_profile(DATE, 10*u.deg, 20*u.deg, alts*1000*u.m, INDICES, aph=aph)
+        assert np.array_equal(dm, d) and np.array_equal(tm, t)
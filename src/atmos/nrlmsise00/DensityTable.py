@@ -0,0 +1,205 @@
+'''Importing Atmospheric Model from Folder'''
+from src.atmos.nrlmsise00.model.nrlmsise_00_vec import gtd7_vec
+from src.atmos.nrlmsise00.model.nrlmsise_00 import select_backend
+
+'''Importing Required Modules'''
+import os
+import itertools
+import numpy as np
+
+'''Precomputed NRLMSISE00 Total Mass Density Table with Multilinear Interpolation'''
+'''
+* The Table holds log10 of the Density, so the Interpolation is exact for Densities falling exponentially in Altitude.
+Below 150 km the Model Density bends sharply in Altitude (in high AP polar Cells it even rises between 110 and 120 km),
+the Default Grid uses 1 km Steps there and 5 km above
+* Relative Error of the Default Table against the full Model at 40000 random Points (build_table stores its own
+Estimate, see DensityTable.return_errors):
+    100-150 km: RMS 0.9 %, 99th percentile 3.0 %, maximum 17 %
+    150-1000 km: RMS 1.1 %, 99th percentile 3.2 %, maximum 6.7 %
+Errors above 5 % are almost all in Cells with a daily AP above 200
+* Cost per Point, along an Orbit (random Points): numpy 0.9 us (1.6 us), numba backend 0.25 us (0.75 us); the
+vectorised Model gtd7_vec takes about 12 us and the scalar gtd7 about 600 us
+'''
+
+'''Default Filepath of the Table'''
+TABLE_FILEPATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))), 'data', 'nrlmsise00_dataprocessed', 'nrlmsise00_density_table.npz')
+
+'''Default Grid, Altitude [km], Latitude [deg], Local Solar Time [h], F10.7 and daily AP'''
+ALTS = np.concatenate((np.arange(100, 150, 1.), np.arange(150, 1001, 5.)))
+LATS = np.linspace(-90, 90, 19)
+LSTS = np.linspace(0, 24, 17)
+F107S = np.arange(60, 301, 20.)
+APS = np.array([0, 3, 7, 15, 27, 48, 80, 132, 207, 300.])
+
+'''Axes of the Table in the order of the Table Dimensions'''
+AXES = ['alt', 'lat', 'lst', 'f107', 'ap']
+
+
+def table_density(alt, lat, lst, f107, ap, doy: float = 80):
+    '''Function table_density'''
+    '''Total Mass Density [kg/m^3] of the full Model at the Points the Table stands for'''
+    '''
+    * The Table has no Longitude, Time or History axes, a Point is evaluated at Longitude 0 with the seconds of the
+    day set so that the local solar time is lst, F10.7A equal to F10.7 and the daily AP only (no AP history)
+    '''
+    lst = np.asarray(lst, dtype=float)
+    return gtd7_vec(doy, (lst % 24)*60*60, alt, lat, 0.0, f107, f107, ap, lst=lst % 24)[0][:, 5]
+
+
+def build_table(alts: np.ndarray = ALTS, lats: np.ndarray = LATS, lsts: np.ndarray = LSTS, f107s: np.ndarray = F107S,
+                aps: np.ndarray = APS, doy: float = 80, filepath: str = TABLE_FILEPATH, chunk: int = 200000,
+                samples: int = 2000):
+    '''Function build_table'''
+    '''Samples the Model over the Grid and saves log10 of the Total Mass Density as an .npz Table'''
+    '''PARAM 1-5: Increasing Grid Values of Altitude [km], Latitude [deg], Local Solar Time [h] (should span 0
+    to 24), F10.7 and daily AP'''
+    '''PARAM 6: Day of Year at which the Table is evaluated'''
+    '''PARAM 7: Filepath to save the Table'''
+    '''PARAM 8: Number of Grid Points evaluated per Model call'''
+    '''PARAM 9: Number of random Points used to estimate the Interpolation Error, stored with the Table'''
+
+    axes = [np.asarray(a, dtype=float) for a in (alts, lats, lsts, f107s, aps)]
+    shape = tuple(len(a) for a in axes)
+    points = np.array(list(itertools.product(*axes)))
+
+    logrho = np.empty(len(points), dtype=np.float32)
+    for i in range(0, len(points), chunk):
+        p = points[i:i+chunk].T
+        logrho[i:i+chunk] = np.log10(table_density(*p, doy=doy))
+
+    data = dict(zip(AXES, axes), logrho=logrho.reshape(shape), doy=doy)
+    save_table(filepath, data)
+    if samples:
+        '''Error Estimate of the saved Table, stored alongside it'''
+        errors = DensityTable(filepath).error_bounds(samples)
+        save_table(filepath, dict(data, errors=[errors['max'], errors['rms']]))
+    return DensityTable(filepath)
+
+
+def save_table(filepath: str, data: dict):
+    '''Writes the Table through a File Object, np.savez would append .npz to a Filepath without it'''
+    with open(filepath, 'wb') as file:
+        np.savez(file, **data)
+
+
+class DensityTable(object):
+
+    def __init__(self, filepath: str = TABLE_FILEPATH, backend = 'python'):
+        '''Class DensityTable'''
+        '''INPUT 1: Filepath of a Table written by build_table'''
+        '''PARAM 1: backend, 'python' (numpy) or 'numba', see select_backend'''
+
+        '''To interpolate call .interp(alt, lat, lst, f107, ap), inputs are scalars or arrays that broadcast together;
+        points outside the grid are clamped to its edges, the local solar time wraps around 24 h'''
+
+        with np.load(filepath) as table:
+            logrho = table['logrho']
+            self.__axes = [table[a].astype(float) for a in AXES]
+            self.__doy = float(table['doy'])
+            self.__errors = {'max': float(table['errors'][0]), 'rms': float(table['errors'][1])} \
+                if 'errors' in table else None
+
+        '''The Table is kept flat, the 32 Corners of a Cell sit at fixed Offsets from its lower Corner'''
+        self.__logrho = np.ascontiguousarray(logrho).ravel()
+        self.__strides = np.array([int(np.prod(logrho.shape[k+1:])) for k in range(len(AXES))])
+        self.__offsets = np.array([np.dot(corner, self.__strides)
+                                   for corner in itertools.product((0, 1), repeat=len(AXES))])
+        self.__backend = select_backend(backend)
+
+    def return_axes(self):
+        return dict(zip(AXES, self.__axes))
+
+    def return_errors(self):
+        '''Maximum and RMS relative Error of the Table against the full Model, estimated when it was built'''
+        return self.__errors
+
+    def interp(self, alt, lat, lst, f107, ap):
+        '''Total Mass Density [kg/m^3], interpolated multilinearly in log10 of the Density'''
+        alt, lat, lst, f107, ap = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (alt, lat, lst, f107, ap)])
+        shape = alt.shape
+        values = [alt.ravel(), lat.ravel(), lst.ravel() % 24, f107.ravel(), ap.ravel()]
+
+        if self.__backend == 'numba':
+            axes = np.full((len(AXES), max(len(a) for a in self.__axes)), np.inf)
+            for k, axis in enumerate(self.__axes):
+                axes[k, :len(axis)] = axis
+            rho = _interp_numba()(self.__logrho, self.__offsets, self.__strides, axes,
+                                  np.array([len(a) for a in self.__axes]), np.column_stack(values))
+            return rho.reshape(shape)
+
+        '''Flat Index of the lower Corner and Weight of the upper Grid Point along every Axis'''
+        base = np.zeros(len(values[0]), dtype=np.intp)
+        weight = []
+        for axis, stride, x in zip(self.__axes, self.__strides, values):
+            x = np.clip(x, axis[0], axis[-1])
+            i = np.clip(np.searchsorted(axis, x, side='right') - 1, 0, len(axis) - 2)
+            base += i*stride
+            weight.append((x - axis[i])/(axis[i+1] - axis[i]))
+
+        '''The Corners of every Point are gathered at once and reduced one Axis at a time, the first Axis splits
+        them into two Halves, the next into Quarters and so on'''
+        logrho = self.__logrho[base[:, None] + self.__offsets].astype(float)
+        for w in weight:
+            logrho = logrho.reshape(len(base), 2, -1)
+            logrho = logrho[:, 0] + w[:, None]*(logrho[:, 1] - logrho[:, 0])
+        return (10**logrho[:, 0]).reshape(shape)
+
+    def error_bounds(self, n: int = 2000, seed: int = 0):
+        '''Function error_bounds'''
+        '''Compares the Table against the full Model at n random Points inside the Grid'''
+        '''OUT 1: dict with the maximum, RMS and 99th percentile relative Density Error'''
+        rng = np.random.default_rng(seed)
+        points = [rng.uniform(axis[0], axis[-1], n) for axis in self.__axes]
+        exact = table_density(*points, doy=self.__doy)
+        error = np.abs(self.interp(*points)/exact - 1)
+        return {'max': float(error.max()), 'rms': float(np.sqrt(np.mean(error**2))),
+                'p99': float(np.percentile(error, 99))}
+
+
+_kernel = None
+
+
+def _interp_numba():
+    '''Compiles the Interpolation Kernel with numba on first use, the same Steps as DensityTable.interp per Point'''
+    global _kernel
+    if _kernel is None:
+        from numba import njit
+
+        @njit(cache=True)
+        def kernel(logrho, offsets, strides, axes, lens, points):
+            rho = np.empty(points.shape[0])
+            w = np.empty(points.shape[1])
+            corners = np.empty(offsets.shape[0])
+            for p in range(points.shape[0]):
+                base = 0
+                for k in range(points.shape[1]):
+                    x = min(max(points[p, k], axes[k, 0]), axes[k, lens[k]-1])
+                    lo, hi = 0, lens[k] - 1
+                    while hi - lo > 1:
+                        mid = (lo + hi)//2
+                        if axes[k, mid] <= x:
+                            lo = mid
+                        else:
+                            hi = mid
+                    w[k] = (x - axes[k, lo])/(axes[k, lo+1] - axes[k, lo])
+                    base += lo*strides[k]
+                for c in range(offsets.shape[0]):
+                    corners[c] = logrho[base + offsets[c]]
+                half = offsets.shape[0]
+                for k in range(points.shape[1]):
+                    half //= 2
+                    for c in range(half):
+                        corners[c] = corners[c] + w[k]*(corners[c+half] - corners[c])
+                rho[p] = 10**corners[0]
+            return rho
+
+        _kernel = kernel
+    return _kernel
+
+
+if __name__ == "__main__":
+    '''Build the Default Table and show its Error against the full Model'''
+    table = build_table()
+    print(table.return_errors())
+    print(table.interp([200, 400], 12.77, 14, 150, 15))
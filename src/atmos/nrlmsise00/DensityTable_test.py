@@ -0,0 +1,56 @@
+"""
+Checks the density table on a small grid with the default spacing: values at
+the grid nodes, the interpolation error against the full model, the saved
+file and the numba backend.
+"""
+
+import os
+import itertools
+import numpy as np
+
+from src.atmos.nrlmsise00.DensityTable import build_table, table_density, DensityTable, LATS, LSTS, F107S, APS
+
+'''Grid spanning 150 to 300 km with the Spacing of the Default Grid, the Error Bounds stated in DensityTable'''
+GRID = dict(alts=np.arange(150, 301, 5.), lats=LATS[6:13], lsts=LSTS, f107s=F107S[2:8], aps=APS[:6])
+MAX_ERROR = 0.067
+RMS_ERROR = 0.011
+
+
+def small_table(tmp_path, samples=0):
+    '''Builds the Table to a Filepath without the .npz Suffix'''
+    return build_table(filepath=os.path.join(str(tmp_path), 'table'), samples=samples, **GRID)
+
+
+def test_nodes(tmp_path):
+    '''At the Grid Nodes the Interpolation returns the stored Values, which round log10 of the Model to float32'''
+    table = small_table(tmp_path)
+    logrho = np.load(os.path.join(str(tmp_path), 'table'))['logrho']
+    axes = list(GRID.values())
+    nodes = np.array(list(itertools.product(*[a[:-1:2] for a in axes])))
+    idx = tuple(np.array(list(itertools.product(*[range(0, len(a) - 1, 2) for a in axes]))).T)
+    rho = table.interp(*nodes.T)
+    assert np.array_equal(rho, 10**logrho[idx].astype(float))
+    assert np.allclose(np.log10(rho), np.log10(table_density(*nodes.T)), rtol=0, atol=1e-6)
+
+
+def test_error_bounds(tmp_path):
+    errors = small_table(tmp_path).error_bounds(4000)
+    assert errors['max'] < MAX_ERROR and errors['rms'] < RMS_ERROR
+
+
+def test_save_load(tmp_path):
+    table = small_table(tmp_path, samples=200)
+    assert os.listdir(str(tmp_path)) == ['table']
+    loaded = DensityTable(os.path.join(str(tmp_path), 'table'))
+    assert loaded.return_errors() == table.return_errors() and loaded.return_errors()['max'] < MAX_ERROR
+    assert all(np.array_equal(loaded.return_axes()[k], np.asarray(GRID[k + 's'], dtype=float))
+               for k in loaded.return_axes())
+
+
+def test_numba_backend(tmp_path):
+    small_table(tmp_path)
+    filepath = os.path.join(str(tmp_path), 'table')
+    rng = np.random.default_rng(1)
+    points = [rng.uniform(a[0] - 10, a[-1] + 10, 500) for a in GRID.values()]
+    rho = DensityTable(filepath).interp(*points)
+    assert np.allclose(DensityTable(filepath, backend='numba').interp(*points), rho, rtol=1e-12, atol=0)
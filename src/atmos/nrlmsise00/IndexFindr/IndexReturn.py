@@ -1,10 +1,11 @@
+'''Importing Required Modules from Folder'''
+from src.atmos.nrlmsise00.IndexFindr.IndexStore import open_store, F107, F107A, AP_DAILY
+
 '''Importing Required Modules'''
 import numpy as np
-import pandas as pd
-import os
 import datetime as dt
 
-'''Finds Solar and Geo-Magnetic Indices for Desired Date from Processed Solar and AP txt files'''
+'''Finds Solar and Geo-Magnetic Indices for Desired Date from the Processed Solar and AP Index Store'''
 
 class Indexer(object):
 
@@ -22,55 +23,97 @@ class Indexer(object):
         
         self.__date = date
 
-        self.__AP_filepath = \
-            '\\'.join(os.path.dirname(os.path.abspath(__file__)).split('\\')[:-4]) \
-            + '\\data\\nrlmsise00_dataprocessed\\nrlmsise00_AP_processed.txt'
-        self.__F107_filepath = \
-            '\\'.join(os.path.dirname(os.path.abspath(__file__)).split('\\')[:-4]) \
-            + '\\data\\nrlmsise00_dataprocessed\\nrlmsise00_f107datapros.txt'
+        '''Indices are read from the memory-mapped IndexStore, built from the Processed txt files on first use'''
+        self.__store = open_store()
+        data = self.__store.return_data()
+        day = self.__store.dayidx(self.__date)
 
-        self.__apdf = self.__loadcsv(self.__AP_filepath)
-        self.__f107df = self.__loadcsv(self.__F107_filepath)
+        self.__apdata = np.array(data[AP_DAILY:, day])
+        if np.isnan(self.__apdata[0]) or day == 0:
+            raise ValueError('No indices stored for ' + str(self.__date))
 
-        self.__aplastdf = self.__valuefinderap(self.__apdf, self.__date.year, self.__date.month, self.__date.day)
-        self.return_datalst()
-        self.__f107df = self.__valuefindersolar(self.__f107df, self.__date.year, self.__date.month, self.__date.day - 1)
+        sec = 60*60*self.__date.hour+60*self.__date.minute+self.__date.second
 
-        self.__f107 = self.__interpl(np.array(self.__f107df['F107']),24*60*60,60*60*self.__date.hour+
-                                     60*self.__date.minute+self.__date.second)
-        self.__f107a = self.__interpl(np.array(self.__f107df['F107A']),24*60*60,60*60*self.__date.hour+
-                                      60*self.__date.minute+self.__date.second)
+        '''Solar Flux is interpolated linearly between the previous and the current Day'''
+        self.__f107 = self.__interpl(data[F107, day-1:day+1], 24*60*60, sec)
+        self.__f107a = self.__interpl(data[F107A, day-1:day+1], 24*60*60, sec)
 
-        dt3h = int((60*60*self.__date.hour+60*self.__date.minute+self.__date.second)/(3*60*60))
-        
-        self.__ap_daily = float(self.__aplastdf['ap_daily'])
-        self.__ap1 = float(self.__aplastdf['ap'+str(20+dt3h)])
-        self.__ap2 = float(self.__aplastdf['ap'+str(19+dt3h)])
-        self.__ap3 = float(self.__aplastdf['ap'+str(18+dt3h)])
-        self.__ap4 = float(self.__aplastdf['ap'+str(17+dt3h)])
-        self.__apavg1 = np.mean(self.__aplastdf.to_numpy()[0][11+dt3h:18+dt3h])
-        self.__apavg2 = np.mean(self.__aplastdf.to_numpy()[0][3+dt3h:10+dt3h])
+        dt3h = int(sec/(3*60*60))
+
+        self.__ap_daily = float(self.__apdata[0])
+        self.__ap1 = float(self.__apdata[20+dt3h])
+        self.__ap2 = float(self.__apdata[19+dt3h])
+        self.__ap3 = float(self.__apdata[18+dt3h])
+        self.__ap4 = float(self.__apdata[17+dt3h])
+        self.__apavg1 = np.mean(self.__apdata[9+dt3h:16+dt3h])
+        self.__apavg2 = np.mean(self.__apdata[1+dt3h:8+dt3h])
 
     def return_datalst(self):
-        return self.__aplastdf.to_numpy()
+        '''AP Data of the Date in the form: [AP_Daily,AP1,...,AP27]'''
+        return self.__apdata
 
     def return_indices(self):
         return [self.__date.isoformat(' '),self.__f107,self.__f107a,self.__ap_daily,self.__ap1,self.__ap2,
                          self.__ap3,self.__ap4,self.__apavg1,self.__apavg2]
 
-    def __loadcsv(self, filepath: str):
-        return pd.read_csv(filepath)
-
-    def __valuefindersolar(self, dataframe: pd.DataFrame, year:int, month:int, day:int):
-        indices1 = dataframe[dataframe.date == dt.date(year,month,day).isoformat()]
-        indices2 = dataframe[dataframe.date == dt.date(year,month,day+1).isoformat()]
-        return pd.concat([indices1,indices2])
-
-    def __valuefinderap(self, dataframe: pd.DataFrame, year:int, month:int, day:int):
-        return dataframe[dataframe.date == dt.date(year,month,day).isoformat()]
-
     def __interpl(self, data:np.array, dt:int, sec:int):
-        return data[0]+sec*(data[1]-data[0])/dt
+        return float(data[0]+sec*(data[1]-data[0])/dt)
+
+    @staticmethod
+    def for_times(times: np.ndarray):
+        '''Function for_times'''
+        '''Evaluates the Indices for a whole Array of Times in one pass'''
+        '''INPUT 1: Array of datetime64 (or anything np.datetime64 accepts, e.g. a list of datetimes)'''
+
+        '''OUT 1: Array of shape (N,9), rows in the form: [F107,F107A,AP_Daily,AP1,AP2,AP3,AP4,APAVG1,APAVG2],
+        row i is identical to Indexer(times[i]).return_indices()[1:]'''
+
+        times = np.asarray(times, dtype='datetime64[s]').ravel()
+        days = times.astype('datetime64[D]')
+        sec = (times - days).astype(np.int64)
+
+        store = open_store()
+        data = store.return_data()
+        day = store.dayidxs(days.astype(np.int64))
+
+        apdata = data[AP_DAILY:, day]
+        if np.isnan(apdata[0]).any() or (day == 0).any():
+            raise ValueError('No indices stored for ' + str(times[np.isnan(apdata[0]) | (day == 0)][0]))
+
+        indices = np.empty([len(times), 9])
+
+        '''Solar Flux is interpolated linearly between the previous and the current Day'''
+        indices[:, 0] = data[F107, day-1] + sec*(data[F107, day]-data[F107, day-1])/(24*60*60)
+        indices[:, 1] = data[F107A, day-1] + sec*(data[F107A, day]-data[F107A, day-1])/(24*60*60)
+
+        '''AP Values of the current and previous 3 hour Slots, Slot dt3h of the Day is AP(20+dt3h)'''
+        dt3h = sec//(3*60*60)
+        col = np.arange(len(times))
+        indices[:, 2] = apdata[0]
+        for i in range(4):
+            indices[:, 3+i] = apdata[20+dt3h-i, col]
+        indices[:, 7] = np.mean(apdata[9+dt3h+np.arange(7)[:, None], col], axis=0)
+        indices[:, 8] = np.mean(apdata[1+dt3h+np.arange(7)[:, None], col], axis=0)
+        return indices
+
+    @staticmethod
+    def for_slots(start: dt.datetime, seconds: np.ndarray, cadence: int = 3*60*60):
+        '''Function for_slots'''
+        '''Indices for many Times refreshed once per Slot, the Indices are evaluated once for every Slot and looked
+        up for every Time'''
+        '''INPUT 1: Start Date (datetime class)'''
+        '''INPUT 2: Array of N Times [s] after the Start Date'''
+        '''INPUT 3: Slot Length [s], Slots start at Multiples of the Slot Length after Midnight of the Start Date;
+        the default are the 3 hour AP Slots'''
+
+        '''OUT 1: Array of shape (N,9), row i holds the Indices of for_times at the Start of the Slot of Time i'''
+
+        day0 = np.datetime64(start.date(), 's')
+        sec = (np.datetime64(start, 's') - day0).astype(np.int64) + np.asarray(seconds, dtype=float).ravel()
+        slot = np.floor(sec/cadence).astype(np.int64)
+        first = slot.min()
+        table = Indexer.for_times(day0 + (np.arange(first, slot.max()+1)*int(cadence)).astype('timedelta64[s]'))
+        return table[slot - first]
 
 if __name__ == "__main__":
     '''Check Indices for 2013/02/03 - 23:00:00'''
@@ -83,3 +126,6 @@ if __name__ == "__main__":
     '''Return Indices for Requested Date'''
     a = Indexer(date).return_indices()
 
+    '''Return Indices every 10 minutes of the Requested Day'''
+    b = Indexer.for_times(np.datetime64(date.date()) + np.arange(0, 24*60*60, 600).astype('timedelta64[s]'))
+
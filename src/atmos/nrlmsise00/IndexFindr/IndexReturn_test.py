@@ -0,0 +1,41 @@
+"""
+Checks the batched index lookups of Indexer against single Indexer calls.
+"""
+
+import datetime as dt
+import numpy as np
+import pytest
+
+from src.atmos.nrlmsise00.IndexFindr.IndexReturn import Indexer
+
+
+def test_for_times():
+    '''Every Row equals Indexer at its Date, across Day and AP Slot Boundaries and Years'''
+    rng = np.random.default_rng(0)
+    dates = [dt.datetime(2008, 6, 2) + dt.timedelta(seconds=int(s)) for s in rng.uniform(0, 3*86400, 40)]
+    dates += [dt.datetime(1990, 1, 1), dt.datetime(2013, 2, 10, 23, 59, 59), dt.datetime(2017, 12, 31, 21)]
+    indices = Indexer.for_times(dates)
+    assert indices.shape == (len(dates), 9)
+    for row, date in zip(indices, dates):
+        assert row.tolist() == Indexer(date).return_indices()[1:]
+
+    '''datetime64 Input gives the same Rows'''
+    assert np.array_equal(Indexer.for_times(np.array(dates, dtype='datetime64[s]')), indices)
+
+
+def test_for_times_range():
+    with pytest.raises(ValueError):
+        Indexer.for_times([dt.datetime(2008, 6, 2), dt.datetime(2030, 1, 1)])
+
+
+def test_for_slots():
+    '''Every Time gets the Indices of the Start of its Slot'''
+    start = dt.datetime(2008, 6, 2, 7, 20)
+    seconds = np.arange(0, 2*86400, 600.)
+    for cadence in (3*60*60, 3600, 86400):
+        indices = Indexer.for_slots(start, seconds, cadence)
+        for row, sec in zip(indices[::7], seconds[::7]):
+            date = start + dt.timedelta(seconds=sec)
+            midnight = dt.datetime(date.year, date.month, date.day)
+            slot = midnight + dt.timedelta(seconds=(date - midnight).seconds//cadence*cadence)
+            assert row.tolist() == Indexer(slot).return_indices()[1:]
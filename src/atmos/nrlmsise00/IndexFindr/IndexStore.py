@@ -0,0 +1,131 @@
+'''Importing Required Modules'''
+import numpy as np
+import os
+import datetime as dt
+
+'''Binary Store of the Processed Solar and AP Indices, memory-mapped and keyed by Day Number'''
+
+'''Default Filepaths of the Processed Index Data and of the Store built from it'''
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))), 'data', 'nrlmsise00_dataprocessed')
+AP_FILEPATH = os.path.join(DATA_PATH, 'nrlmsise00_AP_processed.txt')
+F107_FILEPATH = os.path.join(DATA_PATH, 'nrlmsise00_f107datapros.txt')
+STORE_FILEPATH = os.path.join(DATA_PATH, 'nrlmsise00_indices.npy')
+
+'''Rows of the Store, every Row is one Column of the Index Data with one Entry per Day'''
+COLUMNS = ['day', 'F107', 'F107A', 'ap_daily'] + ['ap' + str(i) for i in range(1, 28)]
+DAY, F107, F107A, AP_DAILY, AP1 = 0, 1, 2, 3, 4
+
+_stores = {}
+
+
+def build_store(ap_filepath: str = AP_FILEPATH, f107_filepath: str = F107_FILEPATH,
+                store_filepath: str = STORE_FILEPATH):
+    '''Function build_store'''
+    '''Converts the Processed AP and Solar Flux txt files into the binary Store'''
+    '''PARAM 1: Filepath of processed AP data'''
+    '''PARAM 2: Filepath of processed solar flux data'''
+    '''PARAM 3: Filepath to save the Store'''
+
+    '''The Store holds an array of shape (len(COLUMNS), days), every Day from the first to the last Day in
+    either file has a Column; Days without Solar Flux data are interpolated, Days without AP data are NaN'''
+
+    '''pandas is only needed to build the Store, reading it needs numpy alone'''
+    import pandas as pd
+
+    apdf = pd.read_csv(ap_filepath, index_col=0)
+    f107df = pd.read_csv(f107_filepath, index_col=0)
+    apdf.index = pd.to_datetime(apdf.pop('date'))
+    f107df.index = pd.to_datetime(f107df.pop('date'))
+
+    days = pd.date_range(min(apdf.index[0], f107df.index[0]), max(apdf.index[-1], f107df.index[-1]), freq='D')
+    f107df = f107df.reindex(days).interpolate(limit_area='inside')
+    apdf = apdf.reindex(days)
+
+    '''The Store is written to a temporary File in the same Directory and moved into place, so readers never see a
+    partly written Store; Processes building at the same time write identical Stores and the last one replaces the
+    others, if the Store cannot be replaced (e.g. it is mapped by another Process on Windows) the first one is kept'''
+    tmp_filepath = '%s.%d.tmp' % (store_filepath, os.getpid())
+    try:
+        store = np.lib.format.open_memmap(tmp_filepath, mode='w+', dtype=np.float64, shape=(len(COLUMNS), len(days)))
+        store[DAY] = days.values.astype('datetime64[D]').astype(np.int64)
+        store[F107] = f107df['F107']
+        store[F107A] = f107df['F107A']
+        store[AP_DAILY:] = apdf[COLUMNS[AP_DAILY:]].to_numpy().T
+        store.flush()
+        del store
+        try:
+            os.replace(tmp_filepath, store_filepath)
+        except OSError:
+            if not store_valid(store_filepath):
+                raise
+    finally:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+
+
+def store_valid(store_filepath: str = STORE_FILEPATH):
+    '''Function store_valid'''
+    '''True if the File at the Filepath is a complete Store: readable, float64 and of shape (len(COLUMNS), days)'''
+    try:
+        data = np.load(store_filepath, mmap_mode='r')
+    except (OSError, ValueError, EOFError):
+        return False
+    return data.dtype == np.float64 and data.ndim == 2 and data.shape[0] == len(COLUMNS) and data.shape[1] > 0
+
+
+def open_store(store_filepath: str = STORE_FILEPATH, ap_filepath: str = AP_FILEPATH,
+               f107_filepath: str = F107_FILEPATH):
+    '''Function open_store'''
+    '''Returns the IndexStore at the given Filepath, building it first if missing, incomplete or out of date'''
+    '''PARAM 1: Filepath of the Store'''
+    '''PARAM 2: Filepath of processed AP data the Store is built from'''
+    '''PARAM 3: Filepath of processed solar flux data the Store is built from'''
+
+    '''Open the Store once in the parent Process before starting a Process Pool, so the Workers find it built'''
+    if store_filepath not in _stores:
+        if not store_valid(store_filepath) or \
+                os.path.getmtime(store_filepath) < max(os.path.getmtime(ap_filepath), os.path.getmtime(f107_filepath)):
+            build_store(ap_filepath, f107_filepath, store_filepath)
+        _stores[store_filepath] = IndexStore(store_filepath)
+    return _stores[store_filepath]
+
+
+class IndexStore(object):
+
+    def __init__(self, store_filepath: str = STORE_FILEPATH):
+        '''Class IndexStore'''
+        '''INPUT 1: Filepath of a Store written by build_store'''
+
+        '''Row k of a Column holds the Indices of Day first_day + k, Days are counted from 1970-01-01'''
+
+        self.__data = np.load(store_filepath, mmap_mode='r')
+        self.__first = int(self.__data[DAY, 0])
+        self.__days = self.__data.shape[1]
+
+    def return_data(self):
+        return self.__data
+
+    def return_range(self):
+        return (np.datetime64(self.__first, 'D'), np.datetime64(self.__first + self.__days - 1, 'D'))
+
+    def dayidx(self, date):
+        '''Returns the Column Index of a date or datetime'''
+        idx = (date.toordinal() - dt.date(1970, 1, 1).toordinal()) - self.__first
+        if not 0 <= idx < self.__days:
+            raise ValueError('No indices stored for ' + str(date))
+        return idx
+
+    def dayidxs(self, days: np.ndarray):
+        '''Returns the Column Indices of an Array of Day Numbers counted from 1970-01-01'''
+        idx = np.asarray(days, dtype=np.int64) - self.__first
+        if idx.size and (idx.min() < 0 or idx.max() >= self.__days):
+            raise ValueError('No indices stored for some of the requested dates, stored range is ' +
+                             ' to '.join(str(i) for i in self.return_range()))
+        return idx
+
+
+if __name__ == "__main__":
+    '''Build the Store from the Processed txt files'''
+    build_store()
+    print(IndexStore().return_range())
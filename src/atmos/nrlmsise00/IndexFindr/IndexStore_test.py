@@ -0,0 +1,42 @@
+"""
+Checks that the index store is built once and completely when several
+processes open it at the same time, and that broken stores are rebuilt.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+from src.atmos.nrlmsise00.IndexFindr.IndexStore import open_store, store_valid, build_store, COLUMNS
+
+
+def open_range(store_filepath):
+    '''Opens the Store in a Worker and reads its first and last Day'''
+    data = open_store(store_filepath).return_data()
+    return int(data[0, 0]), int(data[0, -1]), data.shape
+
+
+def test_open_store_concurrent(tmp_path):
+    store_filepath = os.path.join(str(tmp_path), 'indices.npy')
+    with ProcessPoolExecutor(4) as pool:
+        ranges = list(pool.map(open_range, [store_filepath]*8))
+    assert len(set(ranges)) == 1 and ranges[0][2][0] == len(COLUMNS)
+    assert store_valid(store_filepath)
+    assert os.listdir(str(tmp_path)) == ['indices.npy']
+
+
+def test_open_store_rebuilds_broken(tmp_path):
+    '''An empty File with a fresh modification time, as left by an interrupted Build, is rebuilt'''
+    store_filepath = os.path.join(str(tmp_path), 'indices.npy')
+    open(store_filepath, 'wb').close()
+    assert not store_valid(store_filepath)
+    assert open_store(store_filepath).return_data().shape[0] == len(COLUMNS)
+
+    '''A Store of the wrong Shape is not valid either'''
+    wrong_filepath = os.path.join(str(tmp_path), 'wrong.npy')
+    np.save(wrong_filepath, np.zeros((3, 10)))
+    assert not store_valid(wrong_filepath)
+
+    ref_filepath = os.path.join(str(tmp_path), 'ref.npy')
+    build_store(store_filepath=ref_filepath)
+    assert np.array_equal(np.load(ref_filepath), np.load(store_filepath), equal_nan=True)
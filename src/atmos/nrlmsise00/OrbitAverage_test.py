@@ -0,0 +1,42 @@
+"""
+Checks the quadrature of OrbitAverage.py against a dense uniform average over
+one revolution and the memoization of its results.
+"""
+
+import numpy as np
+
+from src.atmos.nrlmsise00.model.nrlmsise_00_vec import gtd7_vec
+from src.atmos.nrlmsise00.OrbitAverage import orbit_average, quadrature, doy_bucket, memo_info, clear_memo
+
+
+def dense_average(alt, inc, lst_node, doy, f107, ap, n=4000):
+    u = 2*np.pi*(np.arange(n) + 0.5)/n
+    inc = np.radians(inc)
+    lat = np.degrees(np.arcsin(np.sin(inc)*np.sin(u)))
+    lst = (lst_node + np.degrees(np.arctan2(np.cos(inc)*np.sin(u), np.cos(u)))/15) % 24
+    rho = gtd7_vec(doy, lst*60*60, alt, lat, 0.0, f107, f107, ap, lst=lst)[0][:, 5]
+    return rho.mean(), rho.min(), rho.max()
+
+
+def test_quadrature():
+    u, w = quadrature(4)
+    assert len(u) == 16 and np.isclose(w.sum(), 1.0)
+    assert (0 < u).all() and (u < 2*np.pi).all()
+
+
+def test_orbit_average():
+    for alt, inc, lst_node, ap in ((250, 94.7, 10.5, 15), (400, 51.6, 3.0, 50), (180, 97.0, 18.0, 4)):
+        avg, lo, hi = orbit_average(alt, inc, lst_node, doy=doy_bucket(172), f107=150, ap=ap)
+        ref = dense_average(alt, inc, lst_node, doy_bucket(172), 150, ap)
+        assert abs(avg/ref[0] - 1) < 1e-3
+        assert ref[1] <= lo <= avg <= hi <= ref[2]
+        assert abs(lo/ref[1] - 1) < 0.05 and abs(hi/ref[2] - 1) < 0.05
+
+
+def test_memo():
+    clear_memo()
+    a = orbit_average(250, 94.7, 10.5, doy=170, f107=150, ap=15)
+    b = orbit_average(250, 94.7, 10.5, doy=172, f107=150, ap=15)
+    assert a == b
+    info = memo_info()
+    assert info.hits == 1 and info.misses == 1
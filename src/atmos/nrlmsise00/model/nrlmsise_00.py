@@ -30,54 +30,104 @@ This is the main program that contains all the functions
 
 from src.atmos.nrlmsise00.model.nrlmsise_00_header import *
 from math import *
+from bisect import bisect_left, bisect_right
+import warnings
+import numpy as np
 
 """
 /* ------------------------------------------------------------------- */
-/* ------------------------- SHARED VARIABLES ------------------------ */
+/* ------------------------------ BACKEND ---------------------------- */
 /* ------------------------------------------------------------------- */
 """
+BACKENDS = ('python', 'numba')
+_numba_available = None
+
+def select_backend(backend):
+    '''
+    Returns the backend that evaluates the model, 'numba' needs the numba
+    package and becomes 'python' with a warning when it is not installed.
+    '''
+    global _numba_available
+    if backend not in BACKENDS:
+        raise ValueError("backend must be one of " + ", ".join(BACKENDS))
+    if backend == 'numba':
+        if _numba_available is None:
+            try:
+                import numba
+                _numba_available = True
+            except ImportError:
+                _numba_available = False
+                warnings.warn("numba is not installed, using the python backend of NRLMSISE-00")
+        if not _numba_available:
+            return 'python'
+    return backend
+
 
-#/* PARMB */
-gsurf = [0.0];
-re = [0.0];
-
-#/* GTS3C */
-dd = 0.0;
-
-#/* DMIX */
-dm04 = 0.0
-dm16 = 0.0
-dm28 = 0.0
-dm32 = 0.0
-dm40 = 0.0
-dm01 = 0.0
-dm14 = 0.0
-
-#/* MESO7 */
-meso_tn1 = [0.0 for _ in range(5)];
-meso_tn2 = [0.0 for _ in range(4)];
-meso_tn3 = [0.0 for _ in range(5)];
-meso_tgn1 = [0.0 for _ in range(2)];
-meso_tgn2 = [0.0 for _ in range(2)];
-meso_tgn3 = [0.0 for _ in range(2)];
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------- SHARED VARIABLES ------------------------ */
+/* ------------------------------------------------------------------- */
+"""
 
 #/* POWER7 */
 #/* LOWER7 */
-#Dont to need to do anyt of the externs, they are all here
-from src.atmos.nrlmsise00.model.nrlmsise_00_data import *
+#/* the coefficient tables are read from nrlmsise_00_data.npz on the first call, see nrlmsise_00_tables.py */
+from src.atmos.nrlmsise00.model.nrlmsise_00_tables import load_tables
 
 
-#/* LPOLY */
-dfa = 0.0
-plg = [[0.0 for _ in range(9)] for _ in range(4)];
-ctloc = 0.0
-stloc = 0.0
-c2tloc = 0.0
-s2tloc = 0.0
-s3tloc = 0.0
-c3tloc = 0.0
-apdf = 0.0
-apt = [0.0 for _ in range(4)]
+class nrlmsise_state(object):
+    """
+ *   The shared variables of the C code (PARMB, GTS3C, DMIX, MESO7, LPOLY).
+ *   gtd7 creates a fresh state for every call unless one is passed in, so
+ *   the model is re-entrant and can be evaluated from several threads at
+ *   the same time. An evaluator may pass its own state to reuse the lists.
+ """
+    def __init__(self):
+        #/* flags set up by tselec for this state, see gtd7 */
+        self.flags = None
+
+        #/* PARMB */
+        self.gsurf = [0.0]
+        self.re = [0.0]
+
+        #/* GTS3C */
+        self.dd = 0.0
+
+        #/* spline coefficients of the current evaluation, see spline_nodes */
+        self.splines = {}
+
+        #/* DMIX */
+        self.dm04 = 0.0
+        self.dm16 = 0.0
+        self.dm28 = 0.0
+        self.dm32 = 0.0
+        self.dm40 = 0.0
+        self.dm01 = 0.0
+        self.dm14 = 0.0
+
+        #/* MESO7 */
+        self.meso_tn1 = [0.0 for _ in range(5)]
+        self.meso_tn2 = [0.0 for _ in range(4)]
+        self.meso_tn3 = [0.0 for _ in range(5)]
+        self.meso_tgn1 = [0.0 for _ in range(2)]
+        self.meso_tgn2 = [0.0 for _ in range(2)]
+        self.meso_tgn3 = [0.0 for _ in range(2)]
+
+        #/* LPOLY */
+        self.dfa = 0.0
+        self.plg = [[0.0 for _ in range(9)] for _ in range(4)]
+        self.ctloc = 0.0
+        self.stloc = 0.0
+        self.c2tloc = 0.0
+        self.s2tloc = 0.0
+        self.s3tloc = 0.0
+        self.c3tloc = 0.0
+        self.apdf = 0.0
+        self.apt = [0.0 for _ in range(4)]
+
+        #/* thermospheric input and output of gts7 used by gtd7 */
+        self.tinput = nrlmsise_input()
+        self.soutput = nrlmsise_output()
 
 
 #since rgas is used eerywehre usignthe same variable, ill make it glboal
@@ -177,10 +227,10 @@ def ccor2(alt, r, h1, zh, h2):
 /* ------------------------------- SCALH ----------------------------- */
 /* ------------------------------------------------------------------- */
 """
-def scalh(alt, xm, temp):
+def scalh(alt, xm, temp, state):
     #rgas = 831.44621    #maybe make this a global constant?
     rgas = 831.4
-    g = gsurf[0] / (pow((1.0 + alt/re[0]),2.0))
+    g = state.gsurf[0] / (pow((1.0 + alt/state.re[0]),2.0))
     g = rgas * temp / (g * xm)
     return g
 
@@ -226,36 +276,38 @@ def dnet(dd, dm, zhm, xmm, xm):
 /* ------------------------------- SPLINI ---------------------------- */
 /* ------------------------------------------------------------------- */
 '''
-def splini(xa, ya, y2a, n, x, y):
+def splini(coeffs, x):
     '''
 /*      INTEGRATE CUBIC SPLINE FUNCTION FROM XA(1) TO X
- *       XA,YA: ARRAYS OF TABULATED FUNCTION IN ASCENDING ORDER BY X
- *       Y2A: ARRAY OF SECOND DERIVATIVES
- *       N: SIZE OF ARRAYS XA,YA,Y2A
- *       X: ABSCISSA ENDPOINT FOR INTEGRATION
- *       Y: OUTPUT VALUE
+ *       COEFFS: SPLINE_COEFFS OF THE TABULATED FUNCTION
+ *       X: ABSCISSA ENDPOINT FOR INTEGRATION, SCALAR OR ARRAY
+ *       RETURNS THE INTEGRAL
+ *       The integrals over the whole intervals are precomputed, only the
+ *       interval holding X is integrated here. Beyond the last node the
+ *       last interval is extrapolated, as in the C code.
  */
  '''
-    yi = 0
-    klo = 0
-    khi = 1
-    while((x>xa[klo]) and (khi<n)):
-        xx = x
-        if(khi < (n-1)):
-            if (x < xa[khi]):
-                xx = x
-            else:
-                xx = xa[khi]
-        h = xa[khi] - xa[klo]
-        a = (xa[khi] - xx)/h
-        b = (xx - xa[klo])/h
-        a2 = a*a
-        b2 = b*b
-        yi += ((1.0 - a2) * ya[klo] / 2.0 + b2 * ya[khi] / 2.0 + ((-(1.0+a2*a2)/4.0 + a2/2.0) * y2a[klo] + (b2*b2/4.0 - b2/2.0) * y2a[khi]) * h * h / 6.0) * h;
-        klo += 1;
-        khi += 1;
-    y[0] = yi
-    return #yi
+    if np.ndim(x) == 0:
+        #/* single abscissa, plain floats are faster than numpy scalars */
+        xa, ya, y2a, h, yi = coeffs.lists
+        klo = min(bisect_left(xa, x) - 1, len(xa) - 2)
+        if klo < 0:
+            return 0.0
+    else:
+        xa, ya, y2a, h, yi = coeffs.xa, coeffs.ya, coeffs.y2a, coeffs.h, coeffs.yi
+        klo = np.minimum(np.searchsorted(xa, x, side='left') - 1, len(xa) - 2)
+        inside = klo >= 0
+        klo = np.maximum(klo, 0)
+    khi = klo + 1
+    h = h[klo]
+    a = (xa[khi] - x)/h
+    b = (x - xa[klo])/h
+    a2 = a*a
+    b2 = b*b
+    y = yi[klo] + ((1.0 - a2) * ya[klo] / 2.0 + b2 * ya[khi] / 2.0 + ((-(1.0+a2*a2)/4.0 + a2/2.0) * y2a[klo] + (b2*b2/4.0 - b2/2.0) * y2a[khi]) * h * h / 6.0) * h
+    if np.ndim(x) == 0:
+        return y
+    return np.where(inside, y, 0.0)
 
 
 '''
@@ -263,34 +315,28 @@ def splini(xa, ya, y2a, n, x, y):
 /* ------------------------------- SPLINT ---------------------------- */
 /* ------------------------------------------------------------------- */
 '''
-def splint(xa, ya, y2a, n, x, y):
+def splint(coeffs, x):
     '''
 /*      CALCULATE CUBIC SPLINE INTERP VALUE
  *       ADAPTED FROM NUMERICAL RECIPES BY PRESS ET AL.
- *       XA,YA: ARRAYS OF TABULATED FUNCTION IN ASCENDING ORDER BY X
- *       Y2A: ARRAY OF SECOND DERIVATIVES
- *       N: SIZE OF ARRAYS XA,YA,Y2A
- *       X: ABSCISSA FOR INTERPOLATION
- *       Y: OUTPUT VALUE
+ *       COEFFS: SPLINE_COEFFS OF THE TABULATED FUNCTION
+ *       X: ABSCISSA FOR INTERPOLATION, SCALAR OR ARRAY
+ *       RETURNS THE INTERPOLATED VALUE
+ *       The bisection search of the C code is a searchsorted on the nodes.
  */
  '''
-    klo = 0
-    khi = n-1
-
-    while((khi-klo)>1):
-        k=int((khi+klo)/2);
-        if (xa[k]>x):
-            khi = k
-        else:
-            klo = k
-    h = xa[khi] - xa[klo];
-    if (h==0.0):
-        print("bad XA input to splint")
+    if np.ndim(x) == 0:
+        #/* single abscissa, plain floats are faster than numpy scalars */
+        xa, ya, y2a, h, _ = coeffs.lists
+        klo = min(max(bisect_right(xa, x) - 1, 0), len(xa) - 2)
+    else:
+        xa, ya, y2a, h = coeffs.xa, coeffs.ya, coeffs.y2a, coeffs.h
+        klo = np.clip(np.searchsorted(xa, x, side='right') - 1, 0, len(xa) - 2)
+    khi = klo + 1
+    h = h[klo]
     a = (xa[khi] - x)/h;
     b = (x - xa[klo])/h;
-    yi = a * ya[klo] + b * ya[khi] + ((a*a*a - a) * y2a[klo] + (b*b*b - b) * y2a[khi]) * h * h/6.0;
-    y[0] = yi #may not need this
-    return #yi #or this
+    return a * ya[klo] + b * ya[khi] + ((a*a*a - a) * y2a[klo] + (b*b*b - b) * y2a[khi]) * h * h/6.0;
 
 
 '''
@@ -347,21 +393,74 @@ def spline(x, y, n, yp1, ypn, y2):
     return
 
 
+'''
+/* ------------------------------------------------------------------- */
+/* --------------------------- SPLINE COEFFS ------------------------- */
+/* ------------------------------------------------------------------- */
+'''
+class spline_coeffs(object):
+    '''
+/*       COEFFICIENTS OF A CUBIC SPLINE, COMPUTED ONCE AND USED BY
+ *       SPLINT AND SPLINI FOR ANY NUMBER OF ABSCISSAE
+ *       XA,YA: NODES OF THE TABULATED FUNCTION IN ASCENDING ORDER BY X
+ *       Y2A: SECOND DERIVATIVES, SEE SPLINE
+ *       H: NODE SPACING
+ *       YI: INTEGRAL FROM XA(1) TO EVERY NODE
+ *       LISTS: THE SAME AS PYTHON LISTS, FOR SINGLE ABSCISSAE
+ */
+ '''
+    def __init__(self, xs, ys, yp1, ypn):
+        n = len(xs)
+        y2out = [0.0 for _ in range(n)]
+        spline(xs, ys, n, yp1, ypn, y2out)
+        self.xa = np.array(xs, dtype=float)
+        self.ya = np.array(ys, dtype=float)
+        self.y2a = np.array(y2out, dtype=float)
+        self.h = np.diff(self.xa)
+        whole = (self.ya[:-1] / 2.0 + self.ya[1:] / 2.0 + (-self.y2a[:-1] / 4.0 - self.y2a[1:] / 4.0) * self.h * self.h / 6.0) * self.h
+        self.yi = np.concatenate(([0.0], np.cumsum(whole)))
+        self.lists = (list(xs), list(ys), y2out, self.h.tolist(), self.yi.tolist())
+
+
 '''
 /* ------------------------------------------------------------------- */
 /* ------------------------------- DENSM ----------------------------- */
 /* ------------------------------------------------------------------- */
 '''
-def zeta(zz, zl):
-    return ((zz-zl)*(re[0]+zl)/(re[0]+zz))    #re is the global variable
+def zeta(zz, zl, re):
+    return ((zz-zl)*(re[0]+zl)/(re[0]+zz))    #re is state.re
 
-def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2):
+def spline_nodes(zn, tn, tgn, state):
+    '''
+/*      Spline of the inverse temperature at the nodes zn, in normalised
+ *      geopotential height. The nodes only change between evaluations, so
+ *      the coefficients are kept in state.splines for the calls of one
+ *      gts7/gtd7 evaluation (the species profiles share their nodes).
+ *      Returns the coefficients and the geopotential height of the last node.
+ */
+ '''
+    re = state.re
+    key = (re[0], tuple(zn), tuple(tn), tuple(tgn))
+    if key not in state.splines:
+        mn = len(zn)
+        z1 = zn[0]
+        z2 = zn[mn-1]
+        t1 = tn[0]
+        t2 = tn[mn-1]
+        zgdif = zeta(z2, z1, re)
+        xs = [zeta(zn[k], z1, re) / zgdif for k in range(mn)]
+        ys = [1.0 / tn[k] for k in range(mn)]
+        yd1 = -tgn[0] / (t1*t1) * zgdif
+        yd2 = -tgn[1] / (t2*t2) * zgdif * pow(((re[0]+z2)/(re[0]+z1)),2.0)
+        state.splines[key] = (spline_coeffs(xs, ys, yd1, yd2), zgdif)
+    return state.splines[key]
+
+def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2, state):
     '''
 /*      Calculate Temperature and Density Profiles for lower atmos.  */
 '''
-    xs = [0.0 for _ in range(10)]
-    ys = [0.0 for _ in range(10)]
-    y2out = [0.0 for _ in range(10)]
+    gsurf = state.gsurf
+    re = state.re
     rgas = 831.4
     #rgas = 831.44621    #maybe make this a global constant?
     densm_tmp=d0
@@ -376,38 +475,23 @@ def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2):
         z=alt
     else:
         z=zn2[mn2-1];
-    mn=mn2;
     z1=zn2[0];
-    z2=zn2[mn-1];
     t1=tn2[0];
-    t2=tn2[mn-1];
-    zg = zeta(z, z1);
-    zgdif = zeta(z2, z1);
-
-    #/* set up spline nodes */
-    for k in range(mn):
-        xs[k]=zeta(zn2[k],z1)/zgdif;
-        ys[k]=1.0 / tn2[k];
-    yd1=-tgn2[0] / (t1*t1) * zgdif;
-    yd2=-tgn2[1] / (t2*t2) * zgdif * (pow(((re[0]+z2)/(re[0]+z1)),2.0));
-
-    #/* calculate spline coefficients */
-    spline (xs, ys, mn, yd1, yd2, y2out);   #No need to change this
+    zg = zeta(z, z1, re);
+
+    #/* spline nodes and coefficients */
+    coeffs, zgdif = spline_nodes(zn2[:mn2], tn2[:mn2], tgn2, state)
     x = zg/zgdif;
-    y = [0.0]
-    splint (xs, ys, y2out, mn, x, y);
 
     #/* temperature at altitude */
-    tz[0] = 1.0 / y[0];
+    tz[0] = 1.0 / splint(coeffs, x);
     if (xm!=0.0):
         #/* calaculate stratosphere / mesospehere density */
         glb = gsurf[0] / (pow((1.0 + z1/re[0]),2.0));
         gamm = xm * glb * zgdif / rgas;
 
         #/* Integrate temperature profile */
-        yi = [0.0]
-        splini(xs, ys, y2out, mn, x, yi);
-        expl=gamm*yi[0];
+        expl=gamm*splini(coeffs, x);
         if (expl>50.0):
             expl=50.0
 
@@ -422,41 +506,23 @@ def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2):
 
     #/* troposhere / stratosphere temperature */
     z = alt;
-    mn = mn3;
     z1=zn3[0];
-    z2=zn3[mn-1];
     t1=tn3[0];
-    t2=tn3[mn-1];
-    zg=zeta(z,z1);
-    zgdif=zeta(z2,z1);
+    zg=zeta(z,z1, re);
 
-
-
-    #/* set up spline nodes */
-    for k in range(mn):
-        xs[k] = zeta(zn3[k],z1) / zgdif;
-        ys[k] = 1.0 / tn3[k];
-    
-    yd1=-tgn3[0] / (t1*t1) * zgdif;
-    yd2=-tgn3[1] / (t2*t2) * zgdif * (pow(((re[0]+z2)/(re[0]+z1)),2.0));
-
-    #/* calculate spline coefficients */
-    spline (xs, ys, mn, yd1, yd2, y2out);
+    #/* spline nodes and coefficients */
+    coeffs, zgdif = spline_nodes(zn3[:mn3], tn3[:mn3], tgn3, state)
     x = zg/zgdif;
-    y = [0.0]
-    splint (xs, ys, y2out, mn, x, y);
 
     #/* temperature at altitude */
-    tz[0] = 1.0 / y[0];
+    tz[0] = 1.0 / splint(coeffs, x);
     if (xm!=0.0):
         #/* calaculate tropospheric / stratosphere density */
         glb = gsurf[0] / (pow((1.0 + z1/re[0]),2.0));
         gamm = xm * glb * zgdif / rgas;
 
         #/* Integrate temperature profile */
-        yi = [0.0]
-        splini(xs, ys, y2out, mn, x, yi);
-        expl=gamm*yi[0];
+        expl=gamm*splini(coeffs, x);
         if (expl>50.0):
             expl=50.0;
 
@@ -475,21 +541,19 @@ def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2):
 /* ------------------------------- DENSU ----------------------------- */
 /* ------------------------------------------------------------------- */
 '''
-def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, mn1, zn1, tn1, tgn1):
+def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, mn1, zn1, tn1, tgn1, state):
     '''
 /*      Calculate Temperature and Density Profiles for MSIS models
  *      New lower thermo polynomial
  */
  tz, zn1, tn1, and tgn1 are simulated pointers
  '''
+    gsurf = state.gsurf
+    re = state.re
     rgas = 831.4
     #rgas = 831.44621    #maybe make this a global constant?
     densu_temp = 1.0
 
-    xs = [0.0 for _ in range(5)]
-    ys = [0.0 for _ in range(5)]
-    y2out = [0.0 for _ in range(5)]
-
     #/* joining altitudes of Bates and spline */
     za=zn1[0];
     if (alt>za):
@@ -498,7 +562,7 @@ def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, mn1, zn1, tn1, tgn1):
         z=za;
 
     #/* geopotential altitude difference from ZLB */
-    zg2 = zeta(z, zlb);
+    zg2 = zeta(z, zlb, re);
     
     #/* Bates temperature */
     tt = tinf - (tinf - tlb) * exp(-s2*zg2);
@@ -516,29 +580,15 @@ def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, mn1, zn1, tn1, tgn1):
             z=alt;
         else:
             z=zn1[mn1-1];
-        mn=mn1;
         z1=zn1[0];
-        z2=zn1[mn-1];
         t1=tn1[0];
-        t2=tn1[mn-1];
         #/* geopotental difference from z1 */
-        zg = zeta (z, z1);
-        zgdif = zeta(z2, z1);
-        #/* set up spline nodes */
-        for k in range(mn):
-            xs[k] = zeta(zn1[k], z1) / zgdif;
-            ys[k] = 1.0 / tn1[k];
-        
-        #/* end node derivatives */
-        yd1 = -tgn1[0] / (t1*t1) * zgdif;
-        yd2 = -tgn1[1] / (t2*t2) * zgdif * pow(((re[0]+z2)/(re[0]+z1)),2.0);
-        #/* calculate spline coefficients */
-        spline (xs, ys, mn, yd1, yd2, y2out);
+        zg = zeta (z, z1, re);
+        #/* spline nodes and coefficients */
+        coeffs, zgdif = spline_nodes(zn1[:mn1], tn1[:mn1], tgn1, state)
         x = zg / zgdif;
-        y = [0.0]
-        splint (xs, ys, y2out, mn, x, y);
         #/* temperature at altitude */
-        tz[0] = 1.0 / y[0];
+        tz[0] = 1.0 / splint(coeffs, x);
         densu_temp = tz[0];
 
     if (xm==0):
@@ -564,9 +614,7 @@ def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, mn1, zn1, tn1, tgn1):
     gamm = xm * glb * zgdif / rgas;
 
     #/* integrate spline temperatures */
-    yi = [0]
-    splini (xs, ys, y2out, mn, x, yi);
-    expl = gamm * yi[0];
+    expl = gamm * splini(coeffs, x);
     if (expl>50.0):
         expl=50.0;
     if (tz[0]<=0):
@@ -601,11 +649,13 @@ def sg0(ex, p, ap):
                 g0(ap[6],p)*pow(ex,12.0))*(1.0-pow(ex,8.0))/(1.0-ex)))/sumex(ex);
 
 
-def globe7(p, Input, flags):
+def globe7(p, Input, flags, state):
     '''
 /*       CALCULATE G(L) FUNCTION 
  *       Upper Thermosphere Parameters */
 '''
+    plg = state.plg
+    apt = state.apt
     t = [0 for _ in range(15)]  #modified this, there was a for loop that did this
     sw9 = 1
     sr = 7.2722E-5;
@@ -656,18 +706,12 @@ def globe7(p, Input, flags):
     plg[3][6] =(11.0*c*plg[3][5]-8.*plg[3][4])/3.0;
 
     if( not (((flags.sw[7]==0) and (flags.sw[8]==0)) and (flags.sw[14] == 0))):
-        global stloc
-        stloc = sin(hr*tloc);
-        global ctloc
-        ctloc = cos(hr*tloc);
-        global s2tloc
-        s2tloc = sin(2.0*hr*tloc);
-        global c2tloc
-        c2tloc = cos(2.0*hr*tloc);
-        global s3tloc
-        s3tloc = sin(3.0*hr*tloc);
-        global c3tloc
-        c3tloc = cos(3.0*hr*tloc);
+        state.stloc = sin(hr*tloc);
+        state.ctloc = cos(hr*tloc);
+        state.s2tloc = sin(2.0*hr*tloc);
+        state.c2tloc = cos(2.0*hr*tloc);
+        state.s3tloc = sin(3.0*hr*tloc);
+        state.c3tloc = cos(3.0*hr*tloc);
 
     cd32 = cos(dr*(Input.doy-p[31]));
     cd18 = cos(2.0*dr*(Input.doy-p[17]));
@@ -680,8 +724,8 @@ def globe7(p, Input, flags):
 
     #/* F10.7 EFFECT */
     df = Input.f107 - Input.f107A;
-    global dfa
     dfa = Input.f107A - 150.0;
+    state.dfa = dfa
     t[0] =  p[19]*df*(1.0+p[59]*dfa) + p[20]*df*df + p[21]*dfa + p[29]*pow(dfa,2.0);
     f1 = 1.0 + (p[47]*dfa +p[19]*df+p[20]*df*df)*flags.swc[1];
     f2 = 1.0 + (p[49]*dfa+p[19]*df+p[20]*df*df)*flags.swc[1];
@@ -707,20 +751,20 @@ def globe7(p, Input, flags):
         t71 = (p[11]*plg[1][2])*cd14*flags.swc[5];
         t72 = (p[12]*plg[1][2])*cd14*flags.swc[5];
         t[6] = f2*((p[3]*plg[1][1] + p[4]*plg[1][3] + p[27]*plg[1][5] + t71) * \
-                   ctloc + (p[6]*plg[1][1] + p[7]*plg[1][3] + p[28]*plg[1][5] \
-                            + t72)*stloc);
+                   state.ctloc + (p[6]*plg[1][1] + p[7]*plg[1][3] + p[28]*plg[1][5] \
+                            + t72)*state.stloc);
 
 
     #/* SEMIDIURNAL */
     if (flags.sw[8]):
         t81 = (p[23]*plg[2][3]+p[35]*plg[2][5])*cd14*flags.swc[5];
         t82 = (p[33]*plg[2][3]+p[36]*plg[2][5])*cd14*flags.swc[5];
-        t[7] = f2*((p[5]*plg[2][2]+ p[41]*plg[2][4] + t81)*c2tloc +(p[8]*plg[2][2] + p[42]*plg[2][4] + t82)*s2tloc);
+        t[7] = f2*((p[5]*plg[2][2]+ p[41]*plg[2][4] + t81)*state.c2tloc +(p[8]*plg[2][2] + p[42]*plg[2][4] + t82)*state.s2tloc);
     
 
     #/* TERDIURNAL */
     if (flags.sw[14]):
-        t[13] = f2 * ((p[39]*plg[3][3]+(p[93]*plg[3][4]+p[46]*plg[3][6])*cd14*flags.swc[5])* s3tloc +(p[40]*plg[3][3]+(p[94]*plg[3][4]+p[48]*plg[3][6])*cd14*flags.swc[5])* c3tloc);
+        t[13] = f2 * ((p[39]*plg[3][3]+(p[93]*plg[3][4]+p[46]*plg[3][6])*cd14*flags.swc[5])* state.s3tloc +(p[40]*plg[3][3]+(p[94]*plg[3][4]+p[48]*plg[3][6])*cd14*flags.swc[5])* state.c3tloc);
 
 
     #/* magnetic activity based on daily ap */
@@ -750,8 +794,8 @@ def globe7(p, Input, flags):
         p45=p[44];
         if (p44<0):
             p44 = 1.0E-5;
-        global apdf
         apdf = apd + (p45-1.0)*(apd + (exp(-p44 * apd) - 1.0)/p44);
+        state.apdf = apdf
         if (flags.sw[9]):
             t[8]=apdf*(p[32]+p[45]*plg[0][2]+p[34]*plg[0][4]+ \
              (p[100]*plg[0][1]+p[101]*plg[0][3]+p[102]*plg[0][5])*cd14*flags.swc[5]+
@@ -826,11 +870,15 @@ def globe7(p, Input, flags):
 /* ------------------------------- GLOB7S ---------------------------- */
 /* ------------------------------------------------------------------- */
 '''
-def glob7s(p, Input, flags):
+def glob7s(p, Input, flags, state):
     '''
 /*    VERSION OF GLOBE FOR LOWER ATMOSPHERE 10/26/99 
  */
  '''
+    plg = state.plg
+    apt = state.apt
+    dfa = state.dfa
+    apdf = state.apdf
     pset = 2.0
     t = [0.0 for _ in range(14)]
     dr=1.72142E-2;
@@ -876,19 +924,19 @@ def glob7s(p, Input, flags):
     if (flags.sw[7]):
         t71 = p[11]*plg[1][2]*cd14*flags.swc[5];
         t72 = p[12]*plg[1][2]*cd14*flags.swc[5];
-        t[6] = ((p[3]*plg[1][1] + p[4]*plg[1][3] + t71) * ctloc + (p[6]*plg[1][1] + p[7]*plg[1][3] + t72) * stloc) ;
+        t[6] = ((p[3]*plg[1][1] + p[4]*plg[1][3] + t71) * state.ctloc + (p[6]*plg[1][1] + p[7]*plg[1][3] + t72) * state.stloc) ;
     
 
     #/* SEMIDIURNAL */
     if (flags.sw[8]):
         t81 = (p[23]*plg[2][3]+p[35]*plg[2][5])*cd14*flags.swc[5];
         t82 = (p[33]*plg[2][3]+p[36]*plg[2][5])*cd14*flags.swc[5];
-        t[7] = ((p[5]*plg[2][2] + p[41]*plg[2][4] + t81) * c2tloc + (p[8]*plg[2][2] + p[42]*plg[2][4] + t82) * s2tloc);
+        t[7] = ((p[5]*plg[2][2] + p[41]*plg[2][4] + t81) * state.c2tloc + (p[8]*plg[2][2] + p[42]*plg[2][4] + t82) * state.s2tloc);
     
 
     #/* TERDIURNAL */
     if (flags.sw[14]):
-            t[13] = p[39] * plg[3][3] * s3tloc + p[40] * plg[3][3] * c3tloc;
+            t[13] = p[39] * plg[3][3] * state.s3tloc + p[40] * plg[3][3] * state.c3tloc;
     
 
     #/* MAGNETIC ACTIVITY */
@@ -923,21 +971,45 @@ def glob7s(p, Input, flags):
 /* ------------------------------- GTD7 ------------------------------ */
 /* ------------------------------------------------------------------- */
 '''
-def gtd7(Input, flags, output):
+def gtd7(Input, flags, output, state=None, backend='python'):
+    '''
+/*   Neutral Atmosphere Empircial Model from the surface to lower
+ *   exosphere. state is an nrlmsise_state, a new one is used when None.
+ *   tselec runs on the first call with a state and flags only.
+ *   backend 'numba' evaluates the compiled model of nrlmsise_00_numba.py
+ *   (state is not used then), falling back to 'python' without numba.
+ */
+ '''
+    if backend != 'python' and select_backend(backend) == 'numba':
+        from src.atmos.nrlmsise00.model.nrlmsise_00_numba import gtd7_numba
+        gtd7_numba(Input, flags, output)
+        return
+    if state is None:
+        state = nrlmsise_state()
+    pt, pd, ps, pdl, ptl, pma, sam, ptm, pdm, pavgm = load_tables()
+    meso_tn1 = state.meso_tn1
+    meso_tgn1 = state.meso_tgn1
+    meso_tn2 = state.meso_tn2
+    meso_tgn2 = state.meso_tgn2
+    meso_tn3 = state.meso_tn3
+    meso_tgn3 = state.meso_tgn3
     mn3 = 5
     zn3 = [32.5,20.0,15.0,10.0,0.0]
     mn2 = 4
     zn2 = [72.5,55.0,45.0,32.5]
     zmix = 62.5
-    soutput = nrlmsise_output()
+    soutput = state.soutput
 
-    tselec(flags);
+    #/* the switches are set up once per state, call tselec again after changing flags.switches */
+    if state.flags is not flags:
+        tselec(flags);
+        state.flags = flags
 
     #/* Latitude variation of gravity (none for sw[2]=0) */
     xlat=Input.g_lat;
     if (flags.sw[2]==0):
         xlat=45.0;
-    glatf(xlat, gsurf, re);
+    glatf(xlat, state.gsurf, state.re);
 
     xmm = pdm[2][4];
 
@@ -947,16 +1019,17 @@ def gtd7(Input, flags, output):
     else:
         altt=zn2[0];
 
-    tmp=Input.alt;
-    Input.alt=altt;
+    #/* evaluate gts7 on the scratch input of the state so the callers Input is never modified */
+    tInput = state.tinput
+    for name in nrlmsise_input.__slots__:
+        setattr(tInput, name, getattr(Input, name))
+    tInput.alt=altt;
 
-    gts7(Input, flags, soutput);
-    altt=Input.alt;
-    Input.alt=tmp;
+    gts7(tInput, flags, soutput, state);
     if (flags.sw[0]):   #/* metric adjustment */
-        dm28m= dm28*1.0E6;
+        dm28m= state.dm28*1.0E6;
     else:
-        dm28m = dm28;
+        dm28m = state.dm28;
     output.t[0]=soutput.t[0];
     output.t[1]=soutput.t[1];
     if (Input.alt>=zn2[0]): 
@@ -971,10 +1044,10 @@ def gtd7(Input, flags, output):
 #*/
     meso_tgn2[0]=meso_tgn1[1];
     meso_tn2[0]=meso_tn1[4];
-    meso_tn2[1]=pma[0][0]*pavgm[0]/(1.0-flags.sw[20]*glob7s(pma[0], Input, flags));
-    meso_tn2[2]=pma[1][0]*pavgm[1]/(1.0-flags.sw[20]*glob7s(pma[1], Input, flags));
-    meso_tn2[3]=pma[2][0]*pavgm[2]/(1.0-flags.sw[20]*flags.sw[22]*glob7s(pma[2], Input, flags));
-    meso_tgn2[1]=pavgm[8]*pma[9][0]*(1.0+flags.sw[20]*flags.sw[22]*glob7s(pma[9], Input, flags))*meso_tn2[3]*meso_tn2[3]/(pow((pma[2][0]*pavgm[2]),2.0));
+    meso_tn2[1]=pma[0][0]*pavgm[0]/(1.0-flags.sw[20]*glob7s(pma[0], Input, flags, state));
+    meso_tn2[2]=pma[1][0]*pavgm[1]/(1.0-flags.sw[20]*glob7s(pma[1], Input, flags, state));
+    meso_tn2[3]=pma[2][0]*pavgm[2]/(1.0-flags.sw[20]*flags.sw[22]*glob7s(pma[2], Input, flags, state));
+    meso_tgn2[1]=pavgm[8]*pma[9][0]*(1.0+flags.sw[20]*flags.sw[22]*glob7s(pma[9], Input, flags, state))*meso_tn2[3]*meso_tn2[3]/(pow((pma[2][0]*pavgm[2]),2.0));
     meso_tn3[0]=meso_tn2[3];
 
     if (Input.alt<zn3[0]):
@@ -983,11 +1056,11 @@ def gtd7(Input, flags, output):
 #*         Inverse temperature a linear function of spherical harmonics
 #*/
         meso_tgn3[0]=meso_tgn2[1];
-        meso_tn3[1]=pma[3][0]*pavgm[3]/(1.0-flags.sw[22]*glob7s(pma[3], Input, flags));
-        meso_tn3[2]=pma[4][0]*pavgm[4]/(1.0-flags.sw[22]*glob7s(pma[4], Input, flags));
-        meso_tn3[3]=pma[5][0]*pavgm[5]/(1.0-flags.sw[22]*glob7s(pma[5], Input, flags));
-        meso_tn3[4]=pma[6][0]*pavgm[6]/(1.0-flags.sw[22]*glob7s(pma[6], Input, flags));
-        meso_tgn3[1]=pma[7][0]*pavgm[7]*(1.0+flags.sw[22]*glob7s(pma[7], Input, flags)) *meso_tn3[4]*meso_tn3[4]/(pow((pma[6][0]*pavgm[6]),2.0));
+        meso_tn3[1]=pma[3][0]*pavgm[3]/(1.0-flags.sw[22]*glob7s(pma[3], Input, flags, state));
+        meso_tn3[2]=pma[4][0]*pavgm[4]/(1.0-flags.sw[22]*glob7s(pma[4], Input, flags, state));
+        meso_tn3[3]=pma[5][0]*pavgm[5]/(1.0-flags.sw[22]*glob7s(pma[5], Input, flags, state));
+        meso_tn3[4]=pma[6][0]*pavgm[6]/(1.0-flags.sw[22]*glob7s(pma[6], Input, flags, state));
+        meso_tgn3[1]=pma[7][0]*pavgm[7]*(1.0+flags.sw[22]*glob7s(pma[7], Input, flags, state)) *meso_tn3[4]*meso_tn3[4]/(pow((pma[6][0]*pavgm[6]),2.0));
     
 
     #/* LINEAR TRANSITION TO FULL MIXING BELOW zn2[0] */
@@ -1000,7 +1073,7 @@ def gtd7(Input, flags, output):
     #/**** N2 density ****/
     dmr=soutput.d[2] / dm28m - 1.0;
     tz = [0.0]
-    output.d[2]=densm(Input.alt,dm28m,xmm, tz, mn3, zn3, meso_tn3, meso_tgn3, mn2, zn2, meso_tn2, meso_tgn2);
+    output.d[2]=densm(Input.alt,dm28m,xmm, tz, mn3, zn3, meso_tn3, meso_tgn3, mn2, zn2, meso_tn2, meso_tgn2, state);
     output.d[2]=output.d[2] * (1.0 + dmr*dmc);
 
     #/**** HE density ****/
@@ -1032,8 +1105,7 @@ def gtd7(Input, flags, output):
         output.d[5]=output.d[5]/1000;
 
     #/**** temperature at altitude ****/
-    global dd
-    dd = densm(Input.alt, 1.0, 0, tz, mn3, zn3, meso_tn3, meso_tgn3, mn2, zn2, meso_tn2, meso_tgn2);
+    state.dd = densm(Input.alt, 1.0, 0, tz, mn3, zn3, meso_tn3, meso_tgn3, mn2, zn2, meso_tn2, meso_tgn2, state);
     output.t[1]=tz[0];
     return
 
@@ -1043,8 +1115,8 @@ def gtd7(Input, flags, output):
 /* ------------------------------- GTD7D ----------------------------- */
 /* ------------------------------------------------------------------- */
 '''
-def gtd7d(Input, flags, output):
-    gtd7(Input, flags, output)
+def gtd7d(Input, flags, output, state=None, backend='python'):
+    gtd7(Input, flags, output, state, backend)
     output.d[5] = 1.66E-24 * (4.0 * output.d[0] + 16.0 * output.d[1] + 28.0 * output.d[2] + 32.0 * output.d[3] + 40.0 * output.d[4] + output.d[6] + 14.0 * output.d[7] + 16.0 * output.d[8]);
     if (flags.sw[0]):
         output.d[5]=output.d[5]/1000;
@@ -1056,7 +1128,7 @@ def gtd7d(Input, flags, output):
 /* -------------------------------- GHP7 ----------------------------- */
 /* ------------------------------------------------------------------- */
 '''
-def ghp7(Input, flags, output, press):
+def ghp7(Input, flags, output, press, state=None):
     bm = 1.3806E-19;
     rgas = 831.4;
     #rgas = 831.44621    #maybe make this a global constant?
@@ -1096,11 +1168,13 @@ def ghp7(Input, flags, output, press):
         z = 22.0 * pow((pl + 4.0),2.0) + 110.0;
 
     #/* iteration  loop */
+    if state is None:
+        state = nrlmsise_state()
     l = 0;
     while(True):
         l += 1;
         Input.alt = z;
-        gtd7(Input, flags, output);
+        gtd7(Input, flags, output, state);
         z = Input.alt;
         xn = output.d[0] + output.d[1] + output.d[2] + output.d[3] + output.d[4] + output.d[6] + output.d[7];
         p = bm * xn * output.t[1];
@@ -1116,7 +1190,7 @@ def ghp7(Input, flags, output, press):
         xm = output.d[5] / xn / 1.66E-24;
         if (flags.sw[0]):
             xm = xm * 1.0E3;
-        g = gsurf[0] / (pow((1.0 + z/re[0]),2.0));
+        g = state.gsurf[0] / (pow((1.0 + z/state.re[0]),2.0));
         sh = rgas * output.t[1] / (xm * g);
 
         #/* new altitude estimate using scale height */
@@ -1132,13 +1206,25 @@ def ghp7(Input, flags, output, press):
 /* ------------------------------- GTS7 ------------------------------ */
 /* ------------------------------------------------------------------- */
 '''
-def gts7(Input, flags, output):
+def gts7(Input, flags, output, state=None):
     '''
 /*     Thermospheric portion of NRLMSISE-00
  *     See GTD7 for more extensive comments
  *     alt > 72.5 km! 
  */
  '''
+    if state is None:
+        #/* called on its own, set up switches and gravity as gtd7 does */
+        state = nrlmsise_state()
+        tselec(flags)
+        xlat = Input.g_lat
+        if (flags.sw[2]==0):
+            xlat = 45.0
+        glatf(xlat, state.gsurf, state.re)
+    state.splines = {}
+    pt, pd, ps, pdl, ptl, pma, sam, ptm, pdm, pavgm = load_tables()
+    meso_tn1 = state.meso_tn1
+    meso_tgn1 = state.meso_tgn1
     zn1 = [120.0, 110.0, 100.0, 90.0, 72.5]
     mn1 = 5
     dgtr=1.74533E-2;
@@ -1154,7 +1240,7 @@ def gts7(Input, flags, output):
     #/* TINF VARIATIONS NOT IMPORTANT BELOW ZA OR ZN1(1) */
     if (Input.alt>zn1[0]):
         tinf = ptm[0]*pt[0] * \
-                    (1.0+flags.sw[16]*globe7(pt,Input,flags));
+                    (1.0+flags.sw[16]*globe7(pt, Input, flags, state));
     else:
         tinf = ptm[0]*pt[0];
     output.t[0]=tinf;
@@ -1162,20 +1248,20 @@ def gts7(Input, flags, output):
     #/*  GRADIENT VARIATIONS NOT IMPORTANT BELOW ZN1(5) */
     if (Input.alt>zn1[4]):
         g0 = ptm[3]*ps[0] * \
-            (1.0+flags.sw[19]*globe7(ps,Input,flags));
+            (1.0+flags.sw[19]*globe7(ps, Input, flags, state));
     else:
         g0 = ptm[3]*ps[0];
-    tlb = ptm[1] * (1.0 + flags.sw[17]*globe7(pd[3],Input,flags))*pd[3][0];
+    tlb = ptm[1] * (1.0 + flags.sw[17]*globe7(pd[3], Input, flags, state))*pd[3][0];
     s = g0 / (tinf - tlb);
 
 #/*      Lower thermosphere temp variations not significant for
 # *       density above 300 km */
     if (Input.alt<300.0):
-        meso_tn1[1]=ptm[6]*ptl[0][0]/(1.0-flags.sw[18]*glob7s(ptl[0], Input, flags));
-        meso_tn1[2]=ptm[2]*ptl[1][0]/(1.0-flags.sw[18]*glob7s(ptl[1], Input, flags));
-        meso_tn1[3]=ptm[7]*ptl[2][0]/(1.0-flags.sw[18]*glob7s(ptl[2], Input, flags));
-        meso_tn1[4]=ptm[4]*ptl[3][0]/(1.0-flags.sw[18]*flags.sw[20]*glob7s(ptl[3], Input, flags));
-        meso_tgn1[1]=ptm[8]*pma[8][0]*(1.0+flags.sw[18]*flags.sw[20]*glob7s(pma[8], Input, flags))*meso_tn1[4]*meso_tn1[4]/(pow((ptm[4]*ptl[3][0]),2.0));
+        meso_tn1[1]=ptm[6]*ptl[0][0]/(1.0-flags.sw[18]*glob7s(ptl[0], Input, flags, state));
+        meso_tn1[2]=ptm[2]*ptl[1][0]/(1.0-flags.sw[18]*glob7s(ptl[1], Input, flags, state));
+        meso_tn1[3]=ptm[7]*ptl[2][0]/(1.0-flags.sw[18]*glob7s(ptl[2], Input, flags, state));
+        meso_tn1[4]=ptm[4]*ptl[3][0]/(1.0-flags.sw[18]*flags.sw[20]*glob7s(ptl[3], Input, flags, state));
+        meso_tgn1[1]=ptm[8]*pma[8][0]*(1.0+flags.sw[18]*flags.sw[20]*glob7s(pma[8], Input, flags, state))*meso_tn1[4]*meso_tn1[4]/(pow((ptm[4]*ptl[3][0]),2.0));
     else:
         meso_tn1[1]=ptm[6]*ptl[0][0];
         meso_tn1[2]=ptm[2]*ptl[1][0];
@@ -1189,7 +1275,7 @@ def gts7(Input, flags, output):
     tr12 = 1.0;
 
     #/* N2 variation factor at Zlb */
-    g28=flags.sw[21]*globe7(pd[2], Input, flags);
+    g28=flags.sw[21]*globe7(pd[2], Input, flags, state);
 
     #/* VARIATION OF TURBOPAUSE HEIGHT */
     zhf=pdl[1][24]*(1.0+flags.sw[5]*pdl[0][24]*sin(dgtr*Input.g_lat)*cos(dr*(Input.doy-pt[13])));
@@ -1204,7 +1290,7 @@ def gts7(Input, flags, output):
     db28 = pdm[2][0]*exp(g28)*pd[2][0];
     #/* Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[2]=densu(z,db28,tinf,tlb,28.0,alpha[2],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[2]=densu(z,db28,tinf,tlb,28.0,alpha[2],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
     output.t[1] = RandomVariable[0]
     dd=output.d[2];
     #/* Turbopause */
@@ -1213,25 +1299,24 @@ def gts7(Input, flags, output):
     xmd=28.0-xmm;
     #/* Mixed density at Zlb */
     tz = [0]
-    b28=densu(zh28,db28,tinf,tlb,xmd,(alpha[2]-1.0),tz,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1);
+    b28=densu(zh28,db28,tinf,tlb,xmd,(alpha[2]-1.0),tz,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1, state);
     if ((flags.sw[15]) and (z<=altl[2])):
         #/*  Mixed density at Alt */
-        global dm28
-        dm28=densu(z,b28,tinf,tlb,xmm,alpha[2],tz,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        state.dm28=densu(z,b28,tinf,tlb,xmm,alpha[2],tz,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         #/*  Net density at Alt */
-        output.d[2]=dnet(output.d[2],dm28,zhm28,xmm,28.0);
+        output.d[2]=dnet(output.d[2],state.dm28,zhm28,xmm,28.0);
     
 
 
     #/**** HE DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g4 = flags.sw[21]*globe7(pd[0], Input, flags);
+    g4 = flags.sw[21]*globe7(pd[0], Input, flags, state);
     #/*  Diffusive density at Zlb */
     db04 = pdm[0][0]*exp(g4)*pd[0][0];
     #/*  Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[0]=densu(z,db04,tinf,tlb, 4.,alpha[0],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[0]=densu(z,db04,tinf,tlb, 4.,alpha[0],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
     output.t[1] = RandomVariable[0]
     dd=output.d[0];
     if ((flags.sw[15]) and (z<altl[0])):
@@ -1239,16 +1324,15 @@ def gts7(Input, flags, output):
         zh04=pdm[0][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b04=densu(zh04,db04,tinf,tlb,4.-xmm,alpha[0]-1.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b04=densu(zh04,db04,tinf,tlb,4.-xmm,alpha[0]-1.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
-        global dm04
-        dm04=densu(z,b04,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        state.dm04=densu(z,b04,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         zhm04=zhm28;
         #/*  Net density at Alt */
-        output.d[0]=dnet(output.d[0],dm04,zhm04,xmm,4.);
+        output.d[0]=dnet(output.d[0],state.dm04,zhm04,xmm,4.);
         #/*  Correction to specified mixing ratio at ground */
         rl=log(b28*pdm[0][1]/b04);
         zc04=pdm[0][4]*pdl[1][0];
@@ -1261,12 +1345,12 @@ def gts7(Input, flags, output):
     #/**** O DENSITY ****/
 
     #/*  Density variation factor at Zlb */
-    g16= flags.sw[21]*globe7(pd[1],Input,flags);
+    g16= flags.sw[21]*globe7(pd[1], Input, flags, state);
     #/*  Diffusive density at Zlb */
     db16 =  pdm[1][0]*exp(g16)*pd[1][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[1]=densu(z,db16,tinf,tlb, 16.,alpha[1],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1);
+    output.d[1]=densu(z,db16,tinf,tlb, 16.,alpha[1],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1, state);
     output.t[1] = RandomVariable[0]
     dd=output.d[1];
     if ((flags.sw[15]) and (z<=altl[1])):
@@ -1274,16 +1358,15 @@ def gts7(Input, flags, output):
         zh16=pdm[1][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b16=densu(zh16,db16,tinf,tlb,16.0-xmm,(alpha[1]-1.0), RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b16=densu(zh16,db16,tinf,tlb,16.0-xmm,(alpha[1]-1.0), RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
-        global dm16
-        dm16=densu(z,b16,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        state.dm16=densu(z,b16,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         zhm16=zhm28;
         #/*  Net density at Alt */
-        output.d[1]=dnet(output.d[1],dm16,zhm16,xmm,16.);
+        output.d[1]=dnet(output.d[1],state.dm16,zhm16,xmm,16.);
         rl=pdm[1][1]*pdl[1][16]*(1.0+flags.sw[1]*pdl[0][23]*(Input.f107A-150.0));
         hc16=pdm[1][5]*pdl[1][3];
         zc16=pdm[1][4]*pdl[1][2];
@@ -1301,12 +1384,12 @@ def gts7(Input, flags, output):
     #/**** O2 DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g32= flags.sw[21]*globe7(pd[4], Input, flags);
+    g32= flags.sw[21]*globe7(pd[4], Input, flags, state);
     #/*  Diffusive density at Zlb */
     db32 = pdm[3][0]*exp(g32)*pd[4][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[3]=densu(z,db32,tinf,tlb, 32.,alpha[3],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1);
+    output.d[3]=densu(z,db32,tinf,tlb, 32.,alpha[3],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1, state);
     output.t[1] = RandomVariable[0]
     dd=output.d[3];
     if (flags.sw[15]):
@@ -1315,16 +1398,15 @@ def gts7(Input, flags, output):
             zh32=pdm[3][2];
             #/*  Mixed density at Zlb */
             RandomVariable = [output.t[1]]
-            b32=densu(zh32,db32,tinf,tlb,32.-xmm,alpha[3]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+            b32=densu(zh32,db32,tinf,tlb,32.-xmm,alpha[3]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
             output.t[1] = RandomVariable[0]
             #/*  Mixed density at Alt */
             RandomVariable = [output.t[1]]
-            global dm32
-            dm32=densu(z,b32,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+            state.dm32=densu(z,b32,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
             output.t[1] = RandomVariable[0]
             zhm32=zhm28;
             #/*  Net density at Alt */
-            output.d[3]=dnet(output.d[3],dm32,zhm32,xmm,32.);
+            output.d[3]=dnet(output.d[3],state.dm32,zhm32,xmm,32.);
             #/*   Correction to specified mixing ratio at ground */
             rl=log(b28*pdm[3][1]/b32);
             hc32=pdm[3][5]*pdl[1][7];
@@ -1344,12 +1426,12 @@ def gts7(Input, flags, output):
     #/**** AR DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g40= flags.sw[21]*globe7(pd[5],Input,flags);
+    g40= flags.sw[21]*globe7(pd[5], Input, flags, state);
     #/*  Diffusive density at Zlb */
     db40 = pdm[4][0]*exp(g40)*pd[5][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[4]=densu(z,db40,tinf,tlb, 40.,alpha[4],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[4]=densu(z,db40,tinf,tlb, 40.,alpha[4],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
     output.t[1] = RandomVariable[0]
     dd=output.d[4];
     if ((flags.sw[15]) and (z<=altl[4])):
@@ -1357,16 +1439,15 @@ def gts7(Input, flags, output):
         zh40=pdm[4][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b40=densu(zh40,db40,tinf,tlb,40.-xmm,alpha[4]-1.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b40=densu(zh40,db40,tinf,tlb,40.-xmm,alpha[4]-1.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
-        global dm40
-        dm40=densu(z,b40,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        state.dm40=densu(z,b40,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         zhm40=zhm28;
         #/*  Net density at Alt */
-        output.d[4]=dnet(output.d[4],dm40,zhm40,xmm,40.);
+        output.d[4]=dnet(output.d[4],state.dm40,zhm40,xmm,40.);
         #/*   Correction to specified mixing ratio at ground */
         rl=log(b28*pdm[4][1]/b40);
         hc40=pdm[4][5]*pdl[1][9];
@@ -1379,12 +1460,12 @@ def gts7(Input, flags, output):
     #/**** HYDROGEN DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g1 = flags.sw[21]*globe7(pd[6], Input, flags);
+    g1 = flags.sw[21]*globe7(pd[6], Input, flags, state);
     #/*  Diffusive density at Zlb */
     db01 = pdm[5][0]*exp(g1)*pd[6][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[6]=densu(z,db01,tinf,tlb,1.,alpha[6],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[6]=densu(z,db01,tinf,tlb,1.,alpha[6],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
     output.t[1] = RandomVariable[0]
     dd=output.d[6];
     if ((flags.sw[15]) and (z<=altl[6])):
@@ -1392,16 +1473,15 @@ def gts7(Input, flags, output):
         zh01=pdm[5][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b01=densu(zh01,db01,tinf,tlb,1.-xmm,alpha[6]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b01=densu(zh01,db01,tinf,tlb,1.-xmm,alpha[6]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
-        global dm01
-        dm01=densu(z,b01,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        state.dm01=densu(z,b01,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         zhm01=zhm28;
         #/*  Net density at Alt */
-        output.d[6]=dnet(output.d[6],dm01,zhm01,xmm,1.);
+        output.d[6]=dnet(output.d[6],state.dm01,zhm01,xmm,1.);
         #/*   Correction to specified mixing ratio at ground */
         rl=log(b28*pdm[5][1]*sqrt(pdl[1][17]*pdl[1][17])/b01);
         hc01=pdm[5][5]*pdl[1][11];
@@ -1419,12 +1499,12 @@ def gts7(Input, flags, output):
     #/**** ATOMIC NITROGEN DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g14 = flags.sw[21]*globe7(pd[7],Input,flags);
+    g14 = flags.sw[21]*globe7(pd[7], Input, flags, state);
     #/*  Diffusive density at Zlb */
     db14 = pdm[6][0]*exp(g14)*pd[7][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[7]=densu(z,db14,tinf,tlb,14.,alpha[7],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[7]=densu(z,db14,tinf,tlb,14.,alpha[7],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
     output.t[1] = RandomVariable[0]
     dd=output.d[7];
     if ((flags.sw[15]) and (z<=altl[7])): 
@@ -1432,16 +1512,15 @@ def gts7(Input, flags, output):
         zh14=pdm[6][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b14=densu(zh14,db14,tinf,tlb,14.-xmm,alpha[7]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b14=densu(zh14,db14,tinf,tlb,14.-xmm,alpha[7]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
-        global dm14
-        dm14=densu(z,b14,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        state.dm14=densu(z,b14,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1, state);
         output.t[1] = RandomVariable[0]
         zhm14=zhm28;
         #/*  Net density at Alt */
-        output.d[7]=dnet(output.d[7],dm14,zhm14,xmm,14.);
+        output.d[7]=dnet(output.d[7],state.dm14,zhm14,xmm,14.);
         #/*   Correction to specified mixing ratio at ground */
         rl=log(b28*pdm[6][1]*sqrt(pdl[0][2]*pdl[0][2])/b14);
         hc14=pdm[6][5]*pdl[0][1];
@@ -1458,15 +1537,15 @@ def gts7(Input, flags, output):
 
     #/**** Anomalous OXYGEN DENSITY ****/
 
-    g16h = flags.sw[21]*globe7(pd[8],Input,flags);
+    g16h = flags.sw[21]*globe7(pd[8], Input, flags, state);
     db16h = pdm[7][0]*exp(g16h)*pd[8][0];
     tho = pdm[7][9]*pdl[0][6];
     RandomVariable = [output.t[1]]
-    dd=densu(z,db16h,tho,tho,16.,alpha[8],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1);
+    dd=densu(z,db16h,tho,tho,16.,alpha[8],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1, state);
     output.t[1] = RandomVariable[0]
     zsht=pdm[7][5];
     zmho=pdm[7][4];
-    zsho=scalh(zmho,16.0,tho);
+    zsho=scalh(zmho,16.0,tho,state);
     output.d[8]=dd*exp(-zsht/zsho*(exp(-(z-zmho)/zsht)-1.));
 
 
@@ -1479,7 +1558,7 @@ def gts7(Input, flags, output):
     #/* temperature */
     z = sqrt(Input.alt*Input.alt);
     RandomVariable = [output.t[1]]
-    ddum = densu(z,1.0, tinf, tlb, 0.0, 0.0, RandomVariable, ptm[5], s, mn1, zn1, meso_tn1, meso_tgn1);
+    ddum = densu(z,1.0, tinf, tlb, 0.0, 0.0, RandomVariable, ptm[5], s, mn1, zn1, meso_tn1, meso_tgn1, state);
     output.t[1] = RandomVariable[0]
     if (flags.sw[0]):
         for i in range(9):
@@ -27,6 +27,9 @@ This is the header of the program that contains all the classes
  */
 """
 
+from array import array
+import numpy as np
+
 
 #/* ------------------------------------------------------------------- */
 #/* ------------------------------- INPUT ----------------------------- */
@@ -71,11 +74,15 @@ class nrlmsise_flags(object):
  *   21 - all NLB var
  *   22 - all TN3 var
  *   23 - turbo scale height var
+ *
+ *   The arrays are fixed size array('i') / array('d') buffers.
  """
+    __slots__ = ('switches', 'sw', 'swc')
+
     def __init__(self):
-        self.switches = [0 for _ in range(24)]
-        self.sw = [0.0 for _ in range(24)]
-        self.swc = [0.0 for _ in range(24)]
+        self.switches = array('i', bytes(4*24))
+        self.sw = array('d', bytes(8*24))
+        self.swc = array('d', bytes(8*24))
 
 
 class ap_array:
@@ -91,8 +98,10 @@ class ap_array:
  *   6 : Average of eight 3 hr AP indicies from 36 to 57 hrs 
  *           prior to current time
  """
+    __slots__ = ('a',)
+
     def __init__(self):
-        self.a = [0.0 for _ in range(7)]
+        self.a = array('d', bytes(8*7))
 
 
 class nrlmsise_input:
@@ -118,6 +127,8 @@ class nrlmsise_input:
  *      150., 150., and 4. respectively.
  */
  """
+    __slots__ = ('year', 'doy', 'sec', 'alt', 'g_lat', 'g_long', 'lst', 'f107A', 'f107', 'ap', 'ap_a')
+
     def __init__(self, year=0, doy=0, sec=0.0, alt=0.0, g_lat=0.0, g_long=0.0,
                  lst=0.0, f107A=0.0, f107=0.0, ap=0.0, ap_a=None):
         self.year = year #/* year, currently ignored */
@@ -179,9 +190,56 @@ class nrlmsise_output:
  *        in this model, INCLUDING anomalous oxygen.
  */
  """
+    __slots__ = ('d', 't')
+
     def __init__(self):
-        self.d = [0.0 for _ in range(9)] #/* densities */
-        self.t = [0.0 for _ in range(2)] #/* temperatures */
+        self.d = array('d', bytes(8*9)) #/* densities */
+        self.t = array('d', bytes(8*2)) #/* temperatures */
+
+
+#/* ------------------------------------------------------------------- */
+#/* ------------------------------ RECORDS ---------------------------- */
+#/* ------------------------------------------------------------------- */
+"""
+ *   Structured NumPy dtypes holding one nrlmsise_input / nrlmsise_output
+ *   per record, so a batch of inputs or outputs is one contiguous buffer.
+ *   ap_a of an input record holds the 7 values of its ap_array (zeros if
+ *   the input has none). gtd7_records in nrlmsise_00_vec.py evaluates a
+ *   whole array of input records.
+ """
+INPUT_DTYPE = np.dtype([('year', np.int32), ('doy', np.float64), ('sec', np.float64), ('alt', np.float64),
+                        ('g_lat', np.float64), ('g_long', np.float64), ('lst', np.float64), ('f107A', np.float64),
+                        ('f107', np.float64), ('ap', np.float64), ('ap_a', np.float64, (7,))])
+
+OUTPUT_DTYPE = np.dtype([('d', np.float64, (9,)), ('t', np.float64, (2,))])
+
+
+def input_records(Inputs):
+    """Array of INPUT_DTYPE records of a list of nrlmsise_input"""
+    records = np.zeros(len(Inputs), dtype=INPUT_DTYPE)
+    for record, Input in zip(records, Inputs):
+        for name in INPUT_DTYPE.names[:-1]:
+            record[name] = getattr(Input, name)
+        if Input.ap_a is not None:
+            record['ap_a'] = Input.ap_a.a
+    return records
+
+
+def record_input(record):
+    """nrlmsise_input of one INPUT_DTYPE record"""
+    Input = nrlmsise_input(**{name: record[name].item() for name in INPUT_DTYPE.names[:-1]})
+    Input.ap_a = ap_array()
+    Input.ap_a.a[:] = array('d', record['ap_a'].tolist())
+    return Input
+
+
+def output_records(outputs):
+    """Array of OUTPUT_DTYPE records of a list of nrlmsise_output"""
+    records = np.zeros(len(outputs), dtype=OUTPUT_DTYPE)
+    for record, output in zip(records, outputs):
+        record['d'] = output.d
+        record['t'] = output.t
+    return records
 
 
 #/* ------------------------------------------------------------------- */
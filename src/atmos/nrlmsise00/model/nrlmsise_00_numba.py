@@ -0,0 +1,1060 @@
+"""
+Numba compiled version of the NRLMSISE-00 model in nrlmsise_00.py
+
+The functions below follow gtd7/gts7 of the scalar port statement by
+statement, with the data tables of nrlmsise_00_tables.py as contiguous float64
+arrays and the shared variables (PARMB, DMIX, MESO7, LPOLY) as small work
+arrays, so every function compiles in nopython mode. The compiled code is
+cached on disk (numba cache=True, in __pycache__), only the first import on
+a machine pays the compile time.
+
+Use it through the backend argument of gtd7/gtd7d in nrlmsise_00.py and of
+nrl00/nrl00_batch in AtmosCalc.py, or directly with gtd7_numba / gtd7_many.
+/* -------------------------------------------------------------------- */
+/* ---------  N R L M S I S E - 0 0    M O D E L    2 0 0 1  ---------- */
+/* -------------------------------------------------------------------- */
+"""
+
+import numpy as np
+from array import array
+from math import sin, cos, exp, log, sqrt
+from numba import njit
+
+from src.atmos.nrlmsise00.model.nrlmsise_00_tables import load_arrays
+from src.atmos.nrlmsise00.model.nrlmsise_00_header import nrlmsise_flags
+from src.atmos.nrlmsise00.model.nrlmsise_00 import tselec
+
+rgas = 831.4
+dgtr = 1.74533E-2
+dr = 1.72142E-2
+sr = 7.2722E-5
+hr = 0.2618
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- TABLES ---------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+PT, PD, PS, PDL, PTL, PMA, SAM, PTM, PDM, PAVGM = load_arrays()
+
+'''Layout of the input array'''
+DOY, YEAR, SEC, ALT, G_LAT, G_LONG, LST, F107A, F107, AP = range(10)
+
+'''Layout of the state array, the scalar shared variables of the C code'''
+GSURF, RE, DFA, APDF, APT0, STLOC, CTLOC, S2TLOC, C2TLOC, S3TLOC, C3TLOC, DM28, DD = range(13)
+NSTATE = 13
+
+'''Rows of the work array of gtd7_work, every buffer of one evaluation, see work_array'''
+ST, PLG, TN1, TGN1, TN2, TGN2, TN3, TGN3, SD, STT, TINP, XS, YS, Y2, U, TG, TZ = (0, 1, 5, 6, 7, 8, 9, 10, 11, 12, 13,
+                                                                              14, 15, 16, 17, 18, 19)
+NWORK = 20
+WORK_WIDTH = 15
+
+'''Nodes and constants of gtd7/gts7'''
+ZN1 = np.array([PDL[1, 15], 110.0, 100.0, 90.0, 72.5])
+ZN2 = np.array([72.5, 55.0, 45.0, 32.5])
+ZN3 = np.array([32.5, 20.0, 15.0, 10.0, 0.0])
+ALPHA = np.array([-0.38, 0.0, 0.0, 0.0, 0.17, 0.0, -0.38, 0.0, 0.0])
+ALTL = np.array([200.0, 300.0, 160.0, 250.0, 240.0, 450.0, 320.0, 450.0])
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------ GLATF ------------------------------ */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def glatf(lat, st):
+    c2 = cos(2.0*dgtr*lat)
+    st[GSURF] = 980.616 * (1.0 - 0.0026373 * c2)
+    st[RE] = 2.0 * st[GSURF] / (3.085462E-6 + 2.27E-9 * c2) * 1.0E-5
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------ CCOR ------------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def ccor(alt, r, h1, zh):
+    e = (alt - zh) / h1
+    if e > 70:
+        return exp(0)
+    if e < -70:
+        return exp(r)
+    ex = exp(e)
+    e = r / (1.0 + ex)
+    return exp(e)
+
+
+@njit(cache=True)
+def ccor2(alt, r, h1, zh, h2):
+    e1 = (alt - zh) / h1
+    e2 = (alt - zh) / h2
+    if (e1 > 70) or (e2 > 70):
+        return exp(0)
+    if (e1 < -70) and (e2 < -70):
+        return exp(r)
+    ex1 = exp(e1)
+    ex2 = exp(e2)
+    ccor2v = r / (1.0 + 0.5 * (ex1 + ex2))
+    return exp(ccor2v)
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- SCALH ----------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def scalh(alt, xm, temp, st):
+    g = st[GSURF] / ((1.0 + alt/st[RE])**2.0)
+    g = rgas * temp / (g * xm)
+    return g
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* -------------------------------- DNET ----------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def dnet(dd, dm, zhm, xmm, xm):
+    a = zhm / (xmm-xm)
+    if not ((dm > 0) and (dd > 0)):
+        if (dd == 0) and (dm == 0):
+            dd = 1
+        if dm == 0:
+            return dd
+        if dd == 0:
+            return dm
+    ylog = a * log(dm/dd)
+    if ylog < -10:
+        return dd
+    if ylog > 10:
+        return dm
+    return dd*((1.0 + exp(ylog))**(1.0/a))
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------ SPLINE, SPLINT, SPLINI ------------------- */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def splini(xa, ya, y2a, n, x):
+    yi = 0.0
+    klo = 0
+    khi = 1
+    while (x > xa[klo]) and (khi < n):
+        xx = x
+        if khi < (n-1):
+            if x < xa[khi]:
+                xx = x
+            else:
+                xx = xa[khi]
+        h = xa[khi] - xa[klo]
+        a = (xa[khi] - xx)/h
+        b = (xx - xa[klo])/h
+        a2 = a*a
+        b2 = b*b
+        yi += ((1.0 - a2) * ya[klo] / 2.0 + b2 * ya[khi] / 2.0 + ((-(1.0+a2*a2)/4.0 + a2/2.0) * y2a[klo] + (b2*b2/4.0 - b2/2.0) * y2a[khi]) * h * h / 6.0) * h
+        klo += 1
+        khi += 1
+    return yi
+
+
+@njit(cache=True)
+def splint(xa, ya, y2a, n, x):
+    klo = 0
+    khi = n-1
+    while (khi-klo) > 1:
+        k = (khi+klo)//2
+        if xa[k] > x:
+            khi = k
+        else:
+            klo = k
+    h = xa[khi] - xa[klo]
+    a = (xa[khi] - x)/h
+    b = (x - xa[klo])/h
+    return a * ya[klo] + b * ya[khi] + ((a*a*a - a) * y2a[klo] + (b*b*b - b) * y2a[khi]) * h * h/6.0
+
+
+@njit(cache=True)
+def spline(x, y, n, yp1, ypn, y2, u):
+    if yp1 > 0.99E30:
+        y2[0] = 0
+        u[0] = 0
+    else:
+        y2[0] = -0.5
+        u[0] = (3.0/(x[1]-x[0]))*((y[1]-y[0])/(x[1]-x[0])-yp1)
+    for i in range(1, n-1):
+        sig = (x[i]-x[i-1])/(x[i+1] - x[i-1])
+        p = sig * y2[i-1] + 2.0
+        y2[i] = (sig - 1.0) / p
+        u[i] = (6.0 * ((y[i+1] - y[i])/(x[i+1] - x[i]) - (y[i] - y[i-1]) / (x[i] - x[i-1]))/(x[i+1] - x[i-1]) - sig * u[i-1])/p
+    if ypn > 0.99E30:
+        qn = 0.0
+        un = 0.0
+    else:
+        qn = 0.5
+        un = (3.0 / (x[n-1] - x[n-2])) * (ypn - (y[n-1] - y[n-2])/(x[n-1] - x[n-2]))
+    y2[n-1] = (un - qn * u[n-2]) / (qn * y2[n-2] + 1.0)
+    for k in range(n-2, -1, -1):
+        y2[k] = y2[k] * y2[k+1] + u[k]
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- DENSM ----------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def zeta(zz, zl, re):
+    return ((zz-zl)*(re+zl)/(re+zz))
+
+
+@njit(cache=True)
+def _nodes(zn, tn, tgn, z1, re, xs, ys, y2out, u):
+    '''Spline nodes of densm/densu, returns zgdif'''
+    mn = zn.shape[0]
+    z2 = zn[mn-1]
+    t1 = tn[0]
+    t2 = tn[mn-1]
+    zgdif = zeta(z2, z1, re)
+    for k in range(mn):
+        xs[k] = zeta(zn[k], z1, re)/zgdif
+        ys[k] = 1.0 / tn[k]
+    yd1 = -tgn[0] / (t1*t1) * zgdif
+    yd2 = -tgn[1] / (t2*t2) * zgdif * (((re+z2)/(re+z1))**2.0)
+    spline(xs, ys, mn, yd1, yd2, y2out, u)
+    return zgdif
+
+
+@njit(cache=True)
+def densm(alt, d0, xm, tz, zn3, tn3, tgn3, zn2, tn2, tgn2, st, ws):
+    gsurf = st[GSURF]
+    re = st[RE]
+    xs = ws[XS]
+    ys = ws[YS]
+    y2out = ws[Y2]
+    u = ws[U]
+    densm_tmp = d0
+    if alt > zn2[0]:
+        if xm == 0.0:
+            return tz[0]
+        else:
+            return d0
+
+    #/* STRATOSPHERE/MESOSPHERE TEMPERATURE */
+    mn2 = zn2.shape[0]
+    if alt > zn2[mn2-1]:
+        z = alt
+    else:
+        z = zn2[mn2-1]
+    z1 = zn2[0]
+    t1 = tn2[0]
+    zg = zeta(z, z1, re)
+    zgdif = _nodes(zn2, tn2, tgn2, z1, re, xs, ys, y2out, u)
+    x = zg/zgdif
+    tz[0] = 1.0 / splint(xs, ys, y2out, mn2, x)
+    if xm != 0.0:
+        #/* calaculate stratosphere / mesospehere density */
+        glb = gsurf / ((1.0 + z1/re)**2.0)
+        gamm = xm * glb * zgdif / rgas
+        expl = gamm*splini(xs, ys, y2out, mn2, x)
+        if expl > 50.0:
+            expl = 50.0
+        densm_tmp = densm_tmp * (t1 / tz[0]) * exp(-expl)
+
+    if alt > zn3[0]:
+        if xm == 0.0:
+            return tz[0]
+        else:
+            return densm_tmp
+
+    #/* troposhere / stratosphere temperature */
+    mn3 = zn3.shape[0]
+    z = alt
+    z1 = zn3[0]
+    t1 = tn3[0]
+    zg = zeta(z, z1, re)
+    zgdif = _nodes(zn3, tn3, tgn3, z1, re, xs, ys, y2out, u)
+    x = zg/zgdif
+    tz[0] = 1.0 / splint(xs, ys, y2out, mn3, x)
+    if xm != 0.0:
+        #/* calaculate tropospheric / stratosphere density */
+        glb = gsurf / ((1.0 + z1/re)**2.0)
+        gamm = xm * glb * zgdif / rgas
+        expl = gamm*splini(xs, ys, y2out, mn3, x)
+        if expl > 50.0:
+            expl = 50.0
+        densm_tmp = densm_tmp * (t1 / tz[0]) * exp(-expl)
+
+    if xm == 0.0:
+        return tz[0]
+    return densm_tmp
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- DENSU ----------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, zn1, tn1, tgn1, st, ws):
+    gsurf = st[GSURF]
+    re = st[RE]
+    xs = ws[XS]
+    ys = ws[YS]
+    y2out = ws[Y2]
+    u = ws[U]
+    mn1 = zn1.shape[0]
+    z1 = 0.0
+    t1 = 0.0
+    zgdif = 0.0
+    x = 0.0
+
+    #/* joining altitudes of Bates and spline */
+    za = zn1[0]
+    if alt > za:
+        z = alt
+    else:
+        z = za
+
+    #/* geopotential altitude difference from ZLB */
+    zg2 = zeta(z, zlb, re)
+
+    #/* Bates temperature */
+    tt = tinf - (tinf - tlb) * exp(-s2*zg2)
+    ta = tt
+    tz[0] = tt
+    densu_temp = tz[0]
+
+    if alt < za:
+        #/* calculate temperature below ZA
+        # * temperature gradient at ZA from Bates profile */
+        dta = (tinf - ta) * s2 * (((re+zlb)/(re+za))**2.0)
+        tgn1[0] = dta
+        tn1[0] = ta
+        if alt > zn1[mn1-1]:
+            z = alt
+        else:
+            z = zn1[mn1-1]
+        z1 = zn1[0]
+        t1 = tn1[0]
+        zg = zeta(z, z1, re)
+        zgdif = _nodes(zn1, tn1, tgn1, z1, re, xs, ys, y2out, u)
+        x = zg / zgdif
+        tz[0] = 1.0 / splint(xs, ys, y2out, mn1, x)
+        densu_temp = tz[0]
+
+    if xm == 0:
+        return densu_temp
+
+    #/* calculate density above za */
+    glb = gsurf / ((1.0 + zlb/re)**2.0)
+    gamma = xm * glb / (s2 * rgas * tinf)
+    expl = exp(-s2 * gamma * zg2)
+    if expl > 50.0:
+        expl = 50.0
+    if tt <= 0:
+        expl = 50.0
+
+    #/* density at altitude */
+    densa = dlb * ((tlb/tt)**(1.0+alpha+gamma)) * expl
+    densu_temp = densa
+    if alt >= za:
+        return densu_temp
+
+    #/* calculate density below za */
+    glb = gsurf / ((1.0 + z1/re)**2.0)
+    gamm = xm * glb * zgdif / rgas
+
+    #/* integrate spline temperatures */
+    expl = gamm * splini(xs, ys, y2out, mn1, x)
+    if expl > 50.0:
+        expl = 50.0
+    if tz[0] <= 0:
+        expl = 50.0
+
+    #/* density at altitude */
+    return densu_temp * ((t1 / tz[0])**(1.0 + alpha)) * exp(-expl)
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- GLOBE7 ---------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def g0(a, p24, p25):
+    return (a - 4.0 + (p25 - 1.0) * (a - 4.0 + (exp(-sqrt(p24*p24) * (a - 4.0)) - 1.0) / sqrt(p24*p24)))
+
+
+@njit(cache=True)
+def sumex(ex):
+    return (1.0 + (1.0 - ex**19.0) / (1.0 - ex) * ex**0.5)
+
+
+@njit(cache=True)
+def sg0(ex, p24, p25, ap):
+    return (g0(ap[1], p24, p25) + (g0(ap[2], p24, p25)*ex + g0(ap[3], p24, p25)*ex*ex +
+            g0(ap[4], p24, p25)*ex**3.0 + (g0(ap[5], p24, p25)*ex**4.0 +
+            g0(ap[6], p24, p25)*ex**12.0)*(1.0-ex**8.0)/(1.0-ex)))/sumex(ex)
+
+
+@njit(cache=True)
+def globe7(p, inp, ap_a, sw, swc, st, plg, ws):
+    t = ws[TG]
+    t[:] = 0.0
+    tloc = inp[LST]
+    g_lat = inp[G_LAT]
+    g_long = inp[G_LONG]
+    doy = inp[DOY]
+
+    #/* calculate legendre polynomials */
+    c = sin(g_lat * dgtr)
+    s = cos(g_lat * dgtr)
+    c2 = c*c
+    c4 = c2*c2
+    s2 = s*s
+
+    plg[0, 1] = c
+    plg[0, 2] = 0.5*(3.0*c2 - 1.0)
+    plg[0, 3] = 0.5*(5.0*c*c2-3.0*c)
+    plg[0, 4] = (35.0*c4 - 30.0*c2 + 3.0)/8.0
+    plg[0, 5] = (63.0*c2*c2*c - 70.0*c2*c + 15.0*c)/8.0
+    plg[0, 6] = (11.0*c*plg[0, 5] - 5.0*plg[0, 4])/6.0
+    plg[1, 1] = s
+    plg[1, 2] = 3.0*c*s
+    plg[1, 3] = 1.5*(5.0*c2-1.0)*s
+    plg[1, 4] = 2.5*(7.0*c2*c-3.0*c)*s
+    plg[1, 5] = 1.875*(21.0*c4 - 14.0*c2 + 1.0)*s
+    plg[1, 6] = (11.0*c*plg[1, 5]-6.0*plg[1, 4])/5.0
+    plg[2, 2] = 3.0*s2
+    plg[2, 3] = 15.0*s2*c
+    plg[2, 4] = 7.5*(7.0*c2 - 1.0)*s2
+    plg[2, 5] = 3.0*c*plg[2, 4]-2.0*plg[2, 3]
+    plg[2, 6] = (11.0*c*plg[2, 5]-7.0*plg[2, 4])/4.0
+    plg[2, 7] = (13.0*c*plg[2, 6]-8.0*plg[2, 5])/5.0
+    plg[3, 3] = 15.0*s2*s
+    plg[3, 4] = 105.0*s2*s*c
+    plg[3, 5] = (9.0*c*plg[3, 4]-7.*plg[3, 3])/2.0
+    plg[3, 6] = (11.0*c*plg[3, 5]-8.*plg[3, 4])/3.0
+
+    if not (((sw[7] == 0) and (sw[8] == 0)) and (sw[14] == 0)):
+        st[STLOC] = sin(hr*tloc)
+        st[CTLOC] = cos(hr*tloc)
+        st[S2TLOC] = sin(2.0*hr*tloc)
+        st[C2TLOC] = cos(2.0*hr*tloc)
+        st[S3TLOC] = sin(3.0*hr*tloc)
+        st[C3TLOC] = cos(3.0*hr*tloc)
+
+    cd32 = cos(dr*(doy-p[31]))
+    cd18 = cos(2.0*dr*(doy-p[17]))
+    cd14 = cos(dr*(doy-p[13]))
+    cd39 = cos(2.0*dr*(doy-p[38]))
+
+    #/* F10.7 EFFECT */
+    df = inp[F107] - inp[F107A]
+    dfa = inp[F107A] - 150.0
+    st[DFA] = dfa
+    t[0] = p[19]*df*(1.0+p[59]*dfa) + p[20]*df*df + p[21]*dfa + p[29]*(dfa**2.0)
+    f1 = 1.0 + (p[47]*dfa + p[19]*df+p[20]*df*df)*swc[1]
+    f2 = 1.0 + (p[49]*dfa+p[19]*df+p[20]*df*df)*swc[1]
+
+    #/*  TIME INDEPENDENT */
+    t[1] = (p[1]*plg[0, 2] + p[2]*plg[0, 4]+p[22]*plg[0, 6]) + \
+        (p[14]*plg[0, 2])*dfa*swc[1] + p[26]*plg[0, 1]
+
+    #/*  SYMMETRICAL ANNUAL */
+    t[2] = p[18]*cd32
+
+    #/*  SYMMETRICAL SEMIANNUAL */
+    t[3] = (p[15]+p[16]*plg[0, 2])*cd18
+
+    #/*  ASYMMETRICAL ANNUAL */
+    t[4] = f1*(p[9]*plg[0, 1]+p[10]*plg[0, 3])*cd14
+
+    #/*  ASYMMETRICAL SEMIANNUAL */
+    t[5] = p[37]*plg[0, 1]*cd39
+
+    #/* DIURNAL */
+    if sw[7]:
+        t71 = (p[11]*plg[1, 2])*cd14*swc[5]
+        t72 = (p[12]*plg[1, 2])*cd14*swc[5]
+        t[6] = f2*((p[3]*plg[1, 1] + p[4]*plg[1, 3] + p[27]*plg[1, 5] + t71) *
+                   st[CTLOC] + (p[6]*plg[1, 1] + p[7]*plg[1, 3] + p[28]*plg[1, 5] + t72)*st[STLOC])
+
+    #/* SEMIDIURNAL */
+    if sw[8]:
+        t81 = (p[23]*plg[2, 3]+p[35]*plg[2, 5])*cd14*swc[5]
+        t82 = (p[33]*plg[2, 3]+p[36]*plg[2, 5])*cd14*swc[5]
+        t[7] = f2*((p[5]*plg[2, 2] + p[41]*plg[2, 4] + t81)*st[C2TLOC] + (p[8]*plg[2, 2] + p[42]*plg[2, 4] + t82)*st[S2TLOC])
+
+    #/* TERDIURNAL */
+    if sw[14]:
+        t[13] = f2 * ((p[39]*plg[3, 3]+(p[93]*plg[3, 4]+p[46]*plg[3, 6])*cd14*swc[5]) * st[S3TLOC] +
+                      (p[40]*plg[3, 3]+(p[94]*plg[3, 4]+p[48]*plg[3, 6])*cd14*swc[5]) * st[C3TLOC])
+
+    #/* magnetic activity based on daily ap */
+    if sw[9] == -1:
+        if p[51] != 0:
+            exp1 = exp(-10800.0*sqrt(p[51]*p[51])/(1.0+p[138]*(45.0-sqrt(g_lat*g_lat))))
+            if exp1 > 0.99999:
+                exp1 = 0.99999
+            p24 = p[24]
+            if p24 < 1.0E-4:
+                p24 = 1.0E-4
+            st[APT0] = sg0(exp1, p24, p[25], ap_a)
+            if sw[9]:
+                t[8] = st[APT0]*(p[50]+p[96]*plg[0, 2]+p[54]*plg[0, 4] +
+                                 (p[125]*plg[0, 1]+p[126]*plg[0, 3]+p[127]*plg[0, 5])*cd14*swc[5] +
+                                 (p[128]*plg[1, 1]+p[129]*plg[1, 3]+p[130]*plg[1, 5])*swc[7] *
+                                 cos(hr*(tloc-p[131])))
+    else:
+        apd = inp[AP]-4.0
+        p44 = p[43]
+        p45 = p[44]
+        if p44 < 0:
+            p44 = 1.0E-5
+        apdf = apd + (p45-1.0)*(apd + (exp(-p44 * apd) - 1.0)/p44)
+        st[APDF] = apdf
+        if sw[9]:
+            t[8] = apdf*(p[32]+p[45]*plg[0, 2]+p[34]*plg[0, 4] +
+                         (p[100]*plg[0, 1]+p[101]*plg[0, 3]+p[102]*plg[0, 5])*cd14*swc[5] +
+                         (p[121]*plg[1, 1]+p[122]*plg[1, 3]+p[123]*plg[1, 5])*swc[7] *
+                         cos(hr*(tloc-p[124])))
+
+    if sw[10] and (g_long > -1000.0):
+        #/* longitudinal */
+        if sw[11]:
+            t[10] = (1.0 + p[80]*dfa*swc[1]) * \
+                ((p[64]*plg[1, 2]+p[65]*plg[1, 4]+p[66]*plg[1, 6]
+                  + p[103]*plg[1, 1]+p[104]*plg[1, 3]+p[105]*plg[1, 5]
+                  + swc[5]*(p[109]*plg[1, 1]+p[110]*plg[1, 3]+p[111]*plg[1, 5])*cd14) *
+                 cos(dgtr*g_long)
+                 + (p[90]*plg[1, 2]+p[91]*plg[1, 4]+p[92]*plg[1, 6]
+                    + p[106]*plg[1, 1]+p[107]*plg[1, 3]+p[108]*plg[1, 5]
+                    + swc[5]*(p[112]*plg[1, 1]+p[113]*plg[1, 3]+p[114]*plg[1, 5])*cd14) *
+                 sin(dgtr*g_long))
+
+        #/* ut and mixed ut, longitude */
+        if sw[12]:
+            t[11] = (1.0+p[95]*plg[0, 1])*(1.0+p[81]*dfa*swc[1]) * \
+                (1.0+p[119]*plg[0, 1]*swc[5]*cd14) * \
+                ((p[68]*plg[0, 1]+p[69]*plg[0, 3]+p[70]*plg[0, 5]) *
+                 cos(sr*(inp[SEC]-p[71])))
+            t[11] += swc[11] * \
+                (p[76]*plg[2, 3]+p[77]*plg[2, 5]+p[78]*plg[2, 7]) * \
+                cos(sr*(inp[SEC]-p[79])+2.0*dgtr*g_long)*(1.0+p[137]*dfa*swc[1])
+
+        #/* ut, longitude magnetic activity */
+        if sw[13]:
+            if sw[9] == -1:
+                if p[51]:
+                    apt0 = st[APT0]
+                    t[12] = apt0*swc[11]*(1.+p[132]*plg[0, 1]) * \
+                        ((p[52]*plg[1, 2]+p[98]*plg[1, 4]+p[67]*plg[1, 6]) *
+                         cos(dgtr*(g_long-p[97]))) \
+                        + apt0*swc[11]*swc[5] * \
+                        (p[133]*plg[1, 1]+p[134]*plg[1, 3]+p[135]*plg[1, 5]) * \
+                        cd14*cos(dgtr*(g_long-p[136])) \
+                        + apt0*swc[12] * \
+                        (p[55]*plg[0, 1]+p[56]*plg[0, 3]+p[57]*plg[0, 5]) * \
+                        cos(sr*(inp[SEC]-p[58]))
+            else:
+                apdf = st[APDF]
+                t[12] = apdf*swc[11]*(1.0+p[120]*plg[0, 1]) * \
+                    ((p[60]*plg[1, 2]+p[61]*plg[1, 4]+p[62]*plg[1, 6]) *
+                     cos(dgtr*(g_long-p[63]))) \
+                    + apdf*swc[11]*swc[5] * \
+                    (p[115]*plg[1, 1]+p[116]*plg[1, 3]+p[117]*plg[1, 5]) * \
+                    cd14*cos(dgtr*(g_long-p[118])) \
+                    + apdf*swc[12] * \
+                    (p[83]*plg[0, 1]+p[84]*plg[0, 3]+p[85]*plg[0, 5]) * \
+                    cos(sr*(inp[SEC]-p[75]))
+
+    #/* parms not used: 82, 89, 99, 139-149 */
+    tinf = p[30]
+    for i in range(14):
+        tinf = tinf + abs(sw[i+1])*t[i]
+    return tinf
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- GLOB7S ---------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def glob7s(p, inp, sw, swc, st, plg, ws):
+    t = ws[TG]
+    t[:] = 0.0
+    doy = inp[DOY]
+    g_long = inp[G_LONG]
+    dfa = st[DFA]
+    apdf = st[APDF]
+
+    #/* confirm parameter set */
+    pset = p[99]
+    if pset == 0:
+        pset = 2.0
+    if pset != 2.0:
+        return -1.0
+
+    cd32 = cos(dr*(doy-p[31]))
+    cd18 = cos(2.0*dr*(doy-p[17]))
+    cd14 = cos(dr*(doy-p[13]))
+    cd39 = cos(2.0*dr*(doy-p[38]))
+
+    #/* F10.7 */
+    t[0] = p[21]*dfa
+
+    #/* time independent */
+    t[1] = p[1]*plg[0, 2] + p[2]*plg[0, 4] + p[22]*plg[0, 6] + p[26]*plg[0, 1] + p[14]*plg[0, 3] + p[59]*plg[0, 5]
+
+    #/* SYMMETRICAL ANNUAL */
+    t[2] = (p[18]+p[47]*plg[0, 2]+p[29]*plg[0, 4])*cd32
+
+    #/* SYMMETRICAL SEMIANNUAL */
+    t[3] = (p[15]+p[16]*plg[0, 2]+p[30]*plg[0, 4])*cd18
+
+    #/* ASYMMETRICAL ANNUAL */
+    t[4] = (p[9]*plg[0, 1]+p[10]*plg[0, 3]+p[20]*plg[0, 5])*cd14
+
+    #/* ASYMMETRICAL SEMIANNUAL */
+    t[5] = (p[37]*plg[0, 1])*cd39
+
+    #/* DIURNAL */
+    if sw[7]:
+        t71 = p[11]*plg[1, 2]*cd14*swc[5]
+        t72 = p[12]*plg[1, 2]*cd14*swc[5]
+        t[6] = ((p[3]*plg[1, 1] + p[4]*plg[1, 3] + t71) * st[CTLOC] + (p[6]*plg[1, 1] + p[7]*plg[1, 3] + t72) * st[STLOC])
+
+    #/* SEMIDIURNAL */
+    if sw[8]:
+        t81 = (p[23]*plg[2, 3]+p[35]*plg[2, 5])*cd14*swc[5]
+        t82 = (p[33]*plg[2, 3]+p[36]*plg[2, 5])*cd14*swc[5]
+        t[7] = ((p[5]*plg[2, 2] + p[41]*plg[2, 4] + t81) * st[C2TLOC] + (p[8]*plg[2, 2] + p[42]*plg[2, 4] + t82) * st[S2TLOC])
+
+    #/* TERDIURNAL */
+    if sw[14]:
+        t[13] = p[39] * plg[3, 3] * st[S3TLOC] + p[40] * plg[3, 3] * st[C3TLOC]
+
+    #/* MAGNETIC ACTIVITY */
+    if sw[9]:
+        if sw[9] == 1:
+            t[8] = apdf * (p[32] + p[45] * plg[0, 2] * swc[2])
+        if sw[9] == -1:
+            t[8] = (p[50]*st[APT0] + p[96]*plg[0, 2] * st[APT0]*swc[2])
+
+    #/* LONGITUDINAL */
+    if not ((sw[10] == 0) or (sw[11] == 0) or (g_long <= -1000.0)):
+        t[10] = (1.0 + plg[0, 1]*(p[80]*swc[5]*cos(dr*(doy-p[81]))
+                                  + p[85]*swc[6]*cos(2.0*dr*(doy-p[86])))
+                 + p[83]*swc[3]*cos(dr*(doy-p[84]))
+                 + p[87]*swc[4]*cos(2.0*dr*(doy-p[88]))) \
+            * ((p[64]*plg[1, 2]+p[65]*plg[1, 4]+p[66]*plg[1, 6]
+                + p[74]*plg[1, 1]+p[75]*plg[1, 3]+p[76]*plg[1, 5]
+                )*cos(dgtr*g_long)
+               + (p[90]*plg[1, 2]+p[91]*plg[1, 4]+p[92]*plg[1, 6]
+                  + p[77]*plg[1, 1]+p[78]*plg[1, 3]+p[79]*plg[1, 5]
+                  )*sin(dgtr*g_long))
+
+    tt = 0.0
+    for i in range(14):
+        tt += abs(sw[i+1])*t[i]
+    return tt
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- GTS7 ------------------------------ */
+/* ------------------------------------------------------------------- */
+"""
+@njit(cache=True)
+def gts7(inp, ap_a, sw, swc, st, plg, tn1, tgn1, d, t, ws):
+    zn1 = ZN1
+    alpha = ALPHA
+    altl = ALTL
+    alt = inp[ALT]
+    tz = ws[TZ, 0:1]
+    tz[0] = t[1]
+
+    for j in range(9):
+        d[j] = 0
+
+    #/* TINF VARIATIONS NOT IMPORTANT BELOW ZA OR ZN1(1) */
+    if alt > zn1[0]:
+        tinf = PTM[0]*PT[0] * (1.0+sw[16]*globe7(PT, inp, ap_a, sw, swc, st, plg, ws))
+    else:
+        tinf = PTM[0]*PT[0]
+    t[0] = tinf
+
+    #/*  GRADIENT VARIATIONS NOT IMPORTANT BELOW ZN1(5) */
+    if alt > zn1[4]:
+        g0 = PTM[3]*PS[0] * (1.0+sw[19]*globe7(PS, inp, ap_a, sw, swc, st, plg, ws))
+    else:
+        g0 = PTM[3]*PS[0]
+    tlb = PTM[1] * (1.0 + sw[17]*globe7(PD[3], inp, ap_a, sw, swc, st, plg, ws))*PD[3, 0]
+    s = g0 / (tinf - tlb)
+
+    #/*      Lower thermosphere temp variations not significant for
+    # *       density above 300 km */
+    if alt < 300.0:
+        tn1[1] = PTM[6]*PTL[0, 0]/(1.0-sw[18]*glob7s(PTL[0], inp, sw, swc, st, plg, ws))
+        tn1[2] = PTM[2]*PTL[1, 0]/(1.0-sw[18]*glob7s(PTL[1], inp, sw, swc, st, plg, ws))
+        tn1[3] = PTM[7]*PTL[2, 0]/(1.0-sw[18]*glob7s(PTL[2], inp, sw, swc, st, plg, ws))
+        tn1[4] = PTM[4]*PTL[3, 0]/(1.0-sw[18]*sw[20]*glob7s(PTL[3], inp, sw, swc, st, plg, ws))
+        tgn1[1] = PTM[8]*PMA[8, 0]*(1.0+sw[18]*sw[20]*glob7s(PMA[8], inp, sw, swc, st, plg, ws))*tn1[4]*tn1[4]/((PTM[4]*PTL[3, 0])**2.0)
+    else:
+        tn1[1] = PTM[6]*PTL[0, 0]
+        tn1[2] = PTM[2]*PTL[1, 0]
+        tn1[3] = PTM[7]*PTL[2, 0]
+        tn1[4] = PTM[4]*PTL[3, 0]
+        tgn1[1] = PTM[8]*PMA[8, 0]*tn1[4]*tn1[4]/((PTM[4]*PTL[3, 0])**2.0)
+
+    #/* N2 variation factor at Zlb */
+    g28 = sw[21]*globe7(PD[2], inp, ap_a, sw, swc, st, plg, ws)
+
+    #/* VARIATION OF TURBOPAUSE HEIGHT */
+    zhf = PDL[1, 24]*(1.0+sw[5]*PDL[0, 24]*sin(dgtr*inp[G_LAT])*cos(dr*(inp[DOY]-PT[13])))
+    xmm = PDM[2, 4]
+    z = alt
+    zlb = PTM[5]
+
+    #/**** N2 DENSITY ****/
+    db28 = PDM[2, 0]*exp(g28)*PD[2, 0]
+    d[2] = densu(z, db28, tinf, tlb, 28.0, alpha[2], tz, zlb, s, zn1, tn1, tgn1, st, ws)
+    zh28 = PDM[2, 2]*zhf
+    zhm28 = PDM[2, 3]*PDL[1, 5]
+    xmd = 28.0-xmm
+    tzb = ws[TZ, 1:2]
+    b28 = densu(zh28, db28, tinf, tlb, xmd, (alpha[2]-1.0), tzb, zlb, s, zn1, tn1, tgn1, st, ws)
+    if sw[15] and (z <= altl[2]):
+        st[DM28] = densu(z, b28, tinf, tlb, xmm, alpha[2], tzb, zlb, s, zn1, tn1, tgn1, st, ws)
+        d[2] = dnet(d[2], st[DM28], zhm28, xmm, 28.0)
+
+    #/**** HE DENSITY ****/
+    g4 = sw[21]*globe7(PD[0], inp, ap_a, sw, swc, st, plg, ws)
+    db04 = PDM[0, 0]*exp(g4)*PD[0, 0]
+    d[0] = densu(z, db04, tinf, tlb, 4., alpha[0], tz, zlb, s, zn1, tn1, tgn1, st, ws)
+    if sw[15] and (z < altl[0]):
+        zh04 = PDM[0, 2]
+        b04 = densu(zh04, db04, tinf, tlb, 4.-xmm, alpha[0]-1., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        dm04 = densu(z, b04, tinf, tlb, xmm, 0., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        d[0] = dnet(d[0], dm04, zhm28, xmm, 4.)
+        rl = log(b28*PDM[0, 1]/b04)
+        zc04 = PDM[0, 4]*PDL[1, 0]
+        hc04 = PDM[0, 5]*PDL[1, 1]
+        d[0] = d[0]*ccor(z, rl, hc04, zc04)
+
+    #/**** O DENSITY ****/
+    g16 = sw[21]*globe7(PD[1], inp, ap_a, sw, swc, st, plg, ws)
+    db16 = PDM[1, 0]*exp(g16)*PD[1, 0]
+    d[1] = densu(z, db16, tinf, tlb, 16., alpha[1], tz, zlb, s, zn1, tn1, tgn1, st, ws)
+    if sw[15] and (z <= altl[1]):
+        zh16 = PDM[1, 2]
+        b16 = densu(zh16, db16, tinf, tlb, 16.0-xmm, (alpha[1]-1.0), tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        dm16 = densu(z, b16, tinf, tlb, xmm, 0., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        d[1] = dnet(d[1], dm16, zhm28, xmm, 16.)
+        rl = PDM[1, 1]*PDL[1, 16]*(1.0+sw[1]*PDL[0, 23]*(inp[F107A]-150.0))
+        hc16 = PDM[1, 5]*PDL[1, 3]
+        zc16 = PDM[1, 4]*PDL[1, 2]
+        hc216 = PDM[1, 5]*PDL[1, 4]
+        d[1] = d[1]*ccor2(z, rl, hc16, zc16, hc216)
+        #/*   Chemistry correction */
+        hcc16 = PDM[1, 7]*PDL[1, 13]
+        zcc16 = PDM[1, 6]*PDL[1, 12]
+        rc16 = PDM[1, 3]*PDL[1, 14]
+        d[1] = d[1]*ccor(z, rc16, hcc16, zcc16)
+
+    #/**** O2 DENSITY ****/
+    g32 = sw[21]*globe7(PD[4], inp, ap_a, sw, swc, st, plg, ws)
+    db32 = PDM[3, 0]*exp(g32)*PD[4, 0]
+    d[3] = densu(z, db32, tinf, tlb, 32., alpha[3], tz, zlb, s, zn1, tn1, tgn1, st, ws)
+    if sw[15]:
+        if z <= altl[3]:
+            zh32 = PDM[3, 2]
+            b32 = densu(zh32, db32, tinf, tlb, 32.-xmm, alpha[3]-1., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+            dm32 = densu(z, b32, tinf, tlb, xmm, 0., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+            d[3] = dnet(d[3], dm32, zhm28, xmm, 32.)
+            rl = log(b28*PDM[3, 1]/b32)
+            hc32 = PDM[3, 5]*PDL[1, 7]
+            zc32 = PDM[3, 4]*PDL[1, 6]
+            d[3] = d[3]*ccor(z, rl, hc32, zc32)
+        #/*  Correction for general departure from diffusive equilibrium above Zlb */
+        hcc32 = PDM[3, 7]*PDL[1, 22]
+        hcc232 = PDM[3, 7]*PDL[0, 22]
+        zcc32 = PDM[3, 6]*PDL[1, 21]
+        rc32 = PDM[3, 3]*PDL[1, 23]*(1.+sw[1]*PDL[0, 23]*(inp[F107A]-150.))
+        d[3] = d[3]*ccor2(z, rc32, hcc32, zcc32, hcc232)
+
+    #/**** AR DENSITY ****/
+    g40 = sw[21]*globe7(PD[5], inp, ap_a, sw, swc, st, plg, ws)
+    db40 = PDM[4, 0]*exp(g40)*PD[5, 0]
+    d[4] = densu(z, db40, tinf, tlb, 40., alpha[4], tz, zlb, s, zn1, tn1, tgn1, st, ws)
+    if sw[15] and (z <= altl[4]):
+        zh40 = PDM[4, 2]
+        b40 = densu(zh40, db40, tinf, tlb, 40.-xmm, alpha[4]-1., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        dm40 = densu(z, b40, tinf, tlb, xmm, 0., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        d[4] = dnet(d[4], dm40, zhm28, xmm, 40.)
+        rl = log(b28*PDM[4, 1]/b40)
+        hc40 = PDM[4, 5]*PDL[1, 9]
+        zc40 = PDM[4, 4]*PDL[1, 8]
+        d[4] = d[4]*ccor(z, rl, hc40, zc40)
+
+    #/**** HYDROGEN DENSITY ****/
+    g1 = sw[21]*globe7(PD[6], inp, ap_a, sw, swc, st, plg, ws)
+    db01 = PDM[5, 0]*exp(g1)*PD[6, 0]
+    d[6] = densu(z, db01, tinf, tlb, 1., alpha[6], tz, zlb, s, zn1, tn1, tgn1, st, ws)
+    if sw[15] and (z <= altl[6]):
+        zh01 = PDM[5, 2]
+        b01 = densu(zh01, db01, tinf, tlb, 1.-xmm, alpha[6]-1., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        dm01 = densu(z, b01, tinf, tlb, xmm, 0., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        d[6] = dnet(d[6], dm01, zhm28, xmm, 1.)
+        rl = log(b28*PDM[5, 1]*sqrt(PDL[1, 17]*PDL[1, 17])/b01)
+        hc01 = PDM[5, 5]*PDL[1, 11]
+        zc01 = PDM[5, 4]*PDL[1, 10]
+        d[6] = d[6]*ccor(z, rl, hc01, zc01)
+        #/*   Chemistry correction */
+        hcc01 = PDM[5, 7]*PDL[1, 19]
+        zcc01 = PDM[5, 6]*PDL[1, 18]
+        rc01 = PDM[5, 3]*PDL[1, 20]
+        d[6] = d[6]*ccor(z, rc01, hcc01, zcc01)
+
+    #/**** ATOMIC NITROGEN DENSITY ****/
+    g14 = sw[21]*globe7(PD[7], inp, ap_a, sw, swc, st, plg, ws)
+    db14 = PDM[6, 0]*exp(g14)*PD[7, 0]
+    d[7] = densu(z, db14, tinf, tlb, 14., alpha[7], tz, zlb, s, zn1, tn1, tgn1, st, ws)
+    if sw[15] and (z <= altl[7]):
+        zh14 = PDM[6, 2]
+        b14 = densu(zh14, db14, tinf, tlb, 14.-xmm, alpha[7]-1., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        dm14 = densu(z, b14, tinf, tlb, xmm, 0., tz, zlb, s, zn1, tn1, tgn1, st, ws)
+        d[7] = dnet(d[7], dm14, zhm28, xmm, 14.)
+        rl = log(b28*PDM[6, 1]*sqrt(PDL[0, 2]*PDL[0, 2])/b14)
+        hc14 = PDM[6, 5]*PDL[0, 1]
+        zc14 = PDM[6, 4]*PDL[0, 0]
+        d[7] = d[7]*ccor(z, rl, hc14, zc14)
+        #/*   Chemistry correction */
+        hcc14 = PDM[6, 7]*PDL[0, 4]
+        zcc14 = PDM[6, 6]*PDL[0, 3]
+        rc14 = PDM[6, 3]*PDL[0, 5]
+        d[7] = d[7]*ccor(z, rc14, hcc14, zcc14)
+
+    #/**** Anomalous OXYGEN DENSITY ****/
+    g16h = sw[21]*globe7(PD[8], inp, ap_a, sw, swc, st, plg, ws)
+    db16h = PDM[7, 0]*exp(g16h)*PD[8, 0]
+    tho = PDM[7, 9]*PDL[0, 6]
+    dd = densu(z, db16h, tho, tho, 16., alpha[8], tz, zlb, s, zn1, tn1, tgn1, st, ws)
+    zsht = PDM[7, 5]
+    zmho = PDM[7, 4]
+    zsho = scalh(zmho, 16.0, tho, st)
+    d[8] = dd*exp(-zsht/zsho*(exp(-(z-zmho)/zsht)-1.))
+
+    #/* total mass density */
+    d[5] = 1.66E-24*(4.0*d[0]+16.0*d[1]+28.0*d[2]+32.0*d[3]+40.0*d[4] + d[6]+14.0*d[7])
+
+    #/* temperature */
+    z = sqrt(alt*alt)
+    densu(z, 1.0, tinf, tlb, 0.0, 0.0, tz, zlb, s, zn1, tn1, tgn1, st, ws)
+    t[1] = tz[0]
+    if sw[0]:
+        for i in range(9):
+            d[i] = d[i]*1.0E6
+        d[5] = d[5]/1000
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- GTD7 ------------------------------ */
+/* ------------------------------------------------------------------- */
+"""
+def work_array():
+    '''Work array of gtd7_work, reusable for any number of calls of one thread'''
+    return np.zeros((NWORK, WORK_WIDTH))
+
+
+@njit(cache=True)
+def gtd7(inp, ap_a, sw, swc, d, t):
+    '''
+    gtd7 for one point. inp holds doy, year, sec, alt, g_lat, g_long, lst,
+    f107A, f107 and ap (see DOY ... AP), ap_a the 7 AP values, sw/swc the
+    switches set by tselec; d (9) and t (2) are filled in place.
+    '''
+    gtd7_work(inp, ap_a, sw, swc, d, t, np.zeros((NWORK, WORK_WIDTH)))
+
+
+@njit(cache=True)
+def gtd7_work(inp, ap_a, sw, swc, d, t, ws):
+    '''gtd7 on the buffers of the work array ws (see work_array), allocates nothing'''
+    ws[:] = 0.0
+    st = ws[ST, :NSTATE]
+    plg = ws[PLG:PLG+4, :9]
+    tn1 = ws[TN1, :5]
+    tgn1 = ws[TGN1, :2]
+    tn2 = ws[TN2, :4]
+    tgn2 = ws[TGN2, :2]
+    tn3 = ws[TN3, :5]
+    tgn3 = ws[TGN3, :2]
+    zn3 = ZN3
+    zn2 = ZN2
+    zmix = 62.5
+    sd = ws[SD, :9]
+    stt = ws[STT, :2]
+    alt = inp[ALT]
+
+    #/* Latitude variation of gravity (none for sw[2]=0) */
+    xlat = inp[G_LAT]
+    if sw[2] == 0:
+        xlat = 45.0
+    glatf(xlat, st)
+
+    xmm = PDM[2, 4]
+
+    #/* THERMOSPHERE / MESOSPHERE (above zn2[0]) */
+    tinp = ws[TINP, :10]
+    tinp[:] = inp
+    if alt > zn2[0]:
+        tinp[ALT] = alt
+    else:
+        tinp[ALT] = zn2[0]
+
+    gts7(tinp, ap_a, sw, swc, st, plg, tn1, tgn1, sd, stt, ws)
+    if sw[0]:
+        dm28m = st[DM28]*1.0E6
+    else:
+        dm28m = st[DM28]
+    t[0] = stt[0]
+    t[1] = stt[1]
+    if alt >= zn2[0]:
+        for i in range(9):
+            d[i] = sd[i]
+        return
+
+    #/*       LOWER MESOSPHERE/UPPER STRATOSPHERE (between zn3[0] and zn2[0])
+    #*         Temperature at nodes and gradients at end nodes
+    #*         Inverse temperature a linear function of spherical harmonics
+    #*/
+    tgn2[0] = tgn1[1]
+    tn2[0] = tn1[4]
+    tn2[1] = PMA[0, 0]*PAVGM[0]/(1.0-sw[20]*glob7s(PMA[0], inp, sw, swc, st, plg, ws))
+    tn2[2] = PMA[1, 0]*PAVGM[1]/(1.0-sw[20]*glob7s(PMA[1], inp, sw, swc, st, plg, ws))
+    tn2[3] = PMA[2, 0]*PAVGM[2]/(1.0-sw[20]*sw[22]*glob7s(PMA[2], inp, sw, swc, st, plg, ws))
+    tgn2[1] = PAVGM[8]*PMA[9, 0]*(1.0+sw[20]*sw[22]*glob7s(PMA[9], inp, sw, swc, st, plg, ws))*tn2[3]*tn2[3]/((PMA[2, 0]*PAVGM[2])**2.0)
+    tn3[0] = tn2[3]
+
+    if alt < zn3[0]:
+        #/*       LOWER STRATOSPHERE AND TROPOSPHERE (below zn3[0]) */
+        tgn3[0] = tgn2[1]
+        tn3[1] = PMA[3, 0]*PAVGM[3]/(1.0-sw[22]*glob7s(PMA[3], inp, sw, swc, st, plg, ws))
+        tn3[2] = PMA[4, 0]*PAVGM[4]/(1.0-sw[22]*glob7s(PMA[4], inp, sw, swc, st, plg, ws))
+        tn3[3] = PMA[5, 0]*PAVGM[5]/(1.0-sw[22]*glob7s(PMA[5], inp, sw, swc, st, plg, ws))
+        tn3[4] = PMA[6, 0]*PAVGM[6]/(1.0-sw[22]*glob7s(PMA[6], inp, sw, swc, st, plg, ws))
+        tgn3[1] = PMA[7, 0]*PAVGM[7]*(1.0+sw[22]*glob7s(PMA[7], inp, sw, swc, st, plg, ws))*tn3[4]*tn3[4]/((PMA[6, 0]*PAVGM[6])**2.0)
+
+    #/* LINEAR TRANSITION TO FULL MIXING BELOW zn2[0] */
+    dmc = 0.0
+    if alt > zmix:
+        dmc = 1.0 - (zn2[0]-alt)/(zn2[0] - zmix)
+    dz28 = sd[2]
+
+    #/**** N2 density ****/
+    dmr = sd[2] / dm28m - 1.0
+    tz = ws[TZ, 2:3]
+    d[2] = densm(alt, dm28m, xmm, tz, zn3, tn3, tgn3, zn2, tn2, tgn2, st, ws)
+    d[2] = d[2] * (1.0 + dmr*dmc)
+
+    #/**** HE density ****/
+    dmr = sd[0] / (dz28 * PDM[0, 1]) - 1.0
+    d[0] = d[2] * PDM[0, 1] * (1.0 + dmr*dmc)
+
+    #/**** O density ****/
+    d[1] = 0
+    d[8] = 0
+
+    #/**** O2 density ****/
+    dmr = sd[3] / (dz28 * PDM[3, 1]) - 1.0
+    d[3] = d[2] * PDM[3, 1] * (1.0 + dmr*dmc)
+
+    #/**** AR density ***/
+    dmr = sd[4] / (dz28 * PDM[4, 1]) - 1.0
+    d[4] = d[2] * PDM[4, 1] * (1.0 + dmr*dmc)
+
+    #/**** Hydrogen and atomic nitrogen density ****/
+    d[6] = 0
+    d[7] = 0
+
+    #/**** Total mass density */
+    d[5] = 1.66E-24 * (4.0 * d[0] + 16.0 * d[1] + 28.0 * d[2] + 32.0 * d[3] + 40.0 * d[4] + d[6] + 14.0 * d[7])
+    if sw[0]:
+        d[5] = d[5]/1000
+
+    #/**** temperature at altitude ****/
+    st[DD] = densm(alt, 1.0, 0, tz, zn3, tn3, tgn3, zn2, tn2, tgn2, st, ws)
+    t[1] = tz[0]
+
+
+@njit(cache=True)
+def gtd7_many(inp, ap_a, sw, swc, d, t):
+    '''gtd7 for every row of inp (N,10) and ap_a (N,7), filling d (N,9) and t (N,2)'''
+    ws = np.zeros((NWORK, WORK_WIDTH))
+    for i in range(inp.shape[0]):
+        gtd7_work(inp[i], ap_a[i], sw, swc, d[i], t[i], ws)
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ----------------------------- WRAPPERS ---------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+def _switches(flags):
+    tselec(flags)
+    return np.array(flags.sw, dtype=np.float64), np.array(flags.swc, dtype=np.float64)
+
+
+def gtd7_numba(Input, flags, output):
+    '''gtd7 of nrlmsise_00.py on the compiled model, same arguments and result'''
+    sw, swc = _switches(flags)
+    inp = np.array([Input.doy, Input.year, Input.sec, Input.alt, Input.g_lat, Input.g_long, Input.lst,
+                    Input.f107A, Input.f107, Input.ap], dtype=np.float64)
+    ap_a = np.zeros(7)
+    if flags.sw[9] == -1:
+        ap_a[:] = Input.ap_a.a
+    d = np.zeros(9)
+    t = np.zeros(2)
+    gtd7(inp, ap_a, sw, swc, d, t)
+    output.d[:] = array('d', d)
+    output.t[:] = array('d', t)
+
+
+def gtd7_vec_numba(doy, sec, alt, g_lat, g_long, f107, f107A, ap, ap_a=None, lst=0.0, flags=None):
+    '''gtd7_vec of nrlmsise_00_vec.py on the compiled model, same arguments and result'''
+    if flags is None:
+        flags = nrlmsise_flags()
+        for i in range(24):
+            flags.switches[i] = 1
+        if ap_a is not None:
+            flags.switches[9] = -1
+    sw, swc = _switches(flags)
+
+    doy, sec, alt, g_lat, g_long, f107, f107A, ap, lst = np.broadcast_arrays(doy, sec, alt, g_lat, g_long, f107,
+                                                                            f107A, ap, lst)
+    n = np.ravel(alt).shape[0]
+    inp = np.zeros((n, 10))
+    for col, x in ((DOY, doy), (SEC, sec), (ALT, alt), (G_LAT, g_lat), (G_LONG, g_long), (LST, lst),
+                   (F107A, f107A), (F107, f107), (AP, ap)):
+        inp[:, col] = np.ravel(x)
+    if flags.sw[9] == -1:
+        if ap_a is None:
+            raise ValueError("ap_a is required when flags.switches[9] == -1")
+        ap_rows = np.ascontiguousarray(np.broadcast_to(np.asarray(ap_a, dtype=np.float64), (n, 7)))
+    else:
+        ap_rows = np.zeros((n, 7))
+    d = np.zeros((n, 9))
+    t = np.zeros((n, 2))
+    gtd7_many(inp, ap_rows, sw, swc, d, t)
+    return d, t
@@ -0,0 +1,122 @@
+"""
+Checks the compiled model of nrlmsise_00_numba.py against the python gtd7
+for the 17 reference inputs of nrlmsise_00_test.py and for random inputs.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip('numba')
+
+from src.atmos.nrlmsise00.model.nrlmsise_00 import *
+from src.atmos.nrlmsise00.model.nrlmsise_00_vec import gtd7_vec
+from src.atmos.nrlmsise00.model.nrlmsise_00_numba import gtd7_vec_numba
+from src.atmos.nrlmsise00.model.nrlmsise_00_vec_test import reference_inputs, all_on
+
+
+def compare(Input, flags):
+    worst = 0.0
+    for i in Input:
+        ref = nrlmsise_output()
+        got = nrlmsise_output()
+        gtd7(i, flags, ref)
+        gtd7(i, flags, got, backend='numba')
+        ref = np.array(ref.d + ref.t)
+        got = np.array(got.d + got.t)
+        worst = max(worst, np.max(np.abs(got - ref) / np.maximum(np.abs(ref), 1e-300)))
+    return worst
+
+
+def test_gtd7_numba_reference():
+    Input = reference_inputs()
+    assert compare(Input[:15], all_on()) < 1e-10
+
+    aph = ap_array()
+    aph.a = [100.0 for _ in range(7)]
+    for i in Input[15:]:
+        i.ap_a = aph
+    assert compare(Input[15:], all_on(sw9=-1)) < 1e-10
+
+
+def test_gtd7_numba_random():
+    rng = np.random.RandomState(1)
+    n = 200
+    Input = []
+    for i in range(n):
+        aph = ap_array()
+        aph.a = list(rng.uniform(0, 200, 7))
+        Input.append(nrlmsise_input(doy=rng.randint(1, 366), sec=rng.uniform(0, 86400), alt=rng.uniform(0, 1000),
+                                    g_lat=rng.uniform(-90, 90), g_long=rng.uniform(-180, 180), lst=rng.uniform(0, 24),
+                                    f107A=rng.uniform(60, 250), f107=rng.uniform(60, 250), ap=rng.uniform(0, 100),
+                                    ap_a=aph))
+    assert compare(Input, all_on(sw0=1)) < 1e-10
+    assert compare(Input, all_on(sw0=1, sw9=-1)) < 1e-10
+
+
+def test_gtd7_vec_numba():
+    rng = np.random.RandomState(2)
+    n = 500
+    args = (rng.randint(1, 366, n), rng.uniform(0, 86400, n), rng.uniform(0, 1000, n), rng.uniform(-90, 90, n),
+            rng.uniform(-180, 180, n), rng.uniform(60, 250, n), rng.uniform(60, 250, n), rng.uniform(0, 100, n))
+    for ap_a in (None, rng.uniform(0, 200, (n, 7))):
+        d, t = gtd7_vec(*args, ap_a=ap_a)
+        dn, tn = gtd7_vec_numba(*args, ap_a=ap_a)
+        assert np.max(np.abs(dn - d) / np.maximum(np.abs(d), 1e-300)) < 1e-10
+        assert np.max(np.abs(tn - t) / t) < 1e-10
+
+
+def test_backend_name():
+    with pytest.raises(ValueError):
+        gtd7(reference_inputs()[0], all_on(), nrlmsise_output(), backend='fortran')
+
+
+def test_evaluator_numba():
+    from src.atmos.nrlmsise00.AtmosCalcFloat import AtmosphereEvaluator
+
+    indices = [150, 140, 15, 12, 20, 10, 15, 14, 16]
+    python = AtmosphereEvaluator(indices)
+    numba = AtmosphereEvaluator(indices, backend='numba')
+    out = np.zeros((2, 11))
+    for alt in (50.0, 150.0, 400.0):
+        ref = np.array(python.evaluate_into(out[0], 100, 3600, alt, 20.0, 30.0))
+        scale = np.maximum(np.abs(ref), 1e-300)
+        assert np.max(np.abs(numba.evaluate_into(out[1], 100, 3600, alt, 20.0, 30.0) - ref) / scale) < 1e-10
+        assert np.max(np.abs(np.array(numba.evaluate(100, 3600, alt, 20.0, 30.0).d) - ref[:9]) / scale[:9]) < 1e-10
+
+
+def test_gtd7_work():
+    '''A reused Work Array gives the Result of a fresh gtd7 at every Point and allocates nothing in the Loop'''
+    from numba.core.runtime import rtsys, _nrt_python
+    from src.atmos.nrlmsise00.model import nrlmsise_00_numba as model
+
+    rng = np.random.RandomState(4)
+    n = 50
+    inp = np.zeros((n, 10))
+    inp[:, model.DOY] = rng.randint(1, 366, n)
+    inp[:, model.SEC] = rng.uniform(0, 86400, n)
+    inp[:, model.ALT] = rng.uniform(0, 1000, n)
+    inp[:, model.G_LAT] = rng.uniform(-90, 90, n)
+    inp[:, model.G_LONG] = rng.uniform(-180, 180, n)
+    inp[:, model.F107A:model.AP+1] = rng.uniform(60, 250, (n, 3))
+    ap_a = rng.uniform(0, 200, (n, 7))
+    sw, swc = model._switches(all_on(sw9=-1))
+
+    work = model.work_array()
+    for i in range(n):
+        d, t, dw, tw = np.zeros(9), np.zeros(2), np.zeros(9), np.zeros(2)
+        model.gtd7(inp[i], ap_a[i], sw, swc, d, t)
+        model.gtd7_work(inp[i], ap_a[i], sw, swc, dw, tw, work)
+        assert np.array_equal(dw, d) and np.array_equal(tw, t)
+
+    '''gtd7_many shares one Work Array, so 1 and n Points allocate the same'''
+    d, t = np.zeros((n, 9)), np.zeros((n, 2))
+    _nrt_python.memsys_enable_stats()
+    try:
+        allocs = []
+        for rows in (1, n):
+            before = rtsys.get_allocation_stats().alloc
+            model.gtd7_many(inp[:rows], ap_a[:rows], sw, swc, d[:rows], t[:rows])
+            allocs.append(rtsys.get_allocation_stats().alloc - before)
+    finally:
+        _nrt_python.memsys_disable_stats()
+    assert allocs[0] == allocs[1]
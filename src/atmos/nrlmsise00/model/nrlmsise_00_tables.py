@@ -0,0 +1,46 @@
+"""
+Lazy loading of the NRLMSISE-00 coefficient tables
+
+The tables of nrlmsise_00_data.py are kept as a binary .npz file next to this
+module and read on the first call of load_tables, so importing the model does
+not parse the 1500 lines of literals. nrlmsise_00_data.py stays the source of
+the coefficients, build_tables writes the binary file from it.
+/* -------------------------------------------------------------------- */
+/* ---------  N R L M S I S E - 0 0    M O D E L    2 0 0 1  ---------- */
+/* -------------------------------------------------------------------- */
+"""
+
+import os
+import numpy as np
+
+TABLES_FILEPATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nrlmsise_00_data.npz')
+
+'''Names of the tables in the order load_tables returns them'''
+NAMES = ('pt', 'pd', 'ps', 'pdl', 'ptl', 'pma', 'sam', 'ptm', 'pdm', 'pavgm')
+
+_tables = {}
+
+
+def build_tables(filepath=TABLES_FILEPATH):
+    '''Writes the tables of nrlmsise_00_data.py to the binary file'''
+    from src.atmos.nrlmsise00.model import nrlmsise_00_data as data
+    np.savez(filepath, **{name: np.array(getattr(data, name), dtype=np.float64) for name in NAMES})
+
+
+def load_tables(filepath=TABLES_FILEPATH):
+    '''
+    Returns the tables (pt, pd, ps, pdl, ptl, pma, sam, ptm, pdm, pavgm) as
+    nested lists of floats, the binary file is read once per process and
+    built from nrlmsise_00_data.py if it is missing.
+    '''
+    if filepath not in _tables:
+        if not os.path.exists(filepath):
+            build_tables(filepath)
+        with np.load(filepath) as data:
+            _tables[filepath] = tuple(data[name].tolist() for name in NAMES)
+    return _tables[filepath]
+
+
+def load_arrays(filepath=TABLES_FILEPATH):
+    '''The tables of load_tables as float64 arrays, in the same order'''
+    return tuple(np.array(table, dtype=np.float64) for table in load_tables(filepath))
@@ -28,8 +28,12 @@ This is the test program, and the output should be compaired to
 """
 
 from __future__ import print_function
+import sys
 import time
-from nrlmsise_00 import *
+from concurrent.futures import ThreadPoolExecutor
+from src.atmos.nrlmsise00.model.nrlmsise_00 import *
+from src.atmos.nrlmsise00.model.nrlmsise_00_tables import NAMES, load_tables
+from src.atmos.nrlmsise00.model import nrlmsise_00_data
 
 def test_gtd7():
     output = [nrlmsise_output() for _ in range(17)]
@@ -160,8 +164,43 @@ def test_gtd7():
 
 
 
-
-
+def run_gtd7(args):
+    alt, lat, doy, aph = args
+    flags = nrlmsise_flags()
+    for i in range(24):
+        flags.switches[i]=1
+    Input = nrlmsise_input(doy=doy, sec=29000, alt=alt, g_lat=lat, g_long=-70, lst=16, f107A=150, f107=150, ap=4)
+    if aph:
+        flags.switches[9] = -1
+        Input.ap_a = ap_array()
+        for i in range(7):
+            Input.ap_a.a[i] = 10*(i+1)
+    output = nrlmsise_output()
+    gtd7(Input, flags, output)
+    assert Input.alt == alt
+    return output.d + output.t
+
+
+def test_gtd7_threads():
+    """Parallel evaluations must give the same answers as serial ones"""
+    cases = [(alt, lat, doy, aph) for alt in (0, 20, 50, 70, 90, 150, 400)
+             for lat in (-60, 0, 45) for doy in (1, 172) for aph in (False, True)]
+    serial = [run_gtd7(case) for case in cases]
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            parallel = list(pool.map(run_gtd7, cases*4))
+    finally:
+        sys.setswitchinterval(interval)
+    assert parallel == serial*4
+
+
+def test_tables():
+    """The binary tables must hold exactly the coefficients of nrlmsise_00_data.py"""
+    for name, table in zip(NAMES, load_tables()):
+        assert table == getattr(nrlmsise_00_data, name)
 
 
 if __name__ == '__main__':
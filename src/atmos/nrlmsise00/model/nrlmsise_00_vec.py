@@ -0,0 +1,1010 @@
+"""
+Vectorised NumPy version of the NRLMSISE-00 model in nrlmsise_00.py
+
+This is a branch-free rewrite of gtd7/gts7 that evaluates N points per call.
+All per-point quantities are NumPy arrays of shape (N,), data dependent
+branches of the C code are replaced by masks and np.where, while branches on
+the flags stay plain python if statements (the flags are shared by all points).
+
+The arithmetic follows the scalar port operation by operation so that the
+results agree with gtd7 to round-off.
+/* -------------------------------------------------------------------- */
+/* ---------  N R L M S I S E - 0 0    M O D E L    2 0 0 1  ---------- */
+/* -------------------------------------------------------------------- */
+"""
+
+import numpy as np
+
+from src.atmos.nrlmsise00.model.nrlmsise_00_header import nrlmsise_flags, OUTPUT_DTYPE
+from src.atmos.nrlmsise00.model.nrlmsise_00_tables import load_tables
+from src.atmos.nrlmsise00.model.nrlmsise_00 import tselec
+
+rgas = 831.4
+dgtr = 1.74533E-2
+dr = 1.72142E-2
+sr = 7.2722E-5
+hr = 0.2618
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------ STATE ------------------------------ */
+/* ------------------------------------------------------------------- */
+"""
+class _vec_state(object):
+    '''
+    Per call replacement of the shared variables of the scalar model
+    (PARMB, DMIX, MESO7, LPOLY). Every attribute holds one value per point.
+    '''
+    def __init__(self, doy, sec, g_lat, g_long, lst, f107A, f107, ap, ap_a, flags):
+        self.doy = doy
+        self.sec = sec
+        self.g_lat = g_lat
+        self.g_long = g_long
+        self.lst = lst
+        self.f107A = f107A
+        self.f107 = f107
+        self.ap = ap
+        self.ap_a = ap_a
+        self.flags = flags
+
+        #/* PARMB */
+        xlat = g_lat
+        if flags.sw[2] == 0:
+            xlat = np.full_like(g_lat, 45.0)
+        self.gsurf, self.re = glatf(xlat)
+
+        #/* LPOLY */
+        self.plg = legendre(g_lat)
+        self.dfa = f107A - 150.0
+        self.apt0 = np.zeros_like(g_lat)
+        self.apdf = np.zeros_like(g_lat)
+        if not ((flags.sw[7] == 0) and (flags.sw[8] == 0) and (flags.sw[14] == 0)):
+            self.stloc = np.sin(hr*lst)
+            self.ctloc = np.cos(hr*lst)
+            self.s2tloc = np.sin(2.0*hr*lst)
+            self.c2tloc = np.cos(2.0*hr*lst)
+            self.s3tloc = np.sin(3.0*hr*lst)
+            self.c3tloc = np.cos(3.0*hr*lst)
+
+        #/* DMIX */
+        self.dm28 = np.zeros_like(g_lat)
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------ GLATF ------------------------------ */
+/* ------------------------------------------------------------------- */
+"""
+def glatf(lat):
+    c2 = np.cos(2.0*dgtr*lat)
+    gv = 980.616 * (1.0 - 0.0026373 * c2)
+    reff = 2.0 * gv / (3.085462E-6 + 2.27E-9 * c2) * 1.0E-5
+    return gv, reff
+
+
+def legendre(g_lat):
+    '''Legendre polynomials of GLOBE7, returned as a (4, 9, N) array'''
+    c = np.sin(g_lat * dgtr)
+    s = np.cos(g_lat * dgtr)
+    c2 = c*c
+    c4 = c2*c2
+    s2 = s*s
+
+    plg = np.zeros((4, 9) + np.shape(g_lat))
+    plg[0][1] = c
+    plg[0][2] = 0.5*(3.0*c2 -1.0)
+    plg[0][3] = 0.5*(5.0*c*c2-3.0*c)
+    plg[0][4] = (35.0*c4 - 30.0*c2 + 3.0)/8.0
+    plg[0][5] = (63.0*c2*c2*c - 70.0*c2*c + 15.0*c)/8.0
+    plg[0][6] = (11.0*c*plg[0][5] - 5.0*plg[0][4])/6.0
+    plg[1][1] = s
+    plg[1][2] = 3.0*c*s
+    plg[1][3] = 1.5*(5.0*c2-1.0)*s
+    plg[1][4] = 2.5*(7.0*c2*c-3.0*c)*s
+    plg[1][5] = 1.875*(21.0*c4 - 14.0*c2 +1.0)*s
+    plg[1][6] = (11.0*c*plg[1][5]-6.0*plg[1][4])/5.0
+    plg[2][2] = 3.0*s2
+    plg[2][3] = 15.0*s2*c
+    plg[2][4] = 7.5*(7.0*c2 -1.0)*s2
+    plg[2][5] = 3.0*c*plg[2][4]-2.0*plg[2][3]
+    plg[2][6] =(11.0*c*plg[2][5]-7.0*plg[2][4])/4.0
+    plg[2][7] =(13.0*c*plg[2][6]-8.0*plg[2][5])/5.0
+    plg[3][3] = 15.0*s2*s
+    plg[3][4] = 105.0*s2*s*c
+    plg[3][5] =(9.0*c*plg[3][4]-7.*plg[3][3])/2.0
+    plg[3][6] =(11.0*c*plg[3][5]-8.*plg[3][4])/3.0
+    return plg
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------ CCOR ------------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+def ccor(alt, r, h1, zh):
+    e = (alt - zh) / h1
+    ccor_v = np.exp(r / (1.0 + np.exp(np.minimum(e, 70.0))))
+    ccor_v = np.where(e < -70, np.exp(r), ccor_v)
+    return np.where(e > 70, 1.0, ccor_v)
+
+
+def ccor2(alt, r, h1, zh, h2):
+    e1 = (alt - zh) / h1
+    e2 = (alt - zh) / h2
+    ex1 = np.exp(np.minimum(e1, 70.0))
+    ex2 = np.exp(np.minimum(e2, 70.0))
+    ccor2v = np.exp(r / (1.0 + 0.5 * (ex1 + ex2)))
+    ccor2v = np.where((e1 < -70) & (e2 < -70), np.exp(r), ccor2v)
+    return np.where((e1 > 70) | (e2 > 70), 1.0, ccor2v)
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- SCALH ----------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+def scalh(state, alt, xm, temp):
+    g = state.gsurf / (np.power((1.0 + alt/state.re),2.0))
+    return rgas * temp / (g * xm)
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* -------------------------------- DNET ----------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+def dnet(dd, dm, zhm, xmm, xm):
+    '''Turbopause correction, see nrlmsise_00.dnet'''
+    a = zhm / (xmm-xm)
+    ylog = a * np.log(dm/dd)
+    dnet_v = dd*np.power((1.0 + np.exp(np.clip(ylog, -10.0, 10.0))),(1.0/a))
+    dnet_v = np.where(ylog < -10, dd, np.where(ylog > 10, dm, dnet_v))
+
+    #/* degenerate cases, handled before the log in the scalar version */
+    dnet_v = np.where(dd == 0, dm, dnet_v)
+    dnet_v = np.where(dm == 0, np.where(dd == 0, 1.0, dd), dnet_v)
+    return dnet_v
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------ SPLINE, SPLINT, SPLINI ------------------- */
+/* ------------------------------------------------------------------- */
+"""
+def spline(x, y, yp1, ypn):
+    '''
+    Second derivatives of the cubic spline through (x, y).
+    x and y are (n, N) arrays, one spline per column.
+    '''
+    n = x.shape[0]
+    y2 = np.empty_like(y)
+    u = np.empty_like(y)
+
+    big1 = yp1 > 0.99E30
+    y2[0] = np.where(big1, 0.0, -0.5)
+    u[0] = np.where(big1, 0.0, (3.0/(x[1]-x[0]))*((y[1]-y[0])/(x[1]-x[0])-yp1))
+
+    for i in range(1, n-1):
+        sig = (x[i]-x[i-1])/(x[i+1] - x[i-1])
+        p = sig * y2[i-1] + 2.0
+        y2[i] = (sig - 1.0) / p
+        u[i] = (6.0 * ((y[i+1] - y[i])/(x[i+1] - x[i]) -(y[i] - y[i-1]) / (x[i] - x[i-1]))/(x[i+1] - x[i-1]) - sig * u[i-1])/p
+
+    bign = ypn > 0.99E30
+    qn = np.where(bign, 0.0, 0.5)
+    un = np.where(bign, 0.0, (3.0 / (x[n-1] - x[n-2])) * (ypn - (y[n-1] - y[n-2])/(x[n-1] - x[n-2])))
+
+    y2[n-1] = (un - qn * u[n-2]) / (qn * y2[n-2] + 1.0)
+    for k in range(n-2, -1, -1):
+        y2[k] = y2[k] * y2[k+1] + u[k]
+    return y2
+
+
+def splint(xa, ya, y2a, x):
+    '''Cubic spline interpolation at x, the bisection search becomes a count of passed nodes'''
+    n = xa.shape[0]
+    shape = (n,) + np.broadcast(xa[0], x).shape
+    xa, ya, y2a = [np.broadcast_to(a, shape) for a in (xa, ya, y2a)]
+    klo = np.sum(xa[1:n-1] <= x, axis=0)
+    khi = klo + 1
+    col = np.arange(xa.shape[1])
+
+    xlo, xhi = xa[klo, col], xa[khi, col]
+    h = xhi - xlo
+    a = (xhi - x)/h
+    b = (x - xlo)/h
+    return a * ya[klo, col] + b * ya[khi, col] + ((a*a*a - a) * y2a[klo, col] + (b*b*b - b) * y2a[khi, col]) * h * h/6.0
+
+
+def splini(xa, ya, y2a, x):
+    '''Integral of the cubic spline from xa[0] to x'''
+    n = xa.shape[0]
+    yi = np.zeros(np.broadcast(x, xa[0]).shape)
+    for klo in range(n-1):
+        khi = klo + 1
+        active = x > xa[klo]
+        if not np.any(active):
+            break
+        if khi < (n-1):
+            xx = np.where(x < xa[khi], x, xa[khi])
+        else:
+            xx = x
+        h = xa[khi] - xa[klo]
+        a = (xa[khi] - xx)/h
+        b = (xx - xa[klo])/h
+        a2 = a*a
+        b2 = b*b
+        seg = ((1.0 - a2) * ya[klo] / 2.0 + b2 * ya[khi] / 2.0 + ((-(1.0+a2*a2)/4.0 + a2/2.0) * y2a[klo] + (b2*b2/4.0 - b2/2.0) * y2a[khi]) * h * h / 6.0) * h
+        yi = np.where(active, yi + seg, yi)
+    return yi
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- DENSM ----------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+def zeta(state, zz, zl):
+    return ((zz-zl)*(state.re+zl)/(state.re+zz))
+
+
+def _spline_nodes(state, zn, tn, tgn):
+    '''Spline nodes in normalised geopotential height and inverse temperature'''
+    mn = len(zn)
+    z1 = zn[0]
+    z2 = zn[mn-1]
+    zgdif = zeta(state, z2, z1)
+    shape = np.broadcast(state.re, *tn).shape
+    xs = np.array([np.broadcast_to(zeta(state, zn[k], z1) / zgdif, shape) for k in range(mn)])
+    ys = np.array([np.broadcast_to(1.0 / tn[k], shape) for k in range(mn)])
+    yd1 = -tgn[0] / (tn[0]*tn[0]) * zgdif
+    yd2 = -tgn[1] / (tn[mn-1]*tn[mn-1]) * zgdif * (np.power(((state.re+z2)/(state.re+z1)),2.0))
+    return xs, ys, spline(xs, ys, yd1, yd2), zgdif
+
+
+def densm(state, alt, d0, xm, zn3, tn3, tgn3, zn2, tn2, tgn2):
+    '''
+    Temperature and density profiles for the lower atmosphere, only valid
+    for alt < zn2[0]. Returns (density, temperature); for xm == 0 the
+    density is the temperature, as in the scalar version.
+    '''
+    #/* STRATOSPHERE/MESOSPHERE TEMPERATURE */
+    mn2 = len(zn2)
+    z = np.where(alt > zn2[mn2-1], alt, zn2[mn2-1])
+    z1 = zn2[0]
+    t1 = tn2[0]
+    xs, ys, y2out, zgdif = _spline_nodes(state, zn2, tn2, tgn2)
+    x = zeta(state, z, z1)/zgdif
+    tz = 1.0 / splint(xs, ys, y2out, x)
+    densm_tmp = d0
+    if xm != 0.0:
+        glb = state.gsurf / (np.power((1.0 + z1/state.re),2.0))
+        gamm = xm * glb * zgdif / rgas
+        expl = np.minimum(gamm*splini(xs, ys, y2out, x), 50.0)
+        densm_tmp = densm_tmp * (t1 / tz) * np.exp(-expl)
+
+    #/* troposhere / stratosphere temperature */
+    low = alt <= zn3[0]
+    if np.any(low):
+        z1 = zn3[0]
+        t1 = tn3[0]
+        xs, ys, y2out, zgdif = _spline_nodes(state, zn3, tn3, tgn3)
+        x = zeta(state, alt, z1)/zgdif
+        tz3 = 1.0 / splint(xs, ys, y2out, x)
+        if xm != 0.0:
+            glb = state.gsurf / (np.power((1.0 + z1/state.re),2.0))
+            gamm = xm * glb * zgdif / rgas
+            expl = np.minimum(gamm*splini(xs, ys, y2out, x), 50.0)
+            densm_tmp = np.where(low, densm_tmp * (t1 / tz3) * np.exp(-expl), densm_tmp)
+        tz = np.where(low, tz3, tz)
+
+    if xm == 0.0:
+        return tz, tz
+    return densm_tmp, tz
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- DENSU ----------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+def densu(state, alt, dlb, tinf, tlb, xm, alpha, zlb, s2, zn1, tn1, tgn1):
+    '''
+    Temperature and density profiles for MSIS models, returns (density, temperature).
+    For xm == 0 the density is the temperature, as in the scalar version.
+    tn1[0] and tgn1[0] are overwritten by the Bates profile values at za,
+    exactly like the scalar version does with the MESO7 globals.
+    '''
+    #/* joining altitudes of Bates and spline */
+    za = zn1[0]
+    z = np.where(alt > za, alt, za)
+
+    #/* geopotential altitude difference from ZLB */
+    zg2 = zeta(state, z, zlb)
+
+    #/* Bates temperature */
+    tt = tinf - (tinf - tlb) * np.exp(-s2*zg2)
+    ta = tt
+    tz = tt
+
+    below = alt < za
+    if np.any(below):
+        #/* calculate temperature below ZA
+        # * temperature gradient at ZA from Bates profile */
+        dta = (tinf - ta) * s2 * np.power(((state.re+zlb)/(state.re+za)),2.0)
+        mn1 = len(zn1)
+        tn = [ta] + list(tn1[1:])
+        tgn = [dta, tgn1[1]]
+        z = np.where(alt > zn1[mn1-1], alt, zn1[mn1-1])
+        z1 = zn1[0]
+        t1 = ta
+        xs, ys, y2out, zgdif = _spline_nodes(state, zn1, tn, tgn)
+        x = zeta(state, z, z1) / zgdif
+        tz = np.where(below, 1.0 / splint(xs, ys, y2out, x), tz)
+
+    if xm == 0:
+        return tz, tz
+
+    #/* calculate density above za */
+    glb = state.gsurf / np.power((1.0 + zlb/state.re),2.0)
+    gamma = xm * glb / (s2 * rgas * tinf)
+    expl = np.exp(-s2 * gamma * zg2)
+    expl = np.where((expl > 50.0) | (tt <= 0), 50.0, expl)
+
+    #/* density at altitude */
+    densa = dlb * np.power((tlb/tt),((1.0+alpha+gamma))) * expl
+    if not np.any(below):
+        return densa, tz
+
+    #/* calculate density below za */
+    glb = state.gsurf / np.power((1.0 + z1/state.re),2.0)
+    gamm = xm * glb * zgdif / rgas
+
+    #/* integrate spline temperatures */
+    expl = gamm * splini(xs, ys, y2out, x)
+    expl = np.where((expl > 50.0) | (tz <= 0), 50.0, expl)
+
+    #/* density at altitude */
+    densb = densa * np.power((t1 / tz),(1.0 + alpha)) * np.exp(-expl)
+    return np.where(below, densb, densa), tz
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- GLOBE7 ---------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+def g0(a, p):
+    return (a - 4.0 + (p[25] - 1.0) * (a - 4.0 + (np.exp(-np.sqrt(p[24]*p[24]) * (a - 4.0)) - 1.0) / np.sqrt(p[24]*p[24])))
+
+
+def sumex(ex):
+    return (1.0 + (1.0 - np.power(ex,19.0)) / (1.0 - ex) * np.power(ex,0.5))
+
+
+def sg0(ex, p, ap):
+    return (g0(ap[1],p) + (g0(ap[2],p)*ex + g0(ap[3],p)*ex*ex + \
+                g0(ap[4],p)*np.power(ex,3.0) + (g0(ap[5],p)*np.power(ex,4.0) + \
+                g0(ap[6],p)*np.power(ex,12.0))*(1.0-np.power(ex,8.0))/(1.0-ex)))/sumex(ex)
+
+
+def globe7(p, state):
+    '''
+    CALCULATE G(L) FUNCTION, Upper Thermosphere Parameters.
+    Updates state.apt0 / state.apdf like the scalar version updates apt / apdf.
+    '''
+    flags = state.flags
+    plg = state.plg
+    t = [0.0 for _ in range(15)]
+    tloc = state.lst
+
+    cd32 = np.cos(dr*(state.doy-p[31]))
+    cd18 = np.cos(2.0*dr*(state.doy-p[17]))
+    cd14 = np.cos(dr*(state.doy-p[13]))
+    cd39 = np.cos(2.0*dr*(state.doy-p[38]))
+
+    #/* F10.7 EFFECT */
+    df = state.f107 - state.f107A
+    dfa = state.dfa
+    t[0] =  p[19]*df*(1.0+p[59]*dfa) + p[20]*df*df + p[21]*dfa + p[29]*np.power(dfa,2.0)
+    f1 = 1.0 + (p[47]*dfa +p[19]*df+p[20]*df*df)*flags.swc[1]
+    f2 = 1.0 + (p[49]*dfa+p[19]*df+p[20]*df*df)*flags.swc[1]
+
+    #/*  TIME INDEPENDENT */
+    t[1] = (p[1]*plg[0][2]+ p[2]*plg[0][4]+p[22]*plg[0][6]) + \
+          (p[14]*plg[0][2])*dfa*flags.swc[1] +p[26]*plg[0][1]
+
+    #/*  SYMMETRICAL ANNUAL */
+    t[2] = p[18]*cd32
+
+    #/*  SYMMETRICAL SEMIANNUAL */
+    t[3] = (p[15]+p[16]*plg[0][2])*cd18
+
+    #/*  ASYMMETRICAL ANNUAL */
+    t[4] =  f1*(p[9]*plg[0][1]+p[10]*plg[0][3])*cd14
+
+    #/*  ASYMMETRICAL SEMIANNUAL */
+    t[5] =    p[37]*plg[0][1]*cd39
+
+    #/* DIURNAL */
+    if (flags.sw[7]):
+        t71 = (p[11]*plg[1][2])*cd14*flags.swc[5]
+        t72 = (p[12]*plg[1][2])*cd14*flags.swc[5]
+        t[6] = f2*((p[3]*plg[1][1] + p[4]*plg[1][3] + p[27]*plg[1][5] + t71) * \
+                   state.ctloc + (p[6]*plg[1][1] + p[7]*plg[1][3] + p[28]*plg[1][5] \
+                            + t72)*state.stloc)
+
+    #/* SEMIDIURNAL */
+    if (flags.sw[8]):
+        t81 = (p[23]*plg[2][3]+p[35]*plg[2][5])*cd14*flags.swc[5]
+        t82 = (p[33]*plg[2][3]+p[36]*plg[2][5])*cd14*flags.swc[5]
+        t[7] = f2*((p[5]*plg[2][2]+ p[41]*plg[2][4] + t81)*state.c2tloc +(p[8]*plg[2][2] + p[42]*plg[2][4] + t82)*state.s2tloc)
+
+    #/* TERDIURNAL */
+    if (flags.sw[14]):
+        t[13] = f2 * ((p[39]*plg[3][3]+(p[93]*plg[3][4]+p[46]*plg[3][6])*cd14*flags.swc[5])* state.s3tloc +(p[40]*plg[3][3]+(p[94]*plg[3][4]+p[48]*plg[3][6])*cd14*flags.swc[5])* state.c3tloc)
+
+    #/* magnetic activity based on daily ap */
+    if (flags.sw[9]==-1):
+        if (p[51]!=0):
+            exp1 = np.exp(-10800.0*np.sqrt(p[51]*p[51])/(1.0+p[138]*(45.0-np.sqrt(state.g_lat*state.g_lat))))
+            exp1 = np.minimum(exp1, 0.99999)
+            if (p[24]<1.0E-4):
+                p[24]=1.0E-4
+            state.apt0 = sg0(exp1,p,state.ap_a)
+            if (flags.sw[9]):
+                t[8] = state.apt0*(p[50]+p[96]*plg[0][2]+p[54]*plg[0][4]+ \
+                        (p[125]*plg[0][1]+p[126]*plg[0][3]+p[127]*plg[0][5])*cd14*flags.swc[5]+ \
+                        (p[128]*plg[1][1]+p[129]*plg[1][3]+p[130]*plg[1][5])*flags.swc[7]* \
+                                       np.cos(hr*(tloc-p[131])))
+    else:
+        apd=state.ap-4.0
+        p44=p[43]
+        p45=p[44]
+        if (p44<0):
+            p44 = 1.0E-5
+        state.apdf = apd + (p45-1.0)*(apd + (np.exp(-p44 * apd) - 1.0)/p44)
+        if (flags.sw[9]):
+            t[8]=state.apdf*(p[32]+p[45]*plg[0][2]+p[34]*plg[0][4]+ \
+             (p[100]*plg[0][1]+p[101]*plg[0][3]+p[102]*plg[0][5])*cd14*flags.swc[5]+
+             (p[121]*plg[1][1]+p[122]*plg[1][3]+p[123]*plg[1][5])*flags.swc[7]*
+                np.cos(hr*(tloc-p[124])))
+
+    if (flags.sw[10]):
+            lon_on = state.g_long > -1000.0
+
+            #/* longitudinal */
+            if (flags.sw[11]):
+                    t[10] = (1.0 + p[80]*dfa*flags.swc[1])* \
+                     ((p[64]*plg[1][2]+p[65]*plg[1][4]+p[66]*plg[1][6]\
+                      +p[103]*plg[1][1]+p[104]*plg[1][3]+p[105]*plg[1][5]\
+                      +flags.swc[5]*(p[109]*plg[1][1]+p[110]*plg[1][3]+p[111]*plg[1][5])*cd14)* \
+                          np.cos(dgtr*state.g_long) \
+                      +(p[90]*plg[1][2]+p[91]*plg[1][4]+p[92]*plg[1][6]\
+                      +p[106]*plg[1][1]+p[107]*plg[1][3]+p[108]*plg[1][5]\
+                      +flags.swc[5]*(p[112]*plg[1][1]+p[113]*plg[1][3]+p[114]*plg[1][5])*cd14)* \
+                      np.sin(dgtr*state.g_long))
+                    t[10] = np.where(lon_on, t[10], 0.0)
+
+            #/* ut and mixed ut, longitude */
+            if (flags.sw[12]):
+                    t[11]=(1.0+p[95]*plg[0][1])*(1.0+p[81]*dfa*flags.swc[1])*\
+                            (1.0+p[119]*plg[0][1]*flags.swc[5]*cd14)*\
+                            ((p[68]*plg[0][1]+p[69]*plg[0][3]+p[70]*plg[0][5])*\
+                            np.cos(sr*(state.sec-p[71])))
+                    t[11]+=flags.swc[11]*\
+                            (p[76]*plg[2][3]+p[77]*plg[2][5]+p[78]*plg[2][7])*\
+                            np.cos(sr*(state.sec-p[79])+2.0*dgtr*state.g_long)*(1.0+p[137]*dfa*flags.swc[1])
+                    t[11] = np.where(lon_on, t[11], 0.0)
+
+            #/* ut, longitude magnetic activity */
+            if (flags.sw[13]):
+                if (flags.sw[9]==-1):
+                    if (p[51]):
+                            t[12]=state.apt0*flags.swc[11]*(1.+p[132]*plg[0][1])*\
+                                    ((p[52]*plg[1][2]+p[98]*plg[1][4]+p[67]*plg[1][6])*\
+                                     np.cos(dgtr*(state.g_long-p[97])))\
+                                    +state.apt0*flags.swc[11]*flags.swc[5]*\
+                                    (p[133]*plg[1][1]+p[134]*plg[1][3]+p[135]*plg[1][5])*\
+                                    cd14*np.cos(dgtr*(state.g_long-p[136])) \
+                                    +state.apt0*flags.swc[12]* \
+                                    (p[55]*plg[0][1]+p[56]*plg[0][3]+p[57]*plg[0][5])*\
+                                    np.cos(sr*(state.sec-p[58]))
+                            t[12] = np.where(lon_on, t[12], 0.0)
+                else:
+                    t[12] = state.apdf*flags.swc[11]*(1.0+p[120]*plg[0][1])*\
+                            ((p[60]*plg[1][2]+p[61]*plg[1][4]+p[62]*plg[1][6])*\
+                            np.cos(dgtr*(state.g_long-p[63])))\
+                            +state.apdf*flags.swc[11]*flags.swc[5]* \
+                            (p[115]*plg[1][1]+p[116]*plg[1][3]+p[117]*plg[1][5])* \
+                            cd14*np.cos(dgtr*(state.g_long-p[118])) \
+                            + state.apdf*flags.swc[12]* \
+                            (p[83]*plg[0][1]+p[84]*plg[0][3]+p[85]*plg[0][5])* \
+                            np.cos(sr*(state.sec-p[75]))
+                    t[12] = np.where(lon_on, t[12], 0.0)
+
+    #/* parms not used: 82, 89, 99, 139-149 */
+    tinf = p[30]
+    for i in range(14):
+        tinf = tinf + abs(flags.sw[i+1])*t[i]
+    return tinf
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- GLOB7S ---------------------------- */
+/* ------------------------------------------------------------------- */
+"""
+def glob7s(p, state):
+    '''VERSION OF GLOBE FOR LOWER ATMOSPHERE 10/26/99'''
+    flags = state.flags
+    plg = state.plg
+    pset = 2.0
+    t = [0.0 for _ in range(14)]
+
+    #/* confirm parameter set */
+    if (p[99]==0):
+        p[99]=pset
+    if (p[99]!=pset):
+        raise ValueError("Wrong parameter set for glob7s")
+
+    cd32 = np.cos(dr*(state.doy-p[31]))
+    cd18 = np.cos(2.0*dr*(state.doy-p[17]))
+    cd14 = np.cos(dr*(state.doy-p[13]))
+    cd39 = np.cos(2.0*dr*(state.doy-p[38]))
+
+    #/* F10.7 */
+    t[0] = p[21]*state.dfa
+
+    #/* time independent */
+    t[1]=p[1]*plg[0][2] + p[2]*plg[0][4] + p[22]*plg[0][6] + p[26]*plg[0][1] + p[14]*plg[0][3] + p[59]*plg[0][5]
+
+    #/* SYMMETRICAL ANNUAL */
+    t[2]=(p[18]+p[47]*plg[0][2]+p[29]*plg[0][4])*cd32
+
+    #/* SYMMETRICAL SEMIANNUAL */
+    t[3]=(p[15]+p[16]*plg[0][2]+p[30]*plg[0][4])*cd18
+
+    #/* ASYMMETRICAL ANNUAL */
+    t[4]=(p[9]*plg[0][1]+p[10]*plg[0][3]+p[20]*plg[0][5])*cd14
+
+    #/* ASYMMETRICAL SEMIANNUAL */
+    t[5]=(p[37]*plg[0][1])*cd39
+
+    #/* DIURNAL */
+    if (flags.sw[7]):
+        t71 = p[11]*plg[1][2]*cd14*flags.swc[5]
+        t72 = p[12]*plg[1][2]*cd14*flags.swc[5]
+        t[6] = ((p[3]*plg[1][1] + p[4]*plg[1][3] + t71) * state.ctloc + (p[6]*plg[1][1] + p[7]*plg[1][3] + t72) * state.stloc)
+
+    #/* SEMIDIURNAL */
+    if (flags.sw[8]):
+        t81 = (p[23]*plg[2][3]+p[35]*plg[2][5])*cd14*flags.swc[5]
+        t82 = (p[33]*plg[2][3]+p[36]*plg[2][5])*cd14*flags.swc[5]
+        t[7] = ((p[5]*plg[2][2] + p[41]*plg[2][4] + t81) * state.c2tloc + (p[8]*plg[2][2] + p[42]*plg[2][4] + t82) * state.s2tloc)
+
+    #/* TERDIURNAL */
+    if (flags.sw[14]):
+            t[13] = p[39] * plg[3][3] * state.s3tloc + p[40] * plg[3][3] * state.c3tloc
+
+    #/* MAGNETIC ACTIVITY */
+    if (flags.sw[9]):
+        if (flags.sw[9]==1):
+            t[8] = state.apdf * (p[32] + p[45] * plg[0][2] * flags.swc[2])
+        if (flags.sw[9]==-1):
+            t[8]=(p[50]*state.apt0 + p[96]*plg[0][2] * state.apt0*flags.swc[2])
+
+    #/* LONGITUDINAL */
+    if ( not((flags.sw[10]==0) or (flags.sw[11]==0))):
+            t[10] = (1.0 + plg[0][1]*(p[80]*flags.swc[5]*np.cos(dr*(state.doy-p[81]))\
+                    +p[85]*flags.swc[6]*np.cos(2.0*dr*(state.doy-p[86])))\
+                    +p[83]*flags.swc[3]*np.cos(dr*(state.doy-p[84]))\
+                    +p[87]*flags.swc[4]*np.cos(2.0*dr*(state.doy-p[88])))\
+                    *((p[64]*plg[1][2]+p[65]*plg[1][4]+p[66]*plg[1][6]\
+                    +p[74]*plg[1][1]+p[75]*plg[1][3]+p[76]*plg[1][5]\
+                    )*np.cos(dgtr*state.g_long)\
+                    +(p[90]*plg[1][2]+p[91]*plg[1][4]+p[92]*plg[1][6]\
+                    +p[77]*plg[1][1]+p[78]*plg[1][3]+p[79]*plg[1][5]\
+                    )*np.sin(dgtr*state.g_long))
+            t[10] = np.where(state.g_long <= -1000.0, 0.0, t[10])
+
+    tt=0
+    for i in range(14):
+        tt+=abs(flags.sw[i+1])*t[i]
+    return tt
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- GTS7 ------------------------------ */
+/* ------------------------------------------------------------------- */
+"""
+def gts7(state, z):
+    '''
+    Thermospheric portion of NRLMSISE-00 for the altitudes z (z >= 72.5 km).
+    Returns (d, tinf, tz) with d a list of nine density arrays and sets the
+    MESO7 and DMIX values of state for use by gtd7.
+    '''
+    flags = state.flags
+    sw = flags.sw
+    pt, pd, ps, pdl, ptl, pma, sam, ptm, pdm, pavgm = load_tables()
+    zn1 = [pdl[1][15], 110.0, 100.0, 90.0, 72.5]
+    alpha = [-0.38, 0.0, 0.0, 0.0, 0.17, 0.0, -0.38, 0.0, 0.0]
+    altl = [200.0, 300.0, 160.0, 250.0, 240.0, 450.0, 320.0, 450.0]
+    d = [None for _ in range(9)]
+
+    #/* TINF VARIATIONS NOT IMPORTANT BELOW ZA OR ZN1(1) */
+    tinf = np.where(z > zn1[0], ptm[0]*pt[0]*(1.0+sw[16]*globe7(pt, state)), ptm[0]*pt[0])
+
+    #/*  GRADIENT VARIATIONS NOT IMPORTANT BELOW ZN1(5) */
+    g0 = np.where(z > zn1[4], ptm[3]*ps[0]*(1.0+sw[19]*globe7(ps, state)), ptm[3]*ps[0])
+    tlb = ptm[1] * (1.0 + sw[17]*globe7(pd[3], state))*pd[3][0]
+    s = g0 / (tinf - tlb)
+
+    #/*      Lower thermosphere temp variations not significant for
+    # *       density above 300 km */
+    low = z < 300.0
+    tn1 = [np.zeros_like(z) for _ in range(5)]
+    tgn1 = [np.zeros_like(z) for _ in range(2)]
+    tn1[1] = np.where(low, ptm[6]*ptl[0][0]/(1.0-sw[18]*glob7s(ptl[0], state)), ptm[6]*ptl[0][0])
+    tn1[2] = np.where(low, ptm[2]*ptl[1][0]/(1.0-sw[18]*glob7s(ptl[1], state)), ptm[2]*ptl[1][0])
+    tn1[3] = np.where(low, ptm[7]*ptl[2][0]/(1.0-sw[18]*glob7s(ptl[2], state)), ptm[7]*ptl[2][0])
+    tn1[4] = np.where(low, ptm[4]*ptl[3][0]/(1.0-sw[18]*sw[20]*glob7s(ptl[3], state)), ptm[4]*ptl[3][0])
+    tgn1[1] = np.where(low, ptm[8]*pma[8][0]*(1.0+sw[18]*sw[20]*glob7s(pma[8], state))*tn1[4]*tn1[4]/(np.power((ptm[4]*ptl[3][0]),2.0)),
+                       ptm[8]*pma[8][0]*tn1[4]*tn1[4]/(np.power((ptm[4]*ptl[3][0]),2.0)))
+    state.meso_tn1 = tn1
+    state.meso_tgn1 = tgn1
+
+    def _densu(alt, dlb, tinf_, tlb_, xm, alpha_):
+        return densu(state, alt, dlb, tinf_, tlb_, xm, alpha_, ptm[5], s, zn1, tn1, tgn1)[0]
+
+    #/* N2 variation factor at Zlb */
+    g28=sw[21]*globe7(pd[2], state)
+
+    #/* VARIATION OF TURBOPAUSE HEIGHT */
+    zhf=pdl[1][24]*(1.0+sw[5]*pdl[0][24]*np.sin(dgtr*state.g_lat)*np.cos(dr*(state.doy-pt[13])))
+    xmm = pdm[2][4]
+
+    #/**** N2 DENSITY ****/
+    db28 = pdm[2][0]*np.exp(g28)*pd[2][0]
+    d[2] = _densu(z,db28,tinf,tlb,28.0,alpha[2])
+    zh28=pdm[2][2]*zhf
+    zhm28=pdm[2][3]*pdl[1][5]
+    xmd=28.0-xmm
+    b28 = _densu(zh28,db28,tinf,tlb,xmd,(alpha[2]-1.0))
+    if sw[15]:
+        mix = z <= altl[2]
+        dm28 = _densu(z,b28,tinf,tlb,xmm,alpha[2])
+        state.dm28 = np.where(mix, dm28, state.dm28)
+        d[2] = np.where(mix, dnet(d[2],dm28,zhm28,xmm,28.0), d[2])
+
+    #/**** HE DENSITY ****/
+    g4 = sw[21]*globe7(pd[0], state)
+    db04 = pdm[0][0]*np.exp(g4)*pd[0][0]
+    d[0] = _densu(z,db04,tinf,tlb,4.,alpha[0])
+    if sw[15]:
+        mix = z < altl[0]
+        b04 = _densu(pdm[0][2],db04,tinf,tlb,4.-xmm,alpha[0]-1.)
+        dm04 = _densu(z,b04,tinf,tlb,xmm,0.)
+        d04 = dnet(d[0],dm04,zhm28,xmm,4.)
+        rl = np.log(b28*pdm[0][1]/b04)
+        zc04 = pdm[0][4]*pdl[1][0]
+        hc04 = pdm[0][5]*pdl[1][1]
+        d04 = d04*ccor(z,rl,hc04,zc04)
+        d[0] = np.where(mix, d04, d[0])
+
+    #/**** O DENSITY ****/
+    g16 = sw[21]*globe7(pd[1], state)
+    db16 = pdm[1][0]*np.exp(g16)*pd[1][0]
+    d[1] = _densu(z,db16,tinf,tlb,16.,alpha[1])
+    if sw[15]:
+        mix = z <= altl[1]
+        b16 = _densu(pdm[1][2],db16,tinf,tlb,16.0-xmm,(alpha[1]-1.0))
+        dm16 = _densu(z,b16,tinf,tlb,xmm,0.)
+        d16 = dnet(d[1],dm16,zhm28,xmm,16.)
+        rl = pdm[1][1]*pdl[1][16]*(1.0+sw[1]*pdl[0][23]*(state.f107A-150.0))
+        hc16 = pdm[1][5]*pdl[1][3]
+        zc16 = pdm[1][4]*pdl[1][2]
+        hc216 = pdm[1][5]*pdl[1][4]
+        d16 = d16*ccor2(z,rl,hc16,zc16,hc216)
+        #/*   Chemistry correction */
+        hcc16 = pdm[1][7]*pdl[1][13]
+        zcc16 = pdm[1][6]*pdl[1][12]
+        rc16 = pdm[1][3]*pdl[1][14]
+        d16 = d16*ccor(z,rc16,hcc16,zcc16)
+        d[1] = np.where(mix, d16, d[1])
+
+    #/**** O2 DENSITY ****/
+    g32 = sw[21]*globe7(pd[4], state)
+    db32 = pdm[3][0]*np.exp(g32)*pd[4][0]
+    d[3] = _densu(z,db32,tinf,tlb,32.,alpha[3])
+    if sw[15]:
+        mix = z <= altl[3]
+        b32 = _densu(pdm[3][2],db32,tinf,tlb,32.-xmm,alpha[3]-1.)
+        dm32 = _densu(z,b32,tinf,tlb,xmm,0.)
+        d32 = dnet(d[3],dm32,zhm28,xmm,32.)
+        rl = np.log(b28*pdm[3][1]/b32)
+        hc32 = pdm[3][5]*pdl[1][7]
+        zc32 = pdm[3][4]*pdl[1][6]
+        d32 = d32*ccor(z,rl,hc32,zc32)
+        d[3] = np.where(mix, d32, d[3])
+        #/*  Correction for general departure from diffusive equilibrium above Zlb */
+        hcc32 = pdm[3][7]*pdl[1][22]
+        hcc232 = pdm[3][7]*pdl[0][22]
+        zcc32 = pdm[3][6]*pdl[1][21]
+        rc32 = pdm[3][3]*pdl[1][23]*(1.+sw[1]*pdl[0][23]*(state.f107A-150.))
+        d[3] = d[3]*ccor2(z,rc32,hcc32,zcc32,hcc232)
+
+    #/**** AR DENSITY ****/
+    g40 = sw[21]*globe7(pd[5], state)
+    db40 = pdm[4][0]*np.exp(g40)*pd[5][0]
+    d[4] = _densu(z,db40,tinf,tlb,40.,alpha[4])
+    if sw[15]:
+        mix = z <= altl[4]
+        b40 = _densu(pdm[4][2],db40,tinf,tlb,40.-xmm,alpha[4]-1.)
+        dm40 = _densu(z,b40,tinf,tlb,xmm,0.)
+        d40 = dnet(d[4],dm40,zhm28,xmm,40.)
+        rl = np.log(b28*pdm[4][1]/b40)
+        hc40 = pdm[4][5]*pdl[1][9]
+        zc40 = pdm[4][4]*pdl[1][8]
+        d40 = d40*ccor(z,rl,hc40,zc40)
+        d[4] = np.where(mix, d40, d[4])
+
+    #/**** HYDROGEN DENSITY ****/
+    g1 = sw[21]*globe7(pd[6], state)
+    db01 = pdm[5][0]*np.exp(g1)*pd[6][0]
+    d[6] = _densu(z,db01,tinf,tlb,1.,alpha[6])
+    if sw[15]:
+        mix = z <= altl[6]
+        b01 = _densu(pdm[5][2],db01,tinf,tlb,1.-xmm,alpha[6]-1.)
+        dm01 = _densu(z,b01,tinf,tlb,xmm,0.)
+        d01 = dnet(d[6],dm01,zhm28,xmm,1.)
+        rl = np.log(b28*pdm[5][1]*np.sqrt(pdl[1][17]*pdl[1][17])/b01)
+        hc01 = pdm[5][5]*pdl[1][11]
+        zc01 = pdm[5][4]*pdl[1][10]
+        d01 = d01*ccor(z,rl,hc01,zc01)
+        #/*   Chemistry correction */
+        hcc01 = pdm[5][7]*pdl[1][19]
+        zcc01 = pdm[5][6]*pdl[1][18]
+        rc01 = pdm[5][3]*pdl[1][20]
+        d01 = d01*ccor(z,rc01,hcc01,zcc01)
+        d[6] = np.where(mix, d01, d[6])
+
+    #/**** ATOMIC NITROGEN DENSITY ****/
+    g14 = sw[21]*globe7(pd[7], state)
+    db14 = pdm[6][0]*np.exp(g14)*pd[7][0]
+    d[7] = _densu(z,db14,tinf,tlb,14.,alpha[7])
+    if sw[15]:
+        mix = z <= altl[7]
+        b14 = _densu(pdm[6][2],db14,tinf,tlb,14.-xmm,alpha[7]-1.)
+        dm14 = _densu(z,b14,tinf,tlb,xmm,0.)
+        d14 = dnet(d[7],dm14,zhm28,xmm,14.)
+        rl = np.log(b28*pdm[6][1]*np.sqrt(pdl[0][2]*pdl[0][2])/b14)
+        hc14 = pdm[6][5]*pdl[0][1]
+        zc14 = pdm[6][4]*pdl[0][0]
+        d14 = d14*ccor(z,rl,hc14,zc14)
+        #/*   Chemistry correction */
+        hcc14 = pdm[6][7]*pdl[0][4]
+        zcc14 = pdm[6][6]*pdl[0][3]
+        rc14 = pdm[6][3]*pdl[0][5]
+        d14 = d14*ccor(z,rc14,hcc14,zcc14)
+        d[7] = np.where(mix, d14, d[7])
+
+    #/**** Anomalous OXYGEN DENSITY ****/
+    g16h = sw[21]*globe7(pd[8], state)
+    db16h = pdm[7][0]*np.exp(g16h)*pd[8][0]
+    tho = pdm[7][9]*pdl[0][6]
+    dd = _densu(z,db16h,tho,tho,16.,alpha[8])
+    zsht = pdm[7][5]
+    zmho = pdm[7][4]
+    zsho = scalh(state,zmho,16.0,tho)
+    d[8] = dd*np.exp(-zsht/zsho*(np.exp(-(z-zmho)/zsht)-1.))
+
+    #/* total mass density */
+    d[5] = 1.66E-24*(4.0*d[0]+16.0*d[1]+28.0*d[2]+32.0*d[3]+40.0*d[4]+ d[6]+14.0*d[7])
+
+    #/* temperature */
+    tz = densu(state, np.sqrt(z*z), 1.0, tinf, tlb, 0.0, 0.0, ptm[5], s, zn1, tn1, tgn1)[1]
+    if sw[0]:
+        for i in range(9):
+            d[i] = d[i]*1.0E6
+        d[5] = d[5]/1000
+    return d, tinf, tz
+
+
+"""
+/* ------------------------------------------------------------------- */
+/* ------------------------------- GTD7 ------------------------------ */
+/* ------------------------------------------------------------------- */
+"""
+def gtd7_vec(doy, sec, alt, g_lat, g_long, f107, f107A, ap, ap_a=None, lst=0.0, flags=None):
+    '''
+    Vectorised gtd7, evaluates the model for N points in one call
+
+    * INPUT: doy, sec, alt [km], g_lat [deg], g_long [deg], f107, f107A and ap
+      as scalars or arrays broadcastable to shape (N,)
+    * ap_a: (N,7) or (7,) array with the AP history, see ap_array; required
+      when flags.switches[9] == -1
+    * lst: local apparent solar time [h], defaults to 0.0 like nrlmsise_input
+    * flags: nrlmsise_flags, if None all switches are set to 1 (SI output) and
+      switches[9] is set to -1 when ap_a is given, as in AtmosCalc.nrl00
+
+    * OUTPUT: (d, t) with d an (N,9) array of densities and t an (N,2) array
+      of temperatures, ordered as nrlmsise_output.d and nrlmsise_output.t
+    '''
+    if flags is None:
+        flags = nrlmsise_flags()
+        for i in range(24):
+            flags.switches[i] = 1
+        if ap_a is not None:
+            flags.switches[9] = -1
+    tselec(flags)
+
+    doy, sec, alt, g_lat, g_long, f107, f107A, ap, lst = [np.ravel(x).astype(float) for x in
+        np.broadcast_arrays(doy, sec, alt, g_lat, g_long, f107, f107A, ap, lst)]
+    with np.errstate(all='ignore'):
+        state = _vec_state(doy, sec, g_lat, g_long, lst, f107A, f107, ap, _ap_rows(ap_a, flags, alt.shape[0]), flags)
+        return _gtd7(state, alt)
+
+
+def gtd7_profile(doy, sec, alt, g_lat, g_long, f107, f107A, ap, ap_a=None, lst=0.0, flags=None):
+    '''
+    gtd7 for a vertical profile, evaluates the model at N altitudes of one
+    time and location. The altitude independent terms (Legendre polynomials,
+    local time harmonics, globe7/glob7s and with them tinf, tlb and the spline
+    nodes) are computed once, only the densu/densm profiles run over the N
+    altitudes.
+
+    * INPUT: as gtd7_vec, but all inputs except alt are scalars and ap_a is a
+      (7,) array
+    * OUTPUT: (d, t) with d an (N,9) and t an (N,2) array, as gtd7_vec
+    '''
+    if flags is None:
+        flags = nrlmsise_flags()
+        for i in range(24):
+            flags.switches[i] = 1
+        if ap_a is not None:
+            flags.switches[9] = -1
+    tselec(flags)
+
+    doy, sec, g_lat, g_long, f107, f107A, ap, lst = [np.array([x], dtype=float) for x in
+        (doy, sec, g_lat, g_long, f107, f107A, ap, lst)]
+    alt = np.ravel(alt).astype(float)
+    with np.errstate(all='ignore'):
+        state = _vec_state(doy, sec, g_lat, g_long, lst, f107A, f107, ap, _ap_rows(ap_a, flags, 1), flags)
+        return _gtd7(state, alt)
+
+
+def gtd7_records(records, flags=None):
+    '''
+    gtd7_vec for an array of INPUT_DTYPE records, see nrlmsise_00_header
+
+    * INPUT: records, (N,) array of INPUT_DTYPE; the ap_a column is used when
+      flags.switches[9] == -1
+    * flags: nrlmsise_flags, if None all switches are set to 1 (SI output)
+    * OUTPUT: (N,) array of OUTPUT_DTYPE
+    '''
+    if flags is None:
+        flags = nrlmsise_flags()
+        for i in range(24):
+            flags.switches[i] = 1
+    records = np.ravel(records)
+    out = np.empty(records.shape[0], dtype=OUTPUT_DTYPE)
+    out['d'], out['t'] = gtd7_vec(records['doy'], records['sec'], records['alt'], records['g_lat'],
+                                  records['g_long'], records['f107'], records['f107A'], records['ap'],
+                                  ap_a=records['ap_a'], lst=records['lst'], flags=flags)
+    return out
+
+
+def _ap_rows(ap_a, flags, n):
+    '''AP history as a (7, n) array, or None when the daily AP is used'''
+    if flags.sw[9] == -1:
+        if ap_a is None:
+            raise ValueError("ap_a is required when flags.switches[9] == -1")
+        return np.broadcast_to(np.asarray(ap_a, dtype=float), (n, 7)).T
+    return None
+
+
+def _gtd7(state, alt):
+    '''
+    Altitude dependent part of gtd7_vec. The arrays of state either have one
+    value per altitude or a single value shared by all altitudes.
+    '''
+    flags = state.flags
+    pt, pd, ps, pdl, ptl, pma, sam, ptm, pdm, pavgm = load_tables()
+    n = alt.shape[0]
+    d = np.empty((n, 9))
+    t = np.empty((n, 2))
+
+    #/* THERMOSPHERE / MESOSPHERE (above zn2[0]) */
+    zn3 = [32.5,20.0,15.0,10.0,0.0]
+    zn2 = [72.5,55.0,45.0,32.5]
+    zmix = 62.5
+    altt = np.where(alt > zn2[0], alt, zn2[0])
+    sd, tinf, tz = gts7(state, altt)
+    for i in range(9):
+        d[:, i] = sd[i]
+    t[:, 0] = tinf
+    t[:, 1] = tz
+
+    low = alt < zn2[0]
+    if not np.any(low):
+        return d, t
+
+    #/*       LOWER MESOSPHERE/UPPER STRATOSPHERE (between zn3[0] and zn2[0])
+    #*         Temperature at nodes and gradients at end nodes
+    #*         Inverse temperature a linear function of spherical harmonics
+    #*/
+    sw = flags.sw
+    xmm = pdm[2][4]
+    if sw[0]:
+        dm28m = state.dm28*1.0E6
+    else:
+        dm28m = state.dm28
+    tn2 = [state.meso_tn1[4], None, None, None]
+    tgn2 = [state.meso_tgn1[1], None]
+    tn2[1]=pma[0][0]*pavgm[0]/(1.0-sw[20]*glob7s(pma[0], state))
+    tn2[2]=pma[1][0]*pavgm[1]/(1.0-sw[20]*glob7s(pma[1], state))
+    tn2[3]=pma[2][0]*pavgm[2]/(1.0-sw[20]*sw[22]*glob7s(pma[2], state))
+    tgn2[1]=pavgm[8]*pma[9][0]*(1.0+sw[20]*sw[22]*glob7s(pma[9], state))*tn2[3]*tn2[3]/(np.power((pma[2][0]*pavgm[2]),2.0))
+
+    #/*       LOWER STRATOSPHERE AND TROPOSPHERE (below zn3[0]) */
+    tn3 = [tn2[3], None, None, None, None]
+    tgn3 = [tgn2[1], None]
+    tn3[1]=pma[3][0]*pavgm[3]/(1.0-sw[22]*glob7s(pma[3], state))
+    tn3[2]=pma[4][0]*pavgm[4]/(1.0-sw[22]*glob7s(pma[4], state))
+    tn3[3]=pma[5][0]*pavgm[5]/(1.0-sw[22]*glob7s(pma[5], state))
+    tn3[4]=pma[6][0]*pavgm[6]/(1.0-sw[22]*glob7s(pma[6], state))
+    tgn3[1]=pma[7][0]*pavgm[7]*(1.0+sw[22]*glob7s(pma[7], state)) *tn3[4]*tn3[4]/(np.power((pma[6][0]*pavgm[6]),2.0))
+
+    #/* LINEAR TRANSITION TO FULL MIXING BELOW zn2[0] */
+    dmc = np.where(alt > zmix, 1.0 - (zn2[0]-alt)/(zn2[0] - zmix), 0.0)
+    dz28 = sd[2]
+
+    #/**** N2 density ****/
+    dmr = sd[2] / dm28m - 1.0
+    d2 = densm(state, alt, dm28m, xmm, zn3, tn3, tgn3, zn2, tn2, tgn2)[0]
+    d2 = d2 * (1.0 + dmr*dmc)
+
+    #/**** HE density ****/
+    dmr = sd[0] / (dz28 * pdm[0][1]) - 1.0
+    d0 = d2 * pdm[0][1] * (1.0 + dmr*dmc)
+
+    #/**** O2 density ****/
+    dmr = sd[3] / (dz28 * pdm[3][1]) - 1.0
+    d3 = d2 * pdm[3][1] * (1.0 + dmr*dmc)
+
+    #/**** AR density ***/
+    dmr = sd[4] / (dz28 * pdm[4][1]) - 1.0
+    d4 = d2 * pdm[4][1] * (1.0 + dmr*dmc)
+
+    #/**** Total mass density, O, H, N and anomalous O are zero */
+    d5 = 1.66E-24 * (4.0 * d0 + 16.0 * 0.0 + 28.0 * d2 + 32.0 * d3 + 40.0 * d4 + 0.0 + 14.0 * 0.0)
+    if sw[0]:
+        d5 = d5/1000
+
+    #/**** temperature at altitude ****/
+    tz = densm(state, alt, 1.0, 0, zn3, tn3, tgn3, zn2, tn2, tgn2)[1]
+
+    lower = np.stack((d0, np.zeros(n), d2, d3, d4, d5, np.zeros(n), np.zeros(n), np.zeros(n)), axis=1)
+    d[low] = lower[low]
+    t[low, 1] = tz[low]
+    return d, t
+
+
+if __name__ == '__main__':
+    '''Compare against the scalar model for the reference inputs of nrlmsise_00_test.py'''
+    from src.atmos.nrlmsise00.model.nrlmsise_00 import gtd7
+    from src.atmos.nrlmsise00.model.nrlmsise_00_header import nrlmsise_input, nrlmsise_output
+
+    alts = np.array([400, 1000, 100, 0, 10, 30, 50, 70, 72.5, 90, 120, 250])
+    flags = nrlmsise_flags()
+    for i in range(1, 24):
+        flags.switches[i] = 1
+    d, t = gtd7_vec(172, 29000, alts, 60, -70, 150, 150, 4, lst=16, flags=flags)
+    for i, alt in enumerate(alts):
+        output = nrlmsise_output()
+        gtd7(nrlmsise_input(doy=172, sec=29000, alt=alt, g_lat=60, g_long=-70, lst=16, f107A=150, f107=150, ap=4),
+             flags, output)
+        print(alt, np.max(np.abs(d[i] - output.d)/np.maximum(np.abs(output.d), 1e-300)), t[i] - output.t)
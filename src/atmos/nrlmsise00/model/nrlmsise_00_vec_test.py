@@ -0,0 +1,124 @@
+"""
+Checks the vectorised gtd7_vec of nrlmsise_00_vec.py against the scalar gtd7
+for the 17 reference inputs of nrlmsise_00_test.py and for random inputs, and
+the altitude profile gtd7_profile against gtd7_vec.
+"""
+
+import numpy as np
+
+from src.atmos.nrlmsise00.model.nrlmsise_00 import *
+from src.atmos.nrlmsise00.model.nrlmsise_00_vec import gtd7_vec, gtd7_records, gtd7_profile
+
+
+def reference_inputs():
+    Input = [nrlmsise_input(doy=172, sec=29000, alt=400, g_lat=60, g_long=-70, lst=16, f107A=150, f107=150, ap=4)
+             for _ in range(17)]
+    Input[1].doy=81
+    Input[2].sec=75000
+    Input[2].alt=1000
+    Input[3].alt=100
+    Input[10].alt=0
+    Input[11].alt=10
+    Input[12].alt=30
+    Input[13].alt=50
+    Input[14].alt=70
+    Input[16].alt=100
+    Input[4].g_lat=0
+    Input[5].g_long=0
+    Input[6].lst=4
+    Input[7].f107A=70
+    Input[8].f107=180
+    Input[9].ap=40
+    return Input
+
+
+def all_on(sw0=0, sw9=1):
+    flags = nrlmsise_flags()
+    for i in range(24):
+        flags.switches[i] = 1
+    flags.switches[0] = sw0
+    flags.switches[9] = sw9
+    return flags
+
+
+def compare(Input, flags, ap_a=None):
+    ref = []
+    for i in Input:
+        output = nrlmsise_output()
+        gtd7(i, flags, output)
+        ref.append(output.d + output.t)
+    ref = np.array(ref)
+
+    col = lambda name: np.array([getattr(i, name) for i in Input])
+    d, t = gtd7_vec(col('doy'), col('sec'), col('alt'), col('g_lat'), col('g_long'), col('f107'), col('f107A'),
+                    col('ap'), ap_a=ap_a, lst=col('lst'), flags=flags)
+    got = np.concatenate((d, t), axis=1)
+    return np.max(np.abs(got - ref) / np.maximum(np.abs(ref), 1e-300))
+
+
+def test_gtd7_vec_reference():
+    Input = reference_inputs()
+    assert compare(Input[:15], all_on()) < 1e-10
+
+    aph = ap_array()
+    aph.a = [100.0 for _ in range(7)]
+    for i in Input[15:]:
+        i.ap_a = aph
+    assert compare(Input[15:], all_on(sw9=-1), ap_a=aph.a) < 1e-10
+
+
+def test_gtd7_vec_random():
+    rng = np.random.RandomState(0)
+    n = 200
+    ap_a = rng.uniform(0, 200, (n, 7))
+    Input = []
+    for i in range(n):
+        aph = ap_array()
+        aph.a = list(ap_a[i])
+        Input.append(nrlmsise_input(doy=rng.randint(1, 366), sec=rng.uniform(0, 86400), alt=rng.uniform(0, 1000),
+                                    g_lat=rng.uniform(-90, 90), g_long=rng.uniform(-180, 180), lst=rng.uniform(0, 24),
+                                    f107A=rng.uniform(60, 250), f107=rng.uniform(60, 250), ap=rng.uniform(0, 100),
+                                    ap_a=aph))
+    assert compare(Input, all_on(sw0=1)) < 1e-10
+    assert compare(Input, all_on(sw0=1, sw9=-1), ap_a=ap_a) < 1e-10
+
+
+def test_gtd7_records():
+    Input = reference_inputs()
+    aph = ap_array()
+    aph.a[:] = array('d', [100.0]*7)
+    for i in Input:
+        i.ap_a = aph
+    records = input_records(Input)
+    assert all(vars_equal(record_input(r), i) for r, i in zip(records, Input))
+
+    for flags in (all_on(), all_on(sw9=-1)):
+        outputs = []
+        for i in Input:
+            outputs.append(nrlmsise_output())
+            gtd7(i, flags, outputs[-1])
+        ref = output_records(outputs)
+        got = gtd7_records(records, flags)
+        for name in ('d', 't'):
+            assert np.allclose(got[name], ref[name], rtol=1e-10, atol=0)
+
+
+def test_gtd7_profile():
+    '''The Profile is bit-identical to gtd7_vec at the same Altitudes, through all Layers of the Model'''
+    alts = np.concatenate((np.arange(0, 130, 2.5), np.arange(130, 1001, 7.)))
+    rng = np.random.RandomState(1)
+    for _ in range(5):
+        doy, sec, lat, lon, lst = rng.randint(1, 366), rng.uniform(0, 86400), rng.uniform(-90, 90), \
+            rng.uniform(-180, 180), rng.uniform(0, 24)
+        f107, f107A, ap = rng.uniform(60, 250), rng.uniform(60, 250), rng.uniform(0, 100)
+        ap_a = rng.uniform(0, 200, 7)
+        for flags, aph in ((all_on(sw0=1), None), (all_on(sw0=1, sw9=-1), ap_a)):
+            d, t = gtd7_profile(doy, sec, alts, lat, lon, f107, f107A, ap, ap_a=aph, lst=lst, flags=flags)
+            dv, tv = gtd7_vec(doy, sec, alts, lat, lon, f107, f107A, ap,
+                              ap_a=None if aph is None else np.tile(aph, (len(alts), 1)), lst=lst, flags=flags)
+            assert np.array_equal(d, dv) and np.array_equal(t, tv)
+
+
+def vars_equal(a, b):
+    names = ('year', 'doy', 'sec', 'alt', 'g_lat', 'g_long', 'lst', 'f107A', 'f107', 'ap')
+    return all(getattr(a, name) == getattr(b, name) for name in names) and a.ap_a.a == b.ap_a.a
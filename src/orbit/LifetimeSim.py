@@ -0,0 +1,272 @@
+'''Importing Required Modules from Folder'''
+from src.atmos.nrlmsise00.OrbitAverage import orbit_average
+from src.atmos.nrlmsise00.IndexFindr.IndexReturn import Indexer
+from src.atmos.nrlmsise00.IndexFindr.IndexStore import open_store
+from src.power.power import panel_area
+
+'''Importing Required Modules'''
+import os
+import json
+import numpy as np
+import datetime as dt
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+'''Coupled Lifetime Simulation of an Air-breathing Electric Propulsion Satellite on a Circular Orbit'''
+'''
+Every Step evaluates, for the current Altitude and Date:
+* the orbit averaged Density of OrbitAverage and the Drag 0.5*rho*V^2*Cd*A_f
+* the Thrust from the collected Massflow rho*V*A_intake*eff_c*c_e, as in PandTestimation (thing == 3)
+* the Power Budget: the Panels generate only outside Eclipse, Eclipse Power passes the Battery; if the Orbit Energy
+does not cover the Engine at full Thrust, the Engine is throttled to the Power left after P_misc
+and advances the Semi-Major Axis with da/dt = 2*a^1.5*(T - D)/(m*sqrt(mu)) by a Midpoint Step. Steps are halved
+(down to one Orbit) while the Altitude changes by more than max_dh over a Step.
+'''
+
+'''Constants, as in orbitdecay'''
+R_E = 6371000
+MU_E = 5.972e24*6.67430e-11
+SR = 1400
+
+'''Start Dates are saved as Seconds since EPOCH'''
+EPOCH = dt.datetime(1970, 1, 1)
+
+'''Default Design, the Propulsion Values are those of PandTestimation, the Panel Values those of power.panel_area'''
+'''
+* m [kg], A_f frontal Area [m^2], Cd, A_intake [m^2], eff_c collection Efficiency, c_e exhaust Velocity [m/s],
+FperP Thrust per Engine Power [N/W], P_misc Power of the other Subsystems [W]
+* A_panel [m^2], if None the Panels are sized by power.panel_area for Thrust equal to Drag at the initial Altitude;
+eff_panel, degradation per Year, eff_bat Charge times Discharge Efficiency of the Battery
+'''
+DESIGN = {'m': 150.0, 'A_f': 1.0, 'Cd': 2.5, 'A_intake': 1.0, 'eff_c': 0.2, 'c_e': 3872.98, 'FperP': 14.147593e-3,
+          'P_misc': 200.0, 'A_panel': None, 'eff_panel': 0.09, 'degradation': 0.99, 'eff_bat': 0.99*0.99}
+
+'''Columns of the History'''
+COLUMNS = ['time [s]', 'h [km]', 'Density [kg/m^3]', 'Drag [N]', 'Thrust [N]', 'Thrust Margin [-]',
+           'Eclipse Fraction [-]', 'Energy Balance [Wh/orbit]']
+
+
+def eclipse_fraction(h: float, inc: float, lst_node: float, doy: float):
+    '''Function eclipse_fraction'''
+    '''Fraction of a Circular Orbit in the cylindrical Earth Shadow'''
+    '''PARAM 1-4: Altitude [km], Inclination [deg], Local Solar Time of the Ascending Node [h], Day of Year'''
+    r = R_E + h*1000
+    decl = np.radians(-23.44)*np.cos(2*np.pi*(doy + 10)/365)
+    inc = np.radians(inc)
+    beta = np.arcsin(np.cos(decl)*np.sin(inc)*np.sin(np.radians((lst_node - 12)*15)) + np.sin(decl)*np.cos(inc))
+    cos = np.sqrt(r**2 - R_E**2)/(r*np.cos(beta))
+    return float(np.arccos(cos)/np.pi) if cos < 1 else 0.0
+
+
+class LifetimeSim(object):
+
+    def __init__(self, design: dict = None, h: float = 250.0, date: dt.datetime = dt.datetime(2008, 6, 2),
+                 inc: float = 96.5, lst_node: float = 6.0, indices: list = None, step: float = 86400.0,
+                 max_dh: float = 2.0, reentry: float = 120.0):
+        '''Class LifetimeSim'''
+        '''INPUT 1: dict with the Design Values, missing Values are taken from DESIGN'''
+        '''INPUT 2: initial Altitude [km]'''
+        '''INPUT 3: Start Date (datetime class)'''
+        '''INPUT 4: Inclination [deg]'''
+        '''INPUT 5: Local Solar Time of the Ascending Node [h]'''
+        '''INPUT 6: [F107, F107A, AP_Daily] used for the whole Run; if None they are taken from Indexer every Step'''
+        '''INPUT 7: Step [s]'''
+        '''INPUT 8: largest Altitude Change [km] per Step'''
+        '''INPUT 9: Altitude [km] at which the Run ends, the Satellite is considered lost'''
+
+        '''To run call .run(t_end), it can be called again to continue; .checkpoint(filepath) saves the Simulation and
+        LifetimeSim.resume(filepath) continues it'''
+
+        self.__design = dict(DESIGN, **(design or {}))
+        self.__config = {'h': h, 'date': (date - EPOCH).total_seconds(), 'inc': inc, 'lst_node': lst_node, 'indices': indices,
+                         'step': step, 'max_dh': max_dh, 'reentry': reentry}
+        self.__start = date
+        self.__t = 0.0
+        self.__a = R_E + h*1000
+        self.__history = []
+
+        if self.__design['A_panel'] is None:
+            self.__design['A_panel'] = self.size_panels()
+
+    def return_design(self):
+        return self.__design
+
+    def return_history(self):
+        '''(N,len(COLUMNS)) NP Array with one Row per Step'''
+        return np.array(self.__history).reshape(-1, len(COLUMNS))
+
+    def return_data(self):
+        import pandas as pd
+        return pd.DataFrame(self.return_history(), columns=COLUMNS)
+
+    def lost(self):
+        return (self.__a - R_E)/1000 <= self.__config['reentry']
+
+    def date(self, t: float):
+        return self.__start + dt.timedelta(0, t)
+
+    def size_panels(self):
+        '''Panel Area [m^2] of power.panel_area for Thrust equal to Drag at the initial Altitude'''
+        state = self.evaluate(0.0, self.__a, np.inf)
+        t_o = 2*np.pi*np.sqrt(self.__a**3/MU_E)
+        power = state['Drag [N]']/self.__design['FperP'] + self.__design['P_misc']
+        return float(panel_area(t_o, state['Eclipse Fraction [-]']*t_o, power, power)[0])
+
+    def evaluate(self, t: float, a: float, A_panel: float = None):
+        '''Function evaluate'''
+        '''Orbit averaged Density, Drag, Thrust, Eclipse and Energy Balance t seconds after the Start'''
+        ds, cfg = self.__design, self.__config
+        date = self.date(t)
+        doy = date.timetuple().tm_yday
+        h = (a - R_E)/1000
+        indices = cfg['indices'] if cfg['indices'] is not None else Indexer(date).return_indices()[1:4]
+
+        rho = orbit_average(h, cfg['inc'], cfg['lst_node'], doy, indices[0], indices[1], indices[2])[0]
+        V = np.sqrt(MU_E/a)
+        drag = 0.5*rho*V**2*ds['Cd']*ds['A_f']
+
+        '''Power: Orbit Energy of the Panels against the Engine at full Thrust and the other Subsystems'''
+        t_o = 2*np.pi*np.sqrt(a**3/MU_E)
+        f_e = eclipse_fraction(h, cfg['inc'], cfg['lst_node'], doy)
+        A_panel = ds['A_panel'] if A_panel is None else A_panel
+        P_sun = SR*ds['eff_panel']*A_panel*ds['degradation']**(t/(365.25*86400))
+        E_gen = P_sun*(1 - f_e)*t_o
+        '''Power drawn continuously costs this Orbit Energy per W, Eclipse Power passes the Battery'''
+        cost = t_o*((1 - f_e) + f_e/ds['eff_bat'])
+
+        thrust = rho*V*ds['A_intake']*ds['eff_c']*ds['c_e']
+        P_engine = min(thrust/ds['FperP'], max(E_gen/cost - ds['P_misc'], 0.0))
+        thrust = P_engine*ds['FperP']
+        balance = (E_gen - (P_engine + ds['P_misc'])*cost)/3600
+
+        return {'h [km]': h, 'Density [kg/m^3]': rho, 'Drag [N]': drag, 'Thrust [N]': thrust,
+                'Thrust Margin [-]': thrust/drag - 1, 'Eclipse Fraction [-]': f_e, 'Energy Balance [Wh/orbit]': balance}
+
+    def rate(self, t: float, a: float):
+        '''Change of the Semi-Major Axis [m/s] and the evaluated State'''
+        state = self.evaluate(t, a)
+        return 2*a**1.5*(state['Thrust [N]'] - state['Drag [N]'])/(self.__design['m']*np.sqrt(MU_E)), state
+
+    def advance(self):
+        '''Function advance'''
+        '''One Midpoint Step, halved while the Altitude changes by more than max_dh, records the State at its Start'''
+        step = self.__config['step']
+        t_o = 2*np.pi*np.sqrt(self.__a**3/MU_E)
+        rate, state = self.rate(self.__t, self.__a)
+        while True:
+            mid = self.__a + 0.5*step*rate
+            a = self.__a + step*self.rate(self.__t + 0.5*step, max(mid, R_E))[0]
+            if abs(a - self.__a)/1000 <= self.__config['max_dh'] or step <= t_o:
+                break
+            step = max(step/2, t_o)
+        self.__history.append([self.__t] + [state[name] for name in COLUMNS[1:]])
+        self.__t += step
+        self.__a = a
+
+    def run(self, t_end: float, checkpoint: str = None, every: int = 100):
+        '''Function run'''
+        '''Advances the Simulation to t_end [s] after the Start or until it is lost'''
+        '''PARAM 1: t_end [s]'''
+        '''PARAM 2: Filepath to checkpoint to, every given Number of Steps and at the End'''
+        steps = 0
+        while self.__t < t_end and not self.lost():
+            self.advance()
+            steps += 1
+            if checkpoint is not None and steps % every == 0:
+                self.checkpoint(checkpoint)
+        if checkpoint is not None:
+            self.checkpoint(checkpoint)
+        return self
+
+    def checkpoint(self, filepath: str):
+        '''Saves Design, Configuration, State and History, the File is replaced atomically'''
+        state = {'design': self.__design, 'config': self.__config, 't': self.__t, 'a': self.__a}
+        with open(filepath + '.tmp', 'wb') as f:
+            np.savez(f, state=json.dumps(state), history=self.return_history())
+        os.replace(filepath + '.tmp', filepath)
+
+    @staticmethod
+    def resume(filepath: str):
+        '''Function resume'''
+        '''Returns the Simulation saved by checkpoint, run continues it where it stopped'''
+        with np.load(filepath) as data:
+            state = json.loads(str(data['state']))
+            history = data['history'].tolist()
+        cfg = state['config']
+        sim = LifetimeSim(state['design'], cfg['h'], EPOCH + dt.timedelta(0, cfg['date']), cfg['inc'],
+                          cfg['lst_node'], cfg['indices'], cfg['step'], cfg['max_dh'], cfg['reentry'])
+        sim.__t = state['t']
+        sim.__a = state['a']
+        sim.__history = history
+        return sim
+
+
+'''Function run_variant'''
+'''Runs one Design Variant in a Worker Process, resuming from its Checkpoint if there is one'''
+'''
+* INPUT 1: Index of the Variant
+* INPUT 2: dict with the Design Values
+* INPUT 3: dict with the Keyword Arguments of LifetimeSim
+* INPUT 4: t_end [s]
+* INPUT 5: Directory of the Checkpoints, None for none
+
+* OUTPUT 1: (index, History) of the Variant
+'''
+
+def run_variant(idx: int, design: dict, kwargs: dict, t_end: float, checkpoint_dir: str = None):
+    checkpoint = None
+    if checkpoint_dir is not None:
+        checkpoint = os.path.join(checkpoint_dir, 'variant_' + str(idx) + '.npz')
+    if checkpoint is not None and os.path.exists(checkpoint):
+        sim = LifetimeSim.resume(checkpoint)
+    else:
+        sim = LifetimeSim(design, **kwargs)
+    return idx, sim.run(t_end, checkpoint).return_history()
+
+
+'''Function run_batch'''
+'''Runs many Design Variants in parallel, see OrbitSweep'''
+'''
+* INPUT 1: List of Design dicts
+* INPUT 2: t_end [s]
+* INPUT 3: Number of Worker Processes, defaults to the Number of Cores
+* INPUT 4: Directory of the Checkpoints; a Batch started again with the same Directory resumes every Variant from
+its last Checkpoint
+
+* PARAM 1: kwargs, Keyword Arguments of LifetimeSim shared by all Variants
+
+* OUTPUT 1: List of the Histories in the Order of the Designs
+'''
+
+def run_batch(designs: list, t_end: float = 365.25*86400, workers: int = None, checkpoint_dir: str = None,
+              **kwargs):
+    if checkpoint_dir is not None:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+    results = [None]*len(designs)
+    if workers == 1:
+        for idx, design in enumerate(designs):
+            results[idx] = run_variant(idx, design, kwargs, t_end, checkpoint_dir)[1]
+        return results
+
+    '''Variants without fixed Indices read them from the Index Store, it is opened (and built if needed) here so the
+    Workers do not all build it at once'''
+    if kwargs.get('indices') is None:
+        open_store()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_variant, idx, design, kwargs, t_end, checkpoint_dir)
+                   for idx, design in enumerate(designs)]
+        for future in as_completed(futures):
+            idx, history = future.result()
+            results[idx] = history
+    return results
+
+
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    sim = LifetimeSim(indices=[150, 150, 15]).run(2*365.25*86400)
+    print(sim.return_data().iloc[::60], time.perf_counter() - start)
+
+    '''Intake Area Trade, one Variant per Process'''
+    histories = run_batch([{'A_intake': A} for A in (0.5, 1.0, 1.5, 2.0)], indices=[150, 150, 15])
+    for A, history in zip((0.5, 1.0, 1.5, 2.0), histories):
+        print(A, 'final h [km]:', history[-1, 1], 'days:', history[-1, 0]/86400)
@@ -0,0 +1,55 @@
+"""
+Checks that a LifetimeSim resumed from a checkpoint continues exactly as an
+uninterrupted run, and the batch mode against single runs.
+"""
+
+import os
+import numpy as np
+import datetime as dt
+
+from src.orbit.LifetimeSim import LifetimeSim, run_batch, eclipse_fraction
+
+DESIGN = {'c_e': 35000.0, 'eff_c': 0.4}
+DAY = 86400.0
+
+
+def test_resume(tmp_path):
+    filepath = os.path.join(str(tmp_path), 'sim.npz')
+    full = LifetimeSim(DESIGN, indices=[150, 150, 15]).run(6*DAY).return_history()
+
+    LifetimeSim(DESIGN, indices=[150, 150, 15]).run(3*DAY, checkpoint=filepath)
+    resumed = LifetimeSim.resume(filepath).run(6*DAY).return_history()
+    assert np.array_equal(full, resumed)
+
+    '''The Start Date is restored to the Microsecond'''
+    date = dt.datetime(2012, 3, 4, 5, 6, 7, 890123)
+    LifetimeSim(DESIGN, date=date, indices=[150, 150, 15]).checkpoint(filepath)
+    assert LifetimeSim.resume(filepath).date(60.0) == date + dt.timedelta(0, 60)
+
+    '''Thrust above Drag raises the Orbit'''
+    assert (full[:, 5] > 0).all() and np.all(np.diff(full[:, 1]) > 0)
+
+
+def test_batch(tmp_path):
+    designs = [dict(DESIGN, A_intake=A) for A in (0.8, 1.2)]
+    histories = run_batch(designs, 2*DAY, workers=1, checkpoint_dir=str(tmp_path), indices=[150, 150, 15])
+    for design, history in zip(designs, histories):
+        assert np.array_equal(history, LifetimeSim(design, indices=[150, 150, 15]).run(2*DAY).return_history())
+    assert sorted(os.listdir(str(tmp_path))) == ['variant_0.npz', 'variant_1.npz']
+
+
+def test_batch_pool(tmp_path):
+    '''Variants on a Process Pool, the Indices are read from the Index Store in every Worker'''
+    designs = [dict(DESIGN, A_intake=A) for A in (0.8, 1.0, 1.2)]
+    histories = run_batch(designs, 2*DAY, workers=2, checkpoint_dir=str(tmp_path))
+    for design, history in zip(designs, histories):
+        assert np.array_equal(history, LifetimeSim(design).run(2*DAY).return_history())
+    assert len(os.listdir(str(tmp_path))) == 3
+
+
+def test_eclipse_fraction():
+    '''At the equinox a dawn-dusk orbit stays in sunlight, a noon-midnight orbit at 250 km is eclipsed for
+    arccos(sqrt(r^2 - R^2)/r)/pi of the orbit'''
+    assert eclipse_fraction(250, 97.0, 6.0, 80) == 0.0
+    r = 6371000 + 250e3
+    assert abs(eclipse_fraction(250, 90.0, 12.0, 80) - np.arccos(np.sqrt(r**2 - 6371000**2)/r)/np.pi) < 1e-3
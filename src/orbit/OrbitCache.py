@@ -0,0 +1,94 @@
+'''Importing Required Modules from Folder'''
+from src.orbit.OrbitStore import OrbitStore, COLUMNS, case_id
+
+'''Importing Required Modules'''
+import os
+import numpy as np
+
+'''Content-addressed On-disk Cache of OrbitAtmosCalc1Day Results'''
+'''
+* A Result is stored as a Case of an OrbitStore, its Name is the Hash of the Key: the Constructor Arguments, the
+Discretization Step, the resolved Solar Flux and AP Indices and MODEL_VERSION
+* MODEL_VERSION is part of every Key, bump it when the Model or the Ground Track change so old Results are no longer
+returned; prune removes the Results of other Versions
+* The Cache holds at most max_bytes, the least recently used Results are evicted first. A Result counts as used when
+it is stored or returned, its File modification time records the last use
+'''
+
+'''Version Tag of the Results, part of every Key'''
+MODEL_VERSION = 'nrlmsise00-gtd7/groundtrack-2'
+
+'''Default Directory and Size Cap of the Cache'''
+CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data',
+                          'atmosorbitcache')
+MAX_BYTES = 500e6
+
+
+class OrbitCache(object):
+
+    def __init__(self, dirpath: str = CACHE_PATH, max_bytes: float = MAX_BYTES, version: str = MODEL_VERSION):
+        '''Class OrbitCache'''
+        '''INPUT 1: Directory of the Cache, created if missing'''
+        '''INPUT 2: Size Cap of the Cache Files in bytes'''
+        '''INPUT 3: Version Tag added to every Key'''
+
+        self.__store = OrbitStore(dirpath)
+        self.__max_bytes = max_bytes
+        self.__version = version
+
+    def return_store(self):
+        return self.__store
+
+    def key(self, meta: dict):
+        '''Key of a Result, the Parameters of OrbitAtmosCalc1Day.return_meta with the Version Tag'''
+        return dict(meta, version=self.__version)
+
+    def get(self, meta: dict):
+        '''Function get'''
+        '''Returns the stored (N,20) NP Array of the Result with the given Parameters, or None if it is not cached'''
+        case = case_id(self.key(meta))
+        if not os.path.exists(self.__store.filepath(case)):
+            return None
+        data = self.__store.load(case)
+        os.utime(self.__store.filepath(case))
+        return np.column_stack([data[name] for name in COLUMNS]).astype(np.float64)
+
+    def put(self, meta: dict, vals: np.ndarray):
+        '''Function put'''
+        '''Stores a Result under the given Parameters and evicts least recently used Results above the Size Cap'''
+        case = self.__store.save(vals, self.key(meta))
+        self.evict(keep=case)
+        return case
+
+    def size(self):
+        '''Total Size of the Cache Files in bytes'''
+        return sum(os.path.getsize(self.__store.filepath(case)) for case in self.__store.return_catalog()
+                   if os.path.exists(self.__store.filepath(case)))
+
+    def evict(self, keep: str = None):
+        '''Removes least recently used Results until the Cache fits max_bytes, the Result keep is never removed'''
+        files = [(os.path.getmtime(self.__store.filepath(case)), os.path.getsize(self.__store.filepath(case)), case)
+                 for case in list(self.__store.return_catalog()) if os.path.exists(self.__store.filepath(case))]
+        total = sum(size for _, size, _ in files)
+        for _, size, case in sorted(files):
+            if total <= self.__max_bytes:
+                break
+            if case != keep:
+                self.__store.remove(case)
+                total -= size
+
+    def invalidate(self, **params):
+        '''Removes the Results matching the Parameters, see OrbitStore.find; all Results if none are given'''
+        cases = self.__store.find(**params)
+        for case in cases:
+            self.__store.remove(case)
+        return len(cases)
+
+    def prune(self):
+        '''Removes the Results of Version Tags other than the current one'''
+        return self.invalidate(version=lambda version: version != self.__version)
+
+
+if __name__ == "__main__":
+    cache = OrbitCache()
+    print(len(cache.return_store().return_catalog()), 'results,', cache.size()/1e6, 'MB')
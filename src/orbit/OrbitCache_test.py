@@ -0,0 +1,72 @@
+"""
+Checks the OrbitCache: hits and misses, invalidation by MODEL_VERSION,
+eviction of the least recently used results and cached OrbitAtmosCalc1Day
+runs against fresh ones.
+"""
+
+import os
+import numpy as np
+
+from src.orbit.OrbitCache import OrbitCache, MODEL_VERSION
+from src.orbit.OrbitDragCalc import OrbitAtmosCalc1Day
+
+META = {'date': '2008-06-02T00:00:00', 't': 110, 'inc': 94.7, 'h': 206.0}
+
+
+def result(seed=0, n=50):
+    vals = np.random.default_rng(seed).uniform(0, 1e3, (n, 20))
+    vals[:, :6] = np.round(vals[:, :6])
+    return vals
+
+
+def test_hit_miss(tmp_path):
+    cache = OrbitCache(str(tmp_path))
+    assert cache.get(META) is None
+    cache.put(META, result())
+    assert np.array_equal(cache.get(META), result())
+    assert cache.get(dict(META, h=210.0)) is None
+
+    '''A second Cache on the same Directory finds the Result'''
+    assert np.array_equal(OrbitCache(str(tmp_path)).get(META), result())
+    assert cache.invalidate(h=206.0) == 1 and cache.get(META) is None
+
+
+def test_version(tmp_path):
+    '''Results of another MODEL_VERSION are not returned, prune removes them'''
+    OrbitCache(str(tmp_path), version='old').put(META, result())
+    cache = OrbitCache(str(tmp_path))
+    assert cache.get(META) is None
+    cache.put(META, result(1))
+    assert np.array_equal(cache.get(META), result(1))
+    assert cache.prune() == 1
+    assert cache.return_store().find(version='old') == [] and cache.return_store().find(version=MODEL_VERSION)
+
+
+def test_evict(tmp_path):
+    '''Beyond max_bytes the least recently used Results are removed, the Result just stored is kept'''
+    cache = OrbitCache(str(tmp_path))
+    metas = [dict(META, h=h) for h in (200.0, 210.0, 220.0)]
+    for age, meta in zip((300, 200), metas):
+        cache.put(meta, result())
+        filepath = cache.return_store().filepath(cache.return_store().find(h=meta['h'])[0])
+        os.utime(filepath, (os.path.getmtime(filepath) - age,)*2)
+    cache.get(metas[0])
+
+    small = OrbitCache(str(tmp_path), max_bytes=2.5*cache.size()/2)
+    small.put(metas[2], result())
+    assert small.get(metas[1]) is None
+    assert small.get(metas[0]) is not None and small.get(metas[2]) is not None
+
+
+def test_orbit_calc(tmp_path, monkeypatch):
+    '''A cached Run returns the Data and Averages of a fresh Run without computing'''
+    fresh = OrbitAtmosCalc1Day(t=110, save=False)
+    cache = OrbitCache(str(tmp_path))
+    OrbitAtmosCalc1Day(t=110, save=False, cache=cache)
+
+    def fail(self):
+        raise AssertionError('cached run was computed again')
+    monkeypatch.setattr(OrbitAtmosCalc1Day, 'calc', fail)
+    cached = OrbitAtmosCalc1Day(t=110, save=False, cache=cache)
+    assert cached.return_vals().equals(fresh.return_vals())
+    assert np.array_equal(cached.return_pros(), fresh.return_pros())
@@ -1,7 +1,9 @@
 '''Importing Required Modules from Folder'''
 from src.orbit.SatGroundTrack.GroundTrack import GroundTrackCalc
 from src.atmos.nrlmsise00.IndexFindr.IndexReturn import Indexer
-from src.atmos.nrlmsise00.AtmosCalc import nrl00,nrl00_cond
+from src.atmos.nrlmsise00.AtmosCalcFloat import nrl00_batch_float
+from src.orbit.OrbitStore import OrbitStore
+from src.orbit.OrbitCache import OrbitCache
 
 '''Importing Required Modules'''
 import time
@@ -10,7 +12,6 @@ import numpy as np
 import datetime as dt
 import pandas as pd
 from astropy import units as u
-import matplotlib.pyplot as plt
 
 
 '''Class OrbitAtmosCalc1Day'''
@@ -23,7 +24,11 @@ import matplotlib.pyplot as plt
 * INPUT 5: Initial Latitude of Satellite
 * INPUT 6: Initial Longitude of Satellite
 
-* PARAM 1: plot, set True if orbit ground track plot is required
+* PARAM 1: save, set False to skip writing the orbit data to the OrbitStore
+* PARAM 2: store, OrbitStore the orbit data is saved to, defaults to the Store in data/atmosorbitdata
+* PARAM 3: cache, OrbitCache to take the orbit data from if the same Case was computed before, see OrbitCache
+* PARAM 4: cadence, Interval [s] at which the Solar and AP Indices are refreshed along the orbit, defaults to the 3 hour
+AP Slots; None keeps the Indices of the Start Date for the whole day
 
 * OUTPUT 1: Dataframe structure containing the calculated orbit data in columns:
 ['time [s]','Lat [deg]','Lon [deg]','V_rel [m/s]','V [rad/s]','Azimuth [deg]'] 
@@ -32,44 +37,62 @@ for each discretization step along the requested orbit
 
 class OrbitAtmosCalc1Day(object):
     def __init__(self, t:int=400, date: dt.datetime= dt.datetime(2008, 6, 2), inc:float = 94.7 * u.deg, h:float= 206 * u.km,
-                 lat0: float = 12.77*u.deg, longi0: float = -91.37*u.deg):
+                 lat0: float = 12.77*u.deg, longi0: float = -91.37*u.deg, save: bool = True,
+                 store: OrbitStore = None, cache: OrbitCache = None, cadence: int = 3*60*60):
 
         self.__date = date
+        self.__start = date
+        self.__t = t
+        self.__cadence = cadence
         self.__inc = inc.to(u.deg)
         self.__h = h.to(u.km)
         self.__lat0 = lat0.to(u.deg)
         self.__longi0 = longi0.to(u.deg)
-        self.__pos = GroundTrackCalc(dt = t, inc = self.__inc, h = self.__h, lat0 = self.__lat0,
-                                     longi0=self.__longi0, n=0).return_data()
-
-        self.__vals = np.zeros([len(self.__pos),20])
-        self.__pros = np.zeros([3,11])
-
         self.__indices = Indexer(self.__date).return_indices()[1:]
+        self.__pros = np.zeros([3,11])
 
-        for idx,i in enumerate(range(len(self.__pos))):
-            if idx%1 == 20:
-                self.__indices = Indexer(self.__date).return_indices()[1:]
-
-            self.__data = nrl00(date=self.__date,h=self.__h ,lat = self.__pos['Lat [deg]'][i]*u.deg, lon = self.__pos['Lon [deg]'][i]*u.deg,
-                                indices = self.__indices)
-            self.__date = date + dt.timedelta(0, self.__pos['time [s]'][i])
-            self.__vals[i][0] = self.__date.year
-            self.__vals[i][1] = self.__date.month
-            self.__vals[i][2] = self.__date.day
-            self.__vals[i][3] = self.__date.hour
-            self.__vals[i][4] = self.__date.minute
-            self.__vals[i][5] = self.__date.second
-            self.__vals[i][6] = self.__pos['Lat [deg]'][i]
-            self.__vals[i][7] = self.__pos['Lon [deg]'][i]
-            self.__vals[i][8] = self.__pos['V_rel [m/s]'][i]
-            self.__vals[i][9:18]=self.__data.d
-            self.__vals[i][18:20]=self.__data.t
+        '''A cached Result of the same Case is returned instead of recomputing it'''
+        self.__vals = cache.get(self.return_meta()) if cache is not None else None
+        if self.__vals is None:
+            self.calc()
+            if cache is not None:
+                cache.put(self.return_meta(), self.__vals)
+        else:
+            self.__date = dt.datetime(*self.__vals[-1, 0:6].astype(int))
 
         self.data_df()
-        self.save_csv(self.__df)
+        if save:
+            self.save_store(store if store is not None else OrbitStore())
         self.avgcalc()
 
+    def calc(self):
+        '''Function calc'''
+        '''Computes the Ground Track and the Atmosphere along it'''
+        date = self.__start
+        pos = GroundTrackCalc(dt = self.__t, inc = self.__inc, h = self.__h, lat0 = self.__lat0,
+                              longi0=self.__longi0, n=0).return_data()
+        self.__vals = np.zeros([len(pos),20])
+
+        '''Dates of every Sample, the Atmosphere of a Sample is evaluated at its own Date'''
+        dates = [date + dt.timedelta(0, sec) for sec in pos['time [s]']]
+        self.__date = dates[-1]
+
+        '''Indices are refreshed at every Slot boundary from a Table of the Slots the Day spans'''
+        indices = self.__indices
+        if self.__cadence is not None:
+            indices = Indexer.for_slots(date, np.array(pos['time [s]']), self.__cadence)
+
+        '''Evaluate the Atmosphere along the whole Ground Track in one Vectorised Call, without Quantities'''
+        d, t = nrl00_batch_float(dates=dates, h=self.__h.value, lat=np.array(pos['Lat [deg]']),
+                                 lon=np.array(pos['Lon [deg]']), indices=indices)
+
+        self.__vals[:, 0:6] = [[i.year, i.month, i.day, i.hour, i.minute, i.second] for i in dates]
+        self.__vals[:, 6] = pos['Lat [deg]']
+        self.__vals[:, 7] = pos['Lon [deg]']
+        self.__vals[:, 8] = pos['V_rel [m/s]']
+        self.__vals[:, 9:18] = d
+        self.__vals[:, 18:20] = t
+
     def return_vals(self):
         return self.__df
 
@@ -88,6 +111,18 @@ class OrbitAtmosCalc1Day(object):
         self.__df = pd.DataFrame(self.__pros)
         self.__df.columns = ['He','O','N2','O2','Ar','Density','H','N','Anomalous Oxygen','Exospheric Temp','Temp']
 
+    def return_meta(self):
+        '''Parameters of the Case as stored with its data in the OrbitStore'''
+        return {'date': self.__start.isoformat(), 't': self.__t, 'inc': float(self.__inc.value),
+                'h': float(self.__h.value), 'lat0': float(self.__lat0.value), 'longi0': float(self.__longi0.value),
+                'F107': float(self.__indices[0]), 'F107A': float(self.__indices[1]), 'AP': float(self.__indices[2]),
+                'indices': [float(i) for i in self.__indices], 'cadence': self.__cadence}
+
+    def save_store(self, store: OrbitStore):
+        '''Function save_store'''
+        '''Saves the orbit data and the Parameters of the Case to an OrbitStore, returns the Case Name'''
+        return store.save(self.__vals, self.return_meta())
+
     def save_csv(self,dataframe: pd.DataFrame, filepath: str = r'\\'.join(os.getcwd().split('\\')[:-2]) +
                                                           '\\data\\atmosorbitdata\\'):
         '''Function save_csv'''
@@ -107,6 +142,7 @@ class OrbitAtmosCalc1Day(object):
             self.__pros[:, i-9] = np.array([avg, min, max])
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
     a = OrbitAtmosCalc1Day()
     b = a.return_vals()
     c = a.return_pros()
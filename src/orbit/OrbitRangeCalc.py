@@ -1,5 +1,6 @@
-from src.orbit.OrbitDragCalc import OrbitAtmosCalc
-import matplotlib.pyplot as plt
+from src.orbit.OrbitSweep import OrbitSweep, sweep_grid
+from astropy import units as u
+import datetime as dt
 import numpy as np
 
 hmin = 210
@@ -11,20 +12,24 @@ monthlst = [1,2,3,4,5,6,7,8,9,10,11,12]
 daylst = [3,5,7,10,13,15,17,20,22]
 sec = 10
 
-dens_lst = []
+if __name__ == "__main__":
+    '''matplotlib is imported here so the Worker Processes of the Sweep do not import it'''
+    import matplotlib.pyplot as plt
+    dates = []
+    cases = []
 
-i=0
+    i=0
 
-for year in yearmax:
-    i+=300
-    for month in monthlst:
-        for day in daylst:
-            i+=1
-            print(year,month,day)
-            a = OrbitAtmosCalc(150,year,month,day,sec,hmax).return_pros()
-            dens = [i,a[0][5],a[1][5],a[2][5]]
-            dens_lst.append(dens)
+    for year in yearmax:
+        i+=300
+        for month in monthlst:
+            for day in daylst:
+                i+=1
+                dates.append(dt.datetime(year,month,day))
+                cases.append(i)
 
-dens_lst = np.array(dens_lst)
-plt.plot(dens_lst[:,0],dens_lst[:,1])
-plt.show()
+    results = OrbitSweep(sweep_grid(dates, hs=[hmax*u.km]), t=150, chunk=4).run_all()
+
+    dens_lst = np.array([[i, pros[0][5], pros[1][5], pros[2][5]] for i, (case, pros, _) in zip(cases, results)])
+    plt.plot(dens_lst[:,0],dens_lst[:,1])
+    plt.show()
@@ -0,0 +1,165 @@
+'''Importing Required Modules'''
+import os
+import json
+import hashlib
+import numpy as np
+
+'''Columnar Store of Orbit Atmosphere Results, one compressed .npz File per Case with the Case Parameters as Metadata'''
+'''
+* Every Column of a Case is a separate Member of its .npz File, loading only some Columns (e.g. only 'Density') does
+not read or decompress the others
+* The Parameters of every Case are kept in its File and in a <case>.json Sidecar next to it, cases are queried on
+the Catalog of the Sidecars without opening any Case File. A missing Sidecar is rebuilt from its Case File
+* Cases are only added, saving a Case with the same Parameters again replaces its File, remove deletes a Case
+* Files are written to a temporary Name and moved into place, and every Case has its own Sidecar, so several
+Processes can save to the same Store; the Catalog picks up Cases saved by other Processes when it is read
+'''
+
+'''Default Directory of the Store'''
+STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data',
+                          'atmosorbitdata')
+
+'''Columns of OrbitAtmosCalc1Day.return_vals, the Date Columns are stored as Integers'''
+COLUMNS = ['Year','Month','Day','Hour','Minute','Second','Lat','Long','V_rel',
+           'He','O','N2','O2','Ar','Density','H','N','Anomalous Oxygen','Exospheric Temp','Temp']
+DATE_COLUMNS = COLUMNS[:6]
+
+'''Parameters encoded in the Filenames of the csv Files of OrbitAtmosCalc1Day.save_csv, in Filename order'''
+CSV_PARAMS = ['inc', 'h', 'lat0', 'longi0', 'F107', 'F107A', 'AP']
+
+
+def case_id(meta: dict):
+    '''Function case_id'''
+    '''Name of the File of a Case, a Hash of its Parameters'''
+    return hashlib.sha1(json.dumps(meta, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class OrbitStore(object):
+
+    def __init__(self, dirpath: str = STORE_PATH):
+        '''Class OrbitStore'''
+        '''INPUT 1: Directory of the Store, created if missing'''
+
+        self.__dirpath = dirpath
+        os.makedirs(dirpath, exist_ok=True)
+        self.__catalog = {}
+        self.read_catalog()
+
+    def return_catalog(self):
+        '''dict of Case Name: Parameters for every stored Case, including Cases saved by other Processes'''
+        return self.read_catalog()
+
+    def filepath(self, case: str):
+        return os.path.join(self.__dirpath, case + '.npz')
+
+    def meta_filepath(self, case: str):
+        return os.path.join(self.__dirpath, case + '.json')
+
+    def read_catalog(self):
+        '''Updates the Catalog from the Case Files in the Directory, the Sidecar of a new Case is read once (the
+        Parameters of a Case never change) and rebuilt from its Case File if it is missing'''
+        cases = set(name[:-4] for name in os.listdir(self.__dirpath) if name.endswith('.npz'))
+        for case in set(self.__catalog) - cases:
+            del self.__catalog[case]
+        for case in sorted(cases - set(self.__catalog)):
+            try:
+                with open(self.meta_filepath(case)) as f:
+                    self.__catalog[case] = json.load(f)
+            except FileNotFoundError:
+                if not os.path.exists(self.filepath(case)):
+                    continue
+                with np.load(self.filepath(case)) as data:
+                    self.__catalog[case] = json.loads(str(data['meta']))
+                self.write_meta(case, self.__catalog[case])
+        return self.__catalog
+
+    def write_meta(self, case: str, meta: dict):
+        tmp_filepath = '%s.%d.tmp' % (self.meta_filepath(case), os.getpid())
+        with open(tmp_filepath, 'w') as f:
+            json.dump(meta, f, indent=1, sort_keys=True)
+        os.replace(tmp_filepath, self.meta_filepath(case))
+
+    def save(self, vals, meta: dict, dtype=np.float64):
+        '''Function save'''
+        '''Saves one Case, returns its Name'''
+        '''PARAM 1: (N,20) NP Array or DataFrame with the COLUMNS of OrbitAtmosCalc1Day.return_vals'''
+        '''PARAM 2: dict with the Parameters of the Case, values must be JSON serialisable'''
+        '''PARAM 3: dtype of the non-Date Columns, np.float32 halves the size at ~7 significant digits'''
+        vals = np.asarray(vals, dtype=np.float64)
+        if vals.ndim != 2 or vals.shape[1] != len(COLUMNS):
+            raise ValueError('vals must have the ' + str(len(COLUMNS)) + ' columns ' + str(COLUMNS))
+
+        case = case_id(meta)
+        columns = {name: vals[:, i].astype(np.int32 if name in DATE_COLUMNS else dtype)
+                   for i, name in enumerate(COLUMNS)}
+
+        '''The Sidecar is written first, a Case File in the Directory always has its Parameters'''
+        self.write_meta(case, meta)
+        tmp_filepath = '%s.%d.tmp' % (self.filepath(case), os.getpid())
+        with open(tmp_filepath, 'wb') as f:
+            np.savez_compressed(f, meta=json.dumps(meta, sort_keys=True), **columns)
+        os.replace(tmp_filepath, self.filepath(case))
+
+        '''The Catalog holds the Parameters as read back from JSON (e.g. Tuples become Lists), as in other Processes'''
+        self.__catalog[case] = json.loads(json.dumps(meta))
+        return case
+
+    def remove(self, case: str):
+        '''Deletes a Case File and its Catalog Entry'''
+        for filepath in (self.filepath(case), self.meta_filepath(case)):
+            try:
+                os.remove(filepath)
+            except FileNotFoundError:
+                pass
+        self.__catalog.pop(case, None)
+
+    def load(self, case: str, columns: list = None):
+        '''Function load'''
+        '''Returns a dict of Column Name: NP Array of a Case, only the requested Columns are read'''
+        '''PARAM 1: Name of the Case, see find'''
+        '''PARAM 2: List of Column Names, all COLUMNS if None'''
+        with np.load(self.filepath(case)) as data:
+            return {name: data[name] for name in (COLUMNS if columns is None else columns)}
+
+    def load_df(self, case: str, columns: list = None):
+        '''The Columns of load as a DataFrame, as returned by OrbitAtmosCalc1Day.return_vals'''
+        import pandas as pd
+        return pd.DataFrame(self.load(case, columns))
+
+    def find(self, **params):
+        '''Function find'''
+        '''Returns the Names of the Cases whose Parameters match all given Parameters'''
+        '''
+        * Numbers are compared with np.isclose, other values must be equal
+        * A Parameter can also be a (min, max) tuple of an inclusive Range, or a Function returning True for a match
+        e.g. find(h=(200, 250), F107=lambda f: f > 150)
+        '''
+        def match(value, query):
+            if callable(query):
+                return query(value)
+            if isinstance(query, tuple):
+                return query[0] <= value <= query[1]
+            if isinstance(query, (int, float)) and isinstance(value, (int, float)):
+                return bool(np.isclose(value, query))
+            return value == query
+
+        return [case for case, meta in self.read_catalog().items()
+                if all(name in meta and match(meta[name], query) for name, query in params.items())]
+
+    def import_csv(self, csv_filepath: str, dtype=np.float64):
+        '''Function import_csv'''
+        '''Saves a csv File of OrbitAtmosCalc1Day.save_csv as a Case, the Parameters are read from its Filename'''
+        import pandas as pd
+        values = os.path.basename(csv_filepath)[:-len('.csv')].split(',')
+        meta = dict(zip(CSV_PARAMS, (float(v) for v in values)))
+        return self.save(pd.read_csv(csv_filepath, index_col=0)[COLUMNS], meta, dtype=dtype)
+
+
+if __name__ == "__main__":
+    '''Convert the csv Files of the Default Directory and load the Density of the 200 km Cases'''
+    store = OrbitStore()
+    for name in os.listdir(STORE_PATH):
+        if name.endswith('.csv'):
+            store.import_csv(os.path.join(STORE_PATH, name))
+    for case in store.find(h=200):
+        print(store.return_catalog()[case], store.load(case, ['Density'])['Density'].mean())
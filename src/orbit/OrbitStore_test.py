@@ -0,0 +1,72 @@
+"""
+Checks that cases round-trip through the OrbitStore and that its catalog
+finds them, also when several writers share the store directory.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from src.orbit.OrbitStore import OrbitStore, COLUMNS, case_id
+
+META = {'inc': 94.7, 'h': 210.0, 'lat0': 12.77, 'longi0': -91.37, 'F107': 150.0, 'F107A': 140.0, 'AP': 15.0}
+
+
+def orbit_vals(n=50, seed=0):
+    '''Orbit Data shaped as OrbitAtmosCalc1Day.return_vals'''
+    rng = np.random.default_rng(seed)
+    vals = rng.uniform(-1e3, 1e3, (n, len(COLUMNS)))
+    vals[:, :6] = [2008, 6, 2, 12, 30, 15]
+    return vals
+
+
+def test_round_trip(tmp_path):
+    store = OrbitStore(str(tmp_path))
+    vals = orbit_vals()
+    case = store.save(vals, META)
+    assert case == case_id(META) and store.return_catalog() == {case: META}
+
+    data = store.load(case)
+    assert list(data) == COLUMNS and np.array_equal(np.column_stack([data[c] for c in COLUMNS]), vals)
+    assert data['Year'].dtype == np.int32
+    assert list(store.load(case, ['Density'])) == ['Density']
+    assert store.load_df(case).equals(pd.DataFrame(vals, columns=COLUMNS).astype({c: np.int32 for c in COLUMNS[:6]}))
+
+    '''float32 Columns keep about 7 significant Digits'''
+    small = store.save(vals, dict(META, h=250.0), dtype=np.float32)
+    assert np.allclose(store.load(small, ['Density'])['Density'], vals[:, 14], rtol=1e-7)
+    assert sorted(os.listdir(str(tmp_path))) == sorted([case + '.npz', case + '.json', small + '.npz', small + '.json'])
+
+
+def test_catalog(tmp_path):
+    store = OrbitStore(str(tmp_path))
+    cases = {h: store.save(orbit_vals(), dict(META, h=h)) for h in (200.0, 210.0, 250.0)}
+    assert store.find(h=210) == [cases[210.0]]
+    assert sorted(store.find(h=(200, 215))) == sorted([cases[200.0], cases[210.0]])
+    assert sorted(store.find(h=lambda h: h > 205, inc=94.7)) == sorted([cases[210.0], cases[250.0]])
+    assert store.find(h=300) == []
+
+    '''A new Store reads the Catalog from the Sidecars, a missing Sidecar is rebuilt from its Case File'''
+    os.remove(store.meta_filepath(cases[250.0]))
+    assert OrbitStore(str(tmp_path)).return_catalog() == store.return_catalog()
+    assert os.path.exists(store.meta_filepath(cases[250.0]))
+
+    store.remove(cases[200.0])
+    assert cases[200.0] not in OrbitStore(str(tmp_path)).return_catalog()
+    assert not os.path.exists(store.filepath(cases[200.0]))
+
+
+def save_case(dirpath, h):
+    return OrbitStore(dirpath).save(orbit_vals(seed=int(h)), dict(META, h=h))
+
+
+def test_concurrent_writers(tmp_path):
+    '''Writers in several Processes do not drop each other's Catalog Entries'''
+    store = OrbitStore(str(tmp_path))
+    hs = [200.0 + i for i in range(16)]
+    with ProcessPoolExecutor(4) as pool:
+        cases = list(pool.map(save_case, [str(tmp_path)]*len(hs), hs))
+    assert sorted(store.return_catalog()) == sorted(cases)
+    assert sorted(store.find(h=(200, 216))) == sorted(cases)
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith('.tmp')]
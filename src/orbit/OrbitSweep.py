@@ -0,0 +1,114 @@
+'''Importing Required Modules from Folder'''
+from src.orbit.OrbitDragCalc import OrbitAtmosCalc1Day
+from src.atmos.nrlmsise00.IndexFindr.IndexStore import open_store
+
+'''Importing Required Modules'''
+import os
+import itertools
+import datetime as dt
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from astropy import units as u
+
+
+'''Function sweep_grid'''
+'''Builds the list of Cases spanned by the Parameter Grid'''
+'''
+* INPUT 1: List of Dates
+* INPUT 2: List of Orbit Inclinations
+* INPUT 3: List of Orbital Altitudes
+* INPUT 4: List of Initial Latitudes
+* INPUT 5: List of Initial Longitudes
+
+* OUTPUT 1: List of (date, inc, h, lat0, longi0) tuples, one for every Combination of the Inputs
+'''
+
+def sweep_grid(dates: list, incs: list = (94.7*u.deg,), hs: list = (206*u.km,), lat0s: list = (12.77*u.deg,),
+               longi0s: list = (-91.37*u.deg,)):
+    return list(itertools.product(dates, incs, hs, lat0s, longi0s))
+
+
+'''Function run_chunk'''
+'''Evaluates a Chunk of Cases in a Worker Process'''
+'''
+* INPUT 1: List of (index, case) pairs, case being a (date, inc, h, lat0, longi0) tuple
+* INPUT 2: Discretization Step per Orbit
+
+* PARAM 1: vals, set True to also return the full orbit data of every case
+
+* OUTPUT 1: List of (index, case, pros, vals) tuples, pros is the [avg, min, max] array of OrbitAtmosCalc1Day.avgcalc
+and vals the orbit DataFrame (None unless vals is True)
+'''
+
+def run_chunk(cases: list, t: int = 400, vals: bool = False):
+    results = []
+    for idx, case in cases:
+        date, inc, h, lat0, longi0 = case
+        calc = OrbitAtmosCalc1Day(t=t, date=date, inc=inc, h=h, lat0=lat0, longi0=longi0, save=False)
+        results.append((idx, case, calc.return_pros(), calc.return_vals() if vals else None))
+    return results
+
+
+'''Class OrbitSweep'''
+'''Evaluates OrbitAtmosCalc1Day over a Parameter Grid on a Pool of Worker Processes'''
+'''
+* INPUT 1: List of (date, inc, h, lat0, longi0) Cases, see sweep_grid
+* INPUT 2: Discretization Step per Orbit (keep above 100)
+* INPUT 3: Number of Worker Processes, defaults to the Number of Cores
+* INPUT 4: Number of Cases sent to a Worker at once
+
+* PARAM 1: vals, set True to also return the full orbit data of every case
+
+* OUTPUT 1: Generator over (case, pros, vals) tuples in completion order, see run
+'''
+
+class OrbitSweep(object):
+    def __init__(self, cases: list, t: int = 400, workers: int = None, chunk: int = 1, vals: bool = False):
+        if chunk < 1:
+            raise ValueError('chunk must be at least 1')
+
+        self.__cases = list(cases)
+        self.__t = t
+        self.__workers = workers if workers is not None else os.cpu_count()
+        self.__chunk = chunk
+        self.__vals = vals
+
+    def return_cases(self):
+        return self.__cases
+
+    def chunks(self):
+        cases = list(enumerate(self.__cases))
+        return [cases[i:i+self.__chunk] for i in range(0, len(cases), self.__chunk)]
+
+    def results(self):
+        '''Yields (index, case, pros, vals) for every Chunk as soon as its Worker finishes'''
+        if self.__workers == 1:
+            for chunk in self.chunks():
+                yield from run_chunk(chunk, self.__t, self.__vals)
+            return
+
+        '''The Index Store is opened (and built if needed) here, so the Workers do not all build it at once'''
+        open_store()
+        with ProcessPoolExecutor(max_workers=self.__workers) as pool:
+            futures = [pool.submit(run_chunk, chunk, self.__t, self.__vals) for chunk in self.chunks()]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def run(self):
+        '''Yields (case, pros, vals) in Completion Order'''
+        for _, case, pros, vals in self.results():
+            yield case, pros, vals
+
+    def run_all(self):
+        '''Collects the Results and returns them in the Order of the Cases'''
+        results = [None]*len(self.__cases)
+        for idx, case, pros, vals in self.results():
+            results[idx] = (case, pros, vals)
+        return results
+
+
+if __name__ == "__main__":
+    dates = [dt.datetime(year, month, day) for year in [1990] for month in range(1, 13) for day in [3, 10, 17]]
+    sweep = OrbitSweep(sweep_grid(dates, hs=[210*u.km, 250*u.km]), t=150, chunk=4)
+    for case, pros, _ in sweep.run():
+        print(case[0].date(), case[2], 'Density avg/min/max:', pros[:, 5])
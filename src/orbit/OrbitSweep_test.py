@@ -0,0 +1,51 @@
+"""
+Checks the sweep engine against serial OrbitAtmosCalc1Day runs.
+"""
+
+import datetime as dt
+import numpy as np
+from astropy import units as u
+
+from src.orbit.OrbitDragCalc import OrbitAtmosCalc1Day
+from src.orbit.OrbitSweep import OrbitSweep, sweep_grid, run_chunk
+
+DATES = [dt.datetime(2008, 6, 2), dt.datetime(2010, 10, 10)]
+T = 110
+
+
+def serial(case):
+    date, inc, h, lat0, longi0 = case
+    return OrbitAtmosCalc1Day(t=T, date=date, inc=inc, h=h, lat0=lat0, longi0=longi0, save=False)
+
+
+def test_sweep_grid():
+    cases = sweep_grid(DATES, incs=[94.7*u.deg, 60*u.deg], hs=[206*u.km, 250*u.km, 300*u.km])
+    assert len(cases) == 12
+    assert cases[0] == (DATES[0], 94.7*u.deg, 206*u.km, 12.77*u.deg, -91.37*u.deg)
+    assert cases[-1][:3] == (DATES[1], 60*u.deg, 300*u.km)
+
+
+def test_run_chunk():
+    cases = sweep_grid(DATES)
+    results = run_chunk(list(enumerate(cases)), T, vals=True)
+    assert [idx for idx, _, _, _ in results] == [0, 1]
+    for idx, case, pros, vals in results:
+        calc = serial(case)
+        assert case == cases[idx]
+        assert np.array_equal(pros, calc.return_pros())
+        assert vals.equals(calc.return_vals())
+    assert all(vals is None for _, _, _, vals in run_chunk(list(enumerate(cases)), T))
+
+
+def test_sweep_parity():
+    '''Pooled Results equal serial ones, run_all keeps the Order of the Cases'''
+    cases = sweep_grid(DATES, hs=[206*u.km, 250*u.km])
+    ref = [serial(case).return_pros() for case in cases]
+
+    results = OrbitSweep(cases, t=T, workers=2, chunk=3).run_all()
+    assert [case for case, _, _ in results] == cases
+    assert all(np.array_equal(pros, i) for (_, pros, _), i in zip(results, ref))
+
+    done = {cases.index(case): pros for case, pros, _ in OrbitSweep(cases, t=T, workers=2).run()}
+    assert sorted(done) == list(range(len(cases)))
+    assert all(np.array_equal(done[i], ref[i]) for i in done)
@@ -1,8 +1,5 @@
 '''Importing Required Modules'''
 import numpy as np
-import matplotlib.pyplot as plt
-import cartopy.crs as ccrs
-import pandas as pd
 from astropy import units as u
 
 '''This code was provided by Group 08 Supervisor Mark Rovira'''
@@ -24,6 +21,9 @@ If n = 0, it will determine the revolutions within one day
 * OUTPUT 1: Dataframe structure containing the calculated orbit data in columns:
 ['time [s]','Lat [deg]','Lon [deg]','V_rel [m/s]','V [rad/s]','Azimuth [deg]'] 
 for each discretization step along the requested orbit
+
+* iter_chunks(t_start, t_end, chunk) yields the same columns as (chunk,6) NP Arrays for any time span, one Orbit
+Period / dt apart, so tracks of weeks or months can be processed with constant memory
 '''
 
 class GroundTrackCalc(object):
@@ -60,64 +60,68 @@ class GroundTrackCalc(object):
         else:
             phi10, phi20 = self.initial_values(rho1, lat0, longi0, DA)
 
+        '''Orbit Parameters are kept for iter_chunks'''
+        self.__params = (w1, w2, rho1, rho2, phi10, phi20)
+        self.__a_sat = a_sat
+        self.__step = T_sat / dt
+
         self.t = np.linspace(0, n * T_sat, int(n * dt))
-        self.latP = np.zeros(len(self.t))
-        self.alpha = np.zeros(len(self.t))
-        self.V_rel = np.zeros(len(self.t))
-        self.V_azimuth = np.zeros(len(self.t))
-        self.azimuth = np.zeros(len(self.t))
-
-        for idx, i in enumerate(self.t):
-            latP_val, alpha_val, V_val, azimuth_val = self.ground_track(w1, w2, rho1, rho2, phi10, phi20, i)
-            if alpha_val > 180:
-                alpha_val = alpha_val - 360
-            self.latP[idx] = latP_val
-            self.alpha[idx] = alpha_val
-            self.V_azimuth[idx] = V_val
-            self.V_rel[idx] = V_val*a_sat
-            self.azimuth[idx] = azimuth_val
+        '''Computes the whole Ground Track at once, ground_track works on the Array of Times'''
+        self.latP, self.alpha, self.V_rel, self.V_azimuth, self.azimuth = self.track_block(self.t).T[1:]
 
         if plot == True:
             self.PlotGroundTrack()
 
     def return_data(self):
+        import pandas as pd
         self.__df = pd.DataFrame(np.stack((self.t,self.latP,self.alpha,self.V_rel,self.V_azimuth,self.azimuth), axis=1))
         self.__df.columns = ['time [s]','Lat [deg]','Lon [deg]','V_rel [m/s]','V [rad/s]','Azimuth [deg]']
         return self.__df
 
+    def track_block(self, t: np.ndarray):
+        '''Ground Track at the Times t [s] as an (N,6) NP Array with the columns of return_data'''
+        latP, alpha, V, azimuth = self.ground_track(*self.__params, t)
+        block = np.empty((len(t), 6))
+        block[:, 0] = t
+        block[:, 1] = latP
+        block[:, 2] = np.where(alpha > 180, alpha - 360, alpha)
+        block[:, 3] = V*self.__a_sat
+        block[:, 4] = V
+        block[:, 5] = azimuth
+        return block
+
+    def iter_chunks(self, t_start: float = 0.0, t_end: float = 86164.1004, chunk: int = 10000, step: float = None):
+        '''Yields the Ground Track from t_start to t_end [s] (inclusive if on the time grid) in blocks of chunk
+        samples, see track_block, the last block holds the remaining samples'''
+        '''step [s] between the samples defaults to one Orbit Period / dt, with step = self.t[1] and t_end = self.t[-1]
+        the blocks hold the samples of return_data'''
+        if chunk < 1:
+            raise ValueError("chunk must be at least 1")
+        step = self.__step if step is None else step
+        samples = int(np.floor((t_end - t_start) / step * (1 + 1e-12))) + 1
+        for first in range(0, max(samples, 0), chunk):
+            k = np.arange(first, min(first + chunk, samples))
+            yield self.track_block(t_start + k * step)
+
+    '''The Helper Functions take Floats or NP Arrays, branches are replaced by np.where so they work elementwise'''
+
     def hemisphere_function(self,angle):
-        if angle>=0 and angle <= np.pi:
-            H=1
-        elif angle > np.pi and angle <=2*np.pi:
-            H=-1
-        else:
+        angle = np.asarray(angle)
+        if not np.all((angle >= 0) & (angle <= 2*np.pi)):
             raise ValueError
-        return H
+        return np.where(angle <= np.pi, 1, -1)
 
     def acos2(self,cosine,H):
-        if H == 1:
-            if cosine>1:
-                angle=0
-            elif cosine<-1:
-                angle=np.pi
-            else:
-                angle=np.arccos(cosine)
-        elif H ==-1:
-            if cosine>1:
-                angle=0
-            elif cosine<-1:
-                angle=np.pi
-            else:
-                angle=2*np.pi-np.arccos(cosine)
-        else:
+        H = np.asarray(H)
+        if not np.all((H == 1) | (H == -1)):
             raise ValueError
-        return angle
+        '''Cosines outside [-1,1] give 0 or pi for either Hemisphere'''
+        angle = np.arccos(np.clip(cosine, -1, 1))
+        return np.where((H == -1) & (np.abs(cosine) <= 1), 2*np.pi-angle, angle)
 
     def zero_2pi(self,angle0):
         angle=np.arctan2(np.sin(angle0),np.cos(angle0))
-        if angle<0:
-            angle=2*np.pi+angle
-        return angle
+        return np.where(angle<0, 2*np.pi+angle, angle)
 
     def initial_values(self,rho1,lat,longi,DA):
         deg_rad = np.pi/180
@@ -166,6 +170,9 @@ class GroundTrackCalc(object):
         return latP,alpha,V,azimuth
 
     def PlotGroundTrack(self):
+        '''Plotting Modules are imported here so the Ground Track Calculation does not need them'''
+        import matplotlib.pyplot as plt
+        import cartopy.crs as ccrs
         fig, ax = plt.subplots()
         ax = plt.axes(projection=ccrs.PlateCarree())
         ax.stock_img()
@@ -0,0 +1,156 @@
+'''Python Script for the Satellite Groundtrack of a J2 perturbed Orbit, without poliastro'''
+#Import Numpy Module for Data Processing
+import numpy as np
+import datetime as dt
+
+'''Earth Constants, as used by poliastro'''
+MU_E = 3.986004418e14
+R_EQ = 6378136.6
+J2 = 1.08262668e-3
+
+'''UTC Date of the J2000 Epoch (2000-01-01 12:00:00 TT), the default Epoch of poliastro Orbits'''
+J2000 = dt.datetime(2000, 1, 1, 11, 58, 55, 816000)
+
+
+'''Function gmst'''
+'''Greenwich Mean Sidereal Time [rad] (IAU 1982) of Times t [s] after the Epoch, UT1 is taken equal to UTC'''
+
+def gmst(epoch: dt.datetime, t: np.ndarray):
+    days = (epoch - J2000).total_seconds()/86400 - 0.0007428703703704 + np.asarray(t)/86400
+    T = days/36525
+    theta = 280.46061837 + 360.98564736629*days + 0.000387933*T**2 - T**3/38710000
+    return np.radians(theta % 360)
+
+
+'''Function propagate_j2'''
+'''Propagates Classical Orbital Elements with the secular J2 Drift of RAAN, Argument of Perigee and Mean Anomaly'''
+'''
+* INPUT 1: Orbit Vector [a [m], ecc, inc [deg], raan [deg], argp [deg], nu [deg]], nu is the True Anomaly at t = 0
+* INPUT 2: Array of N Times [s] after the Epoch
+
+* PARAM 1: j2, set False for the unperturbed Two-Body Orbit
+
+* OUTPUT 1: (N,3) NP Array of ECI Positions [m], the Equator and Equinox of the Epoch are used throughout
+'''
+
+def propagate_j2(orbvec: np.ndarray, t: np.ndarray, j2: bool = True):
+    a, ecc = float(orbvec[0]), float(orbvec[1])
+    inc, raan, argp, nu0 = np.radians(np.asarray(orbvec[2:6], dtype=float))
+    t = np.asarray(t, dtype=float)
+
+    '''Secular Rates'''
+    n = np.sqrt(MU_E/a**3)
+    draan = dargp = dM = 0.0
+    if j2:
+        k = J2*(R_EQ/(a*(1 - ecc**2)))**2*n
+        draan = -1.5*k*np.cos(inc)
+        dargp = 0.75*k*(5*np.cos(inc)**2 - 1)
+        dM = 0.75*k*np.sqrt(1 - ecc**2)*(3*np.cos(inc)**2 - 1)
+
+    '''Mean Anomaly from the initial True Anomaly'''
+    E0 = 2*np.arctan2(np.sqrt(1 - ecc)*np.sin(nu0/2), np.sqrt(1 + ecc)*np.cos(nu0/2))
+    M = E0 - ecc*np.sin(E0) + (n + dM)*t
+
+    '''Kepler's Equation by Newton Iteration, converged to round-off for LEO Eccentricities'''
+    E = M.copy()
+    for _ in range(10):
+        E = E - (E - ecc*np.sin(E) - M)/(1 - ecc*np.cos(E))
+
+    r = a*(1 - ecc*np.cos(E))
+    nu = 2*np.arctan2(np.sqrt(1 + ecc)*np.sin(E/2), np.sqrt(1 - ecc)*np.cos(E/2))
+    u = argp + dargp*t + nu
+    raan = raan + draan*t
+
+    pos = np.empty((len(t), 3))
+    pos[:, 0] = r*(np.cos(raan)*np.cos(u) - np.sin(raan)*np.sin(u)*np.cos(inc))
+    pos[:, 1] = r*(np.sin(raan)*np.cos(u) + np.cos(raan)*np.sin(u)*np.cos(inc))
+    pos[:, 2] = r*np.sin(u)*np.sin(inc)
+    return pos
+
+
+'''Function eci_to_ecef'''
+'''Rotates (N,3) ECI Positions at Times t [s] after the Epoch about the z-Axis by the GMST'''
+
+def eci_to_ecef(pos: np.ndarray, epoch: dt.datetime, t: np.ndarray):
+    theta = gmst(epoch, t)
+    ecef = np.empty(pos.shape)
+    ecef[:, 0] = np.cos(theta)*pos[:, 0] + np.sin(theta)*pos[:, 1]
+    ecef[:, 1] = -np.sin(theta)*pos[:, 0] + np.cos(theta)*pos[:, 1]
+    ecef[:, 2] = pos[:, 2]
+    return ecef
+
+
+'''Class OrbitGroundTrackJ2'''
+'''Ground Track of OrbitGroundTrack of GroundTrack2 from the analytic J2 Propagator, with the same Inputs and Columns'''
+'''
+* INPUT 1: Number of Samples
+* INPUT 2: Orbit Vector [a [m], ecc, inc [deg], raan [deg], argp [deg], nu [deg]]
+* INPUT 3: Epoch of the Orbit Vector (UTC datetime), defaults to J2000 as in GroundTrack2
+* INPUT 4: Number of Orbital Periods sampled
+
+* PARAM 1: plot, set True if orbit ground track plot is required
+* PARAM 2: coordinate, 'spherical' or 'cartesian' Columns of the DataFrame
+* PARAM 3: j2, set False for the unperturbed Two-Body Orbit
+
+* OUTPUT 1: DataFrame with the Columns ['Time [s]','Lat [deg]','Lon [deg]','Height [km]'] (spherical) or
+['Time [s]','X [m]','Y [m]','Z [m]'] (cartesian), Positions are Earth fixed
+Latitudes are geocentric and Heights are above a Sphere of 6378.1 km, as in GroundTrack2
+
+Without Precession, Nutation and Polar Motion the Earth fixed Frame differs from ITRS by about 0.014 deg per Year from
+J2000 (Precession), plus up to 0.005 deg of Nutation
+'''
+
+class OrbitGroundTrackJ2(object):
+
+    def __init__(self, dt: int = 1000, orbvec: np.array = np.array([6621000.1, 0.0, 94.3, 180, 0, 0]),
+                 epoch: dt.datetime = J2000, periods: float = 1, plot = False, coordinate = 'spherical',
+                 j2: bool = True):
+
+        re = 6.3781e3
+        self.__coordinate = coordinate
+
+        period = 2*np.pi*np.sqrt(orbvec[0]**3/MU_E)
+        self.__t = np.linspace(0, periods*period, dt)
+        self.__ecef = eci_to_ecef(propagate_j2(orbvec, self.__t, j2), epoch, self.__t)
+
+        self.__vals = np.zeros([dt, 4])
+        self.__vals[:, 0] = self.__t
+        if coordinate == 'spherical':
+            r = np.linalg.norm(self.__ecef, axis=1)
+            self.__vals[:, 1] = np.degrees(np.arcsin(self.__ecef[:, 2]/r))
+            self.__vals[:, 2] = np.degrees(np.arctan2(self.__ecef[:, 1], self.__ecef[:, 0]))
+            self.__vals[:, 3] = r/1000 - re
+        if coordinate == 'cartesian':
+            self.__vals[:, 1:4] = self.__ecef
+
+        if plot == True:
+            self.GroundPlot()
+
+    def return_vals(self):
+        return self.__vals
+
+    def return_df(self):
+        import pandas as pd
+        if self.__coordinate == 'cartesian':
+            return pd.DataFrame(self.__vals, columns=['Time [s]','X [m]','Y [m]','Z [m]'])
+        return pd.DataFrame(self.__vals, columns=['Time [s]','Lat [deg]','Lon [deg]','Height [km]'])
+
+    def GroundPlot(self):
+        '''Plotting Modules are imported here so the Ground Track Calculation does not need them'''
+        import matplotlib.pyplot as plt
+        import cartopy.crs as ccrs
+        r = np.linalg.norm(self.__ecef, axis=1)
+        fig, ax = plt.subplots()
+        ax = plt.axes(projection=ccrs.PlateCarree())
+        ax.stock_img()
+        ax.plot(np.degrees(np.arctan2(self.__ecef[:, 1], self.__ecef[:, 0])),
+                np.degrees(np.arcsin(self.__ecef[:, 2]/r)), 'b', transform=ccrs.Geodetic(), label='J2')
+        ax.legend(loc='upper right', shadow=True, fontsize='x-large')
+        ax.plot()
+
+
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    a = OrbitGroundTrackJ2(dt=100000, periods=100)
+    print(a.return_df().tail(), time.perf_counter() - start)
@@ -0,0 +1,60 @@
+"""
+Checks the analytic propagator of GroundTrackJ2.py: the Earth fixed frame
+against the astropy GCRS to ITRS transform, the J2 drift against its rate and
+the two-body ground track against OrbitGroundTrack of GroundTrack2.
+
+Tolerances near the J2000 epoch: 0.01 deg in position angle, 0.05 deg in
+latitude/longitude and 1 km in height against poliastro.
+"""
+
+import numpy as np
+import pytest
+
+from src.orbit.SatGroundTrack.GroundTrackJ2 import OrbitGroundTrackJ2, propagate_j2, eci_to_ecef, J2000, MU_E
+
+
+def test_ecef_against_astropy():
+    from astropy import units as u, coordinates as coord
+    from astropy.time import Time
+
+    t = np.linspace(0, 86400, 50)
+    eci = propagate_j2([6621000.1, 0.001, 94.3, 180, 30, 10], t)
+    ecef = eci_to_ecef(eci, J2000, t)
+    obstime = Time(J2000, scale='utc') + t*u.s
+    itrs = coord.GCRS(coord.CartesianRepresentation(eci.T*u.m), obstime=obstime).transform_to(coord.ITRS(obstime=obstime))
+    itrs = itrs.cartesian.xyz.to(u.m).value.T
+    cos = np.sum(itrs*ecef, axis=1)/np.linalg.norm(itrs, axis=1)/np.linalg.norm(ecef, axis=1)
+    assert np.degrees(np.arccos(np.clip(cos, -1, 1))).max() < 0.01
+
+
+def test_j2_drift():
+    '''A two-body circular orbit closes after one period, with J2 the node of a sun-synchronous orbit moves ~0.9856 deg
+    per day'''
+    a = 6378136.6 + 700e3
+    period = 2*np.pi*np.sqrt(a**3/MU_E)
+    pos = propagate_j2([a, 0.0, 98.19, 0, 0, 0], [0, period], j2=False)
+    assert np.allclose(pos[0], pos[1], atol=1e-3)
+
+    '''The orbit normal is the cross product of two points of the orbit at the same time, the node lies along z x h'''
+    h = np.cross(propagate_j2([a, 0.0, 98.19, 0, 0, 0], [86400])[0], propagate_j2([a, 0.0, 98.19, 0, 0, 90], [86400])[0])
+    assert abs(np.degrees(np.arctan2(h[0], -h[1])) - 0.9856) < 0.002
+
+
+def test_against_poliastro():
+    pytest.importorskip('poliastro')
+    pytest.importorskip('cartopy')
+    from src.orbit import OrbitGroundTrack
+
+    orbvec = np.array([6621000.1, 0.0, 94.3, 180, 0, 0])
+    ref = OrbitGroundTrack(dt=200, orbvec=orbvec).return_df().values
+    t = ref[:, 0]
+    ecef = eci_to_ecef(propagate_j2(orbvec, t, j2=False), J2000, t)
+    r = np.linalg.norm(ecef, axis=1)
+    lat = np.degrees(np.arcsin(ecef[:, 2]/r))
+    lon = np.degrees(np.arctan2(ecef[:, 1], ecef[:, 0]))
+    assert np.abs(lat - ref[:, 1]).max() < 0.05
+    assert np.abs((lon - ref[:, 2] + 180) % 360 - 180).max() < 0.05
+    assert np.abs(r/1000 - 6378.1 - ref[:, 3]).max() < 1.0
+
+    '''The class samples one period as GroundTrack2'''
+    assert OrbitGroundTrackJ2(dt=200, orbvec=orbvec, j2=False).return_vals().shape == ref.shape
@@ -0,0 +1,82 @@
+"""
+Checks the array ground track of GroundTrackCalc against the original
+point-by-point loop, and the chunked track of iter_chunks against it.
+"""
+
+import numpy as np
+from astropy import units as u
+
+from src.orbit.SatGroundTrack.GroundTrack import GroundTrackCalc
+
+
+class LoopGroundTrack(GroundTrackCalc):
+    '''The scalar Helper Functions and the Loop over the Times of the original GroundTrackCalc'''
+
+    def hemisphere_function(self, angle):
+        if angle >= 0 and angle <= np.pi:
+            return 1
+        elif angle > np.pi and angle <= 2*np.pi:
+            return -1
+        raise ValueError
+
+    def acos2(self, cosine, H):
+        if H not in (1, -1):
+            raise ValueError
+        if cosine > 1:
+            return 0
+        elif cosine < -1:
+            return np.pi
+        elif H == 1:
+            return np.arccos(cosine)
+        return 2*np.pi - np.arccos(cosine)
+
+    def zero_2pi(self, angle0):
+        angle = np.arctan2(np.sin(angle0), np.cos(angle0))
+        if angle < 0:
+            angle = 2*np.pi + angle
+        return angle
+
+    def loop(self, w1, w2, rho1, phi10, phi20, a_sat, t):
+        vals = np.zeros((len(t), 6))
+        for idx, i in enumerate(t):
+            latP, alpha, V, azimuth = self.ground_track(w1, w2, rho1, 90, phi10, phi20, i)
+            if alpha > 180:
+                alpha = alpha - 360
+            vals[idx] = [i, latP, alpha, V*a_sat, V, azimuth]
+        return vals
+
+
+def loop_track(dt, inc, h, lat0, longi0, n):
+    '''Ground Track of the original Loop, with the Orbit Parameters of GroundTrackCalc'''
+    mu_E = 5.972e24*6.67430e-11
+    T_sat = 2*np.pi*np.sqrt((6371000 + h*1000)**3/mu_E)
+    w1, w2 = -2*np.pi/86164.1004, 2*np.pi/T_sat
+    calc = LoopGroundTrack.__new__(LoopGroundTrack)
+    phi10, phi20 = calc.initial_values(inc, 360 + lat0 if longi0 < 0 else lat0, longi0, -1)
+    n = 86164.1004/T_sat if n == 0 else n
+    return calc.loop(w1, w2, inc, phi10, phi20, (mu_E/w2**2)**(1/3), np.linspace(0, n*T_sat, int(n*dt)))
+
+
+def test_loop_parity():
+    for dt, inc, h, lat0, longi0, n in [(1000, 94.3, 200, 12.77, -91.397, 1), (400, 51.6, 350, -30.0, 120.0, 0),
+                                        (300, 97.0, 250, 0.0, 0.0, 2)]:
+        data = GroundTrackCalc(dt=dt, inc=inc*u.deg, h=h*u.km, lat0=lat0*u.deg, longi0=longi0*u.deg,
+                               n=n).return_data()
+        assert np.array_equal(data.values, loop_track(dt, inc, h, lat0, longi0, n))
+
+
+def test_iter_chunks():
+    calc = GroundTrackCalc(dt=400, n=0)
+    data = calc.return_data().values
+
+    '''Chunks on the Time Grid of return_data, the last Chunk is shorter'''
+    chunks = list(calc.iter_chunks(0, calc.t[-1], chunk=97, step=calc.t[1]))
+    assert [len(c) for c in chunks[:-1]] == [97]*(len(chunks) - 1) and 0 < len(chunks[-1]) <= 97
+    assert np.array_equal(np.concatenate(chunks), data)
+
+    '''The default Step is one Orbit Period / dt, the Chunks continue the Track past one Day'''
+    step = 2*np.pi*np.sqrt((6371000 + 200e3)**3/(5.972e24*6.67430e-11))/400
+    track = np.concatenate(list(calc.iter_chunks(0, 3*86164.1004, chunk=1000)))
+    assert len(track) == int(3*86164.1004/step*(1 + 1e-12)) + 1
+    assert np.allclose(np.diff(track[:, 0]), step)
+    assert np.array_equal(track, calc.track_block(track[:, 0]))
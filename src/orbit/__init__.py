@@ -1 +1,8 @@
-from src.orbit.SatGroundTrack.GroundTrack2 import OrbitGroundTrack
+'''OrbitGroundTrack needs poliastro and cartopy, it is imported on first use so the rest of src.orbit works without them'''
+
+
+def __getattr__(name):
+    if name == 'OrbitGroundTrack':
+        from src.orbit.SatGroundTrack.GroundTrack2 import OrbitGroundTrack
+        return OrbitGroundTrack
+    raise AttributeError("module 'src.orbit' has no attribute " + repr(name))
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 #Assumptions: Circular Orbit (i.e. e=0)
 
@@ -42,34 +41,76 @@ def etoorb(e:float):
     mu = g*M
     return -mu/(2*e)-re
 
-#State start and end orbital altitude for orbit altitude increase manouvre
-#Calculate chnage in energy between both orbits
-h_start = 195000
-h_end = 250000
-t = np.linspace(0.0001,0.001,100)
+#Returns orbital velocity in m/s of a circular orbit
+#Input is orbital altitude in meters (h)
+def vorb(h):
+    re = 6371000
+    g = 6.67430e-11
+    M = 5.972e24
+    mu = g*M
+    return np.sqrt(mu/(h+re))
+
+#Returns the time in seconds to raise a circular orbit from h_start to h_end for every thrust value
+#Inputs are an array of thrust values in Newtons, start and end orbital altitude in meters and the satellite mass in kg
+#Closed form of the energy integration below: with tangential thrust the specific energy changes by
+#(thrust/m)*orbd(h) per orbit of torb(h), so dE/dt = (thrust/m)*v and the time is the velocity change over thrust/m
+#Thrust values of zero or below never raise the orbit and return inf, h_end below h_start raises a ValueError
+#The cost does not depend on the thrust values, 10000 of them take about 50 us
+def raise_time(thrust, h_start:float = 195000, h_end:float = 250000, m:float = 1.0):
+    checkraise(h_start, h_end)
+    thrust = np.asarray(thrust, dtype=float)
+    time = np.full(thrust.shape, np.inf)
+    np.divide((vorb(h_start)-vorb(h_end))*m, thrust, out=time, where=thrust > 0)
+    return time[()]
+
+#Returns the time in seconds to raise a circular orbit from h_start to h_end for every thrust value
+#Same inputs and outputs as raise_time, integrates the energy one orbit at a time for all thrust values at once
+#Lanes that reached the required energy change are masked out, the slowest lane sets the number of steps
+#The cost grows with the total number of orbits of all lanes: 10000 thrust values from 0.1 to 1 uN with m = 1 kg
+#(up to 57000 orbits each) take about 9 s, use raise_time for large sweeps
+def raise_time_orbits(thrust, h_start:float = 195000, h_end:float = 250000, m:float = 1.0):
+    checkraise(h_start, h_end)
+    thrust = np.asarray(thrust, dtype=float).ravel()
+    deltae = orbtoe(h_end)-orbtoe(h_start)
+    time = np.where(thrust > 0, 0.0, np.inf)
+    h = np.full(thrust.shape, float(h_start))
+    e = np.zeros(thrust.shape)
+    lanes = np.flatnonzero((thrust > 0) & (deltae > e))
+    while len(lanes):
+        de = (thrust[lanes]/m)*orbd(h[lanes])
+        time[lanes] += torb(h[lanes])
+        e[lanes] += de
+        h[lanes] = etoorb(de+orbtoe(h[lanes]))
+        lanes = lanes[deltae > e[lanes]]
+    return time
+
+#Raises a ValueError if h_end is below h_start, thrust only raises the orbit
+def checkraise(h_start:float, h_end:float):
+    if h_end < h_start:
+        raise ValueError('h_end (%g m) is below h_start (%g m), only orbit raising is modelled' % (h_end, h_start))
+
+if __name__ == "__main__":
+    import time as timer
+    import matplotlib.pyplot as plt
 
-deltae = orbtoe(h_end)-orbtoe(h_start)
-timelst = []
+    #State start and end orbital altitude for orbit altitude increase manouvre
+    h_start = 195000
+    h_end = 250000
+    t = np.linspace(0.0001,0.001,100)
 
-#Performing numerical integration untile the requiere change in energy is obtained
-for idx,x in enumerate(t):
-    h = 200000.0
-    e = 0.0
-    time = 0.0
-    while deltae > e:
-        #print(h,time,e)
-        de = (x/1000)*orbd(h)
-        time += torb(h)
-        e += de
-        h = etoorb(de+orbtoe(h))
-    timelst.append(time/(60*60*24*365))
-    a = idx/len(t)
-    print('Progress:',a)
+    #Time for every thrust level, the closed form against the orbit by orbit integration
+    start = timer.perf_counter()
+    timelst = raise_time(t/1000, h_start, h_end)/(60*60*24*365)
+    print('Closed form [s]:', timer.perf_counter()-start)
+    start = timer.perf_counter()
+    orbits = raise_time_orbits(t/1000, h_start, h_end)/(60*60*24*365)
+    print('Orbit by orbit [s]:', timer.perf_counter()-start, 'Largest relative difference:',
+          np.max(np.abs(orbits/timelst-1)))
 
-#Plotting results for time vs thrust
-plt.plot(t,timelst)
-plt.ylabel('Years')
-plt.xlabel('MilliNewtons (mN)')
-plt.title('Time (years) vs Thrust')
-plt.grid(True)
-plt.show()
\ No newline at end of file
+    #Plotting results for time vs thrust
+    plt.plot(t,timelst)
+    plt.ylabel('Years')
+    plt.xlabel('MilliNewtons (mN)')
+    plt.title('Time (years) vs Thrust')
+    plt.grid(True)
+    plt.show()
@@ -0,0 +1,53 @@
+"""
+Checks the vectorised orbit raising times against the scalar energy loop
+they replaced and against each other.
+"""
+
+import numpy as np
+import pytest
+
+from src.orbit.altchangecalc import raise_time, raise_time_orbits, torb, orbd, orbtoe, etoorb
+
+THRUST = np.linspace(0.0002, 0.001, 5)/1000
+
+
+def scalar_loop(x, h_start, h_end, m=1.0):
+    '''The orbit by orbit Loop of the original Script for one Thrust Value'''
+    deltae = orbtoe(h_end)-orbtoe(h_start)
+    h = float(h_start)
+    e = 0.0
+    time = 0.0
+    while deltae > e:
+        de = (x/m)*orbd(h)
+        time += torb(h)
+        e += de
+        h = etoorb(de+orbtoe(h))
+    return time
+
+
+def test_orbits_parity():
+    times = raise_time_orbits(THRUST, 195000, 250000, m=2.0)
+    assert [float(i) for i in times] == [scalar_loop(x, 195000, 250000, m=2.0) for x in THRUST]
+
+
+def test_closed_form():
+    closed = raise_time(THRUST, 195000, 250000)
+    assert closed.shape == THRUST.shape
+    assert np.max(np.abs(raise_time_orbits(THRUST, 195000, 250000)/closed - 1)) < 2e-4
+    assert np.isscalar(raise_time(1e-6)) and raise_time(1e-6) == closed[0]*THRUST[0]/1e-6
+
+
+def test_zero_thrust():
+    '''Lanes without Thrust never finish, they are inf without holding up the others'''
+    thrust = np.array([0.0, 1e-6, -1e-6])
+    with np.errstate(all='raise'):
+        closed = raise_time(thrust)
+    orbits = raise_time_orbits(thrust)
+    assert np.isinf(closed[[0, 2]]).all() and np.isinf(orbits[[0, 2]]).all()
+    assert orbits[1] == raise_time_orbits([1e-6])[0] and np.isfinite(closed[1])
+
+    assert raise_time(1e-6, 200000, 200000) == 0 and raise_time_orbits([1e-6], 200000, 200000)[0] == 0
+    with pytest.raises(ValueError):
+        raise_time(1e-6, 250000, 195000)
+    with pytest.raises(ValueError):
+        raise_time_orbits([1e-6], 250000, 195000)
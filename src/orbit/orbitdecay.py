@@ -1,46 +1,191 @@
+'''Importing Required Modules from Folder'''
+from src.atmos.nrlmsise00.AtmosCalcFloat import nrl00_raw, doy_sec
+from src.atmos.nrlmsise00.IndexFindr.IndexReturn import Indexer
+from src.atmos.nrlmsise00.IndexFindr.IndexStore import open_store, DAY, AP_DAILY
+
+'''Importing Required Modules'''
+import warnings
 import numpy as np
-from src.atmos.nrlmsise00 import nlrmsise00_dens
+import datetime as dt
+from astropy import units as u
+from scipy.integrate import solve_ivp
+
+'''Constants, as in altchangecalc and GroundTrack'''
+R_E = 6371000
+MU_E = 5.972e24*6.67430e-11
+W_E = 2*np.pi/86164.1004
+
+
+'''Function orbit_density'''
+'''Orbit averaged Total Mass Density of a Circular Orbit'''
+'''
+* INPUT 1: Semi-Major Axis [m]
+* INPUT 2: Inclination [deg]
+* INPUT 3: Date of the Orbit (datetime class)
+* INPUT 4: NP Array Containing Solar Flux and AP Inidices
+[F107,F107A,AP_DAILY,AP1,AP2,AP3,AP4,APAVG1,APAVG2]
+* INPUT 5: Longitude of the Ascending Node [deg] at the Date
+
+* PARAM 1: samples, Number of equally spaced Points along the Orbit, the Midpoint Rule converges quickly for the
+periodic Density along an Orbit
+* PARAM 2: backend, see nrl00
+
+* OUTPUT 1: Average Total Mass Density [kg/m^3] of the Points, evaluated at the Date
+'''
+
+def orbit_density(a: float, inc: float, date: dt.datetime, indices: list, lon_node: float = 0.0, samples: int = 36,
+                  backend = 'python'):
+    doy, sec = doy_sec(date)
+    arg = 2*np.pi*(np.arange(samples) + 0.5)/samples
+    inc = np.radians(inc)
+    lat = np.degrees(np.arcsin(np.sin(inc)*np.sin(arg)))
+    lon = (lon_node + np.degrees(np.arctan2(np.cos(inc)*np.sin(arg), np.cos(arg))) + 180) % 360 - 180
+    d, t = nrl00_raw(doy, sec, (a - R_E)/1000*np.ones(samples), lat, lon, indices, backend=backend)
+    return float(np.mean(d[:, 5]))
 
-x = nlrmsise00_dens(200)
 
+'''Function index_end'''
+'''End of the last Day with Solar Flux and AP Indices in the Index Store (datetime class)'''
+
+def index_end():
+    data = open_store().return_data()
+    last = np.flatnonzero(~np.isnan(data[AP_DAILY]))[-1]
+    return dt.datetime(1970, 1, 1) + dt.timedelta(days=int(data[DAY, last]) + 1)
+
+
+'''Class Decay'''
+'''Propagates the Decay of a Circular Orbit under Drag until Re-entry'''
+'''
+* INPUT 1: Initial Orbital Altitude
+* INPUT 2: Date at the Start of the Decay (datetime class)
+* INPUT 3: Inclination of Orbit
+* INPUT 4: Satellite Mass
+* INPUT 5: Drag Reference Area
+* INPUT 6: Drag Coefficient
+
+* PARAM 1: reentry, Altitude at which the Propagation stops, the Satellite is considered re-entered
+* PARAM 2: thresholds, List of Altitudes at which the Crossing Time is recorded, see return_events
+* PARAM 3: t_max, Longest Time propagated
+* PARAM 4: indices, Solar Flux and AP Indices used for the whole Decay; if None they are taken from Indexer at the
+Date of every Evaluation, the Propagation then stops at the End of the Index Store (see index_end) with the Status
+'indices' and a Warning
+* PARAM 5: lon_node, Longitude of the Ascending Node [deg] at the Start, it moves with the Earth Rotation
+* PARAM 6: samples, see orbit_density
+* PARAM 7: rtol, Relative Tolerance of the Step Control
+* PARAM 8: max_step, Longest Step [s]; Steps of days sample the Space Weather of Indexer only at the Stages of the
+Integrator, bound the Step (e.g. to 1 day) to resolve its Variation
+* PARAM 9: backend, see nrl00, the numba backend makes multi-year Runs about ten times faster
+
+The Semi-Major Axis a follows da/dt = -rho*(Cd*A/m)*sqrt(mu*a) with rho the orbit averaged Density, it is integrated
+by an adaptive Runge-Kutta Method (RK45 of scipy), so Steps grow to days when the Orbit decays slowly.
+
+* OUTPUT 1: Dataframe structure with the Time [s], Date, Altitude [km] and orbit averaged Density [kg/m^3] at every
+Step of the Integrator
+* OUTPUT 2: Status, why the Propagation stopped, see return_status
+'''
 
 class Decay(object):
+    def __init__(self, h: float = 200*u.km, date: dt.datetime = dt.datetime(2008, 6, 2), inc: float = 94.7*u.deg,
+                 m: float = 150*u.kg, A: float = 1*u.m**2, Cd: float = 2.4, reentry: float = 100*u.km,
+                 thresholds: list = (), t_max: float = 25*u.year, indices: list = None, lon_node: float = 0.0,
+                 samples: int = 36, rtol: float = 1e-6, max_step: float = np.inf, backend = 'python'):
+
+        self.__date = date
+        self.__inc = inc.to(u.deg).value
+        self.__ballistic = Cd*A.to(u.m**2).value/m.to(u.kg).value
+        self.__indices = indices
+        self.__lon_node = lon_node
+        self.__samples = samples
+        self.__backend = backend
+        self.__evals = 0
 
-    def __init__(self, alt: int=200000):
-        self.__data = None
-        self.__height = alt
+        self.__thresholds = [float(reentry.to(u.km).value)] + [float(i.to(u.km).value) for i in thresholds]
+        events = [self.event(i) for i in self.__thresholds]
+        events[0].terminal = True
 
+        '''Indices from the Index Store are only available up to its End, the Propagation stops there'''
+        t_end = t_max.to(u.s).value
+        if indices is None:
+            t_indices = (index_end() - date).total_seconds() - 1
+            if t_indices <= 0:
+                raise ValueError('No indices stored for ' + str(date))
+            t_end = min(t_end, t_indices)
+
+        a0 = R_E + h.to(u.m).value
+        '''The first Step is one Orbit, the Integrator grows it from there'''
+        self.__sol = solve_ivp(self.rate, (0, t_end), [a0], method='RK45', rtol=rtol,
+                               atol=1e-3, events=events, first_step=min(2*np.pi*np.sqrt(a0**3/MU_E), t_end),
+                               max_step=max_step)
+        if self.__sol.status == -1:
+            raise RuntimeError('Decay propagation failed: ' + self.__sol.message)
+
+        self.__events = {h_: (float(t[0]) if len(t) else None) for h_, t in zip(self.__thresholds, self.__sol.t_events)}
+
+        if self.__sol.status == 1:
+            self.__status = 'reentry'
+        elif t_end < t_max.to(u.s).value:
+            self.__status = 'indices'
+            warnings.warn('Decay stopped at the end of the stored indices, ' + str(index_end()) +
+                          ', before re-entry')
+        else:
+            self.__status = 't_max'
 
     def return_data(self):
-        return self.__data
-
-    def constgen(self):
-        m_earth = 5.972 * (10 ** 24)
-        G = 6.67 * (10 ** -11)
-        m_sat = 150
-        Cd = 2.4
-
-    # def orbitcalc(self):
-    #     while self.__height >= 0:
-    #         fD = 0.5 * dens *
-
-
-
-    # while orbit >= minimum:
-    #
-    #     fD = 0.5 * density * (velocity ** 2) * dragCoefficient * surfaceArea
-    #     distance = (instantTime / P) * 3.14 * radius * 2
-    #     workdone = fD * distance
-    #     totalEnergy = totalEnergy - workdone
-    #     radius = ((-0.5) * gvConstant * m1 * m2 / totalEnergy)
-    #     velocity = ((gvConstant * m1) / radius) ** 0.5
-    #     orbit = radius - earthRadius
-    #     t += instantTime
-    #     orbitList.append(orbit / 1000)
-    #     timeList.append(t / 31536000)
-    #     if orbit >= minimum:
-    #         density = calDensity(orbit)
-    #     else:
-    #         break
-    # years = float(t / 31536000)
-    # print("years taken: %s" % (years))
\ No newline at end of file
+        import pandas as pd
+        t = self.__sol.t
+        a = self.__sol.y[0]
+        dates = [self.__date + dt.timedelta(0, float(i)) for i in t]
+        density = [self.density(i, j) for i, j in zip(t, a)]
+        return pd.DataFrame({'time [s]': t, 'Date': dates, 'h [km]': (a - R_E)/1000, 'Density [kg/m^3]': density})
+
+    def return_lifetime(self):
+        '''Time [s] until the re-entry Altitude is reached, None if it is not reached within t_max'''
+        return self.__events[self.__thresholds[0]]
+
+    def return_events(self):
+        '''dict of Altitude [km]: Time [s] of its first Crossing, None if it is not crossed'''
+        return self.__events
+
+    def return_status(self):
+        '''Why the Propagation stopped: 'reentry', 't_max' or 'indices' (End of the Index Store reached first)'''
+        return self.__status
+
+    def return_evals(self):
+        '''Number of Density Evaluations of the Propagation'''
+        return self.__evals
+
+    def indices(self, date: dt.datetime):
+        if self.__indices is not None:
+            return self.__indices
+        return Indexer(date).return_indices()[1:]
+
+    def density(self, t: float, a: float):
+        '''Orbit averaged Density [kg/m^3] t seconds after the Start'''
+        date = self.__date + dt.timedelta(0, float(t))
+        lon_node = self.__lon_node - np.degrees(W_E*t)
+        return orbit_density(a, self.__inc, date, self.indices(date), lon_node, self.__samples, self.__backend)
+
+    def rate(self, t: float, y: np.ndarray):
+        '''Function rate'''
+        '''Change of the Semi-Major Axis [m/s] due to Drag'''
+        self.__evals += 1
+        '''Trial States of the Integrator can overshoot below the Surface during the final fast Decay'''
+        a = max(y[0], R_E)
+        return [-self.density(t, a)*self.__ballistic*np.sqrt(MU_E*a)]
+
+    @staticmethod
+    def event(h: float):
+        '''Event Function of the Crossing of Altitude h [km] while decaying'''
+        def crossing(t, y):
+            return y[0] - R_E - h*1000
+        crossing.direction = -1
+        return crossing
+
+
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    decay = Decay(h=250*u.km, thresholds=[200*u.km, 150*u.km])
+    print('Lifetime [days]:', decay.return_lifetime()/86400, 'Crossings [days]:',
+          {h: (t/86400 if t is not None else None) for h, t in decay.return_events().items()},
+          'Status:', decay.return_status(), 'Density evaluations:', decay.return_evals(), 'Runtime [s]:', time.perf_counter() - start)
@@ -0,0 +1,62 @@
+"""
+Checks the decay propagator against the closed form decay under constant
+density, the order of its threshold events and the ways it can stop.
+"""
+
+import datetime as dt
+import numpy as np
+import pytest
+from astropy import units as u
+
+import src.orbit.orbitdecay as orbitdecay
+from src.orbit.orbitdecay import Decay, index_end, R_E, MU_E
+
+RHO = 1e-11
+INDICES = [150, 150, 15, 15, 15, 15, 15, 15, 15]
+
+
+def test_constant_density(monkeypatch):
+    '''Under constant Density sqrt(a) falls linearly: sqrt(a) = sqrt(a0) - rho*(Cd*A/m)*sqrt(mu)*t/2'''
+    monkeypatch.setattr(orbitdecay, 'orbit_density', lambda *args: RHO)
+    decay = Decay(h=300*u.km, indices=INDICES, thresholds=[250*u.km, 200*u.km, 150*u.km], rtol=1e-10)
+    rate = RHO*2.4*1/150*np.sqrt(MU_E)/2
+
+    data = decay.return_data()
+    a = R_E + data['h [km]'].values*1000
+    assert np.allclose(np.sqrt(a), np.sqrt(R_E + 300e3) - rate*data['time [s]'].values, rtol=1e-8, atol=0)
+
+    events = decay.return_events()
+    assert all(type(h) is float for h in events)
+    for h, t in events.items():
+        assert t == pytest.approx((np.sqrt(R_E + 300e3) - np.sqrt(R_E + h*1000))/rate, rel=1e-6)
+    assert decay.return_lifetime() == events[100.0] and decay.return_status() == 'reentry'
+
+
+def test_event_order():
+    '''The full Model with fixed Indices crosses the Thresholds from the top down before re-entry'''
+    decay = Decay(h=160*u.km, indices=INDICES, thresholds=[150*u.km, 130*u.km, 120*u.km])
+    events = decay.return_events()
+    times = [events[h] for h in (150.0, 130.0, 120.0, 100.0)]
+    assert all(t is not None for t in times) and times == sorted(times)
+    assert decay.return_lifetime() == times[-1] and decay.return_status() == 'reentry'
+    assert decay.return_data()['h [km]'].iloc[-1] == pytest.approx(100.0, abs=1e-6)
+
+
+def test_t_max():
+    '''An Orbit that does not decay within t_max has no Lifetime and no Crossings'''
+    decay = Decay(h=400*u.km, indices=INDICES, thresholds=[390*u.km], t_max=3*u.day)
+    assert decay.return_lifetime() is None and decay.return_events() == {100.0: None, 390.0: None}
+    assert decay.return_status() == 't_max'
+    assert decay.return_data()['time [s]'].iloc[-1] == pytest.approx(3*86400)
+
+
+def test_index_end():
+    '''Indices from the Index Store end in 2018, the Propagation stops there with a Status instead of failing'''
+    date = index_end() - dt.timedelta(days=2)
+    with pytest.warns(UserWarning, match='end of the stored indices'):
+        decay = Decay(h=400*u.km, date=date)
+    assert decay.return_status() == 'indices' and decay.return_lifetime() is None
+    assert decay.return_data()['Date'].iloc[-1] < index_end()
+
+    with pytest.raises(ValueError):
+        Decay(h=400*u.km, date=index_end())